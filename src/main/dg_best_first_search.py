@@ -0,0 +1,182 @@
+"""
+This module serves the node-selection policies of the solution tree other than depth-first search.
+
+The depth-first search of Solver.iteraciok keeps only the branch from the root (Megoldasfa.ag).
+Here the open nodes are kept in a priority queue ordered by their lower bounds (see Finomitasok.korlatozas),
+each described by its fixed edges and its free edges (see Diszjunktiv_graf_manipulacioi.rogzitett_elek_leirasa),
+as the subtrees of the parallel search are (see dg_parallel_search). The node with the lowest bound
+is set up again on the beginning order and all its children are created, bounded and evaluated
+one after the other (see csucs_kifejtese). The search stops when the lowest bound reaches the incumbent.
+
+In the hybrid mode the number of the open nodes is limited: the children not fitting in the queue
+are searched depth-first at once (see melysegi_bejaras).
+"""
+from heapq import heappop, heappush
+from typing import List, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_parallel_search import kezdeti_sorrend_mentese, kezdeti_sorrend_visszaallitasa
+from vezerles import Vezerles
+
+CSUCSVALASZTASOK: Tuple[str, ...] = ("melysegi", "legjobb", "vegyes")
+"""
+The node-selection policies: depth-first (the origin one), best-bound-first and their hybrid.
+"""
+
+class Nyitott_csucs:
+    """
+    This class represents an open node of the solution tree: a node evaluated already,
+    whose children have not been created yet.
+    """
+    def __init__(self, also: float, melyseg: int, elek: List[Tuple[int, int, bool]],
+                 szabad_elek: List[Tuple[int, int, float]]) -> None:
+        self.also: float = also                         # the lower bound of the node (see Finomitasok.kisk)
+        self.melyseg: int = melyseg                     # the level of the node (the root is on 1)
+        self.elek: List[Tuple[int, int, bool]] = elek   # the fixed edges (see rogzitett_elek_leirasa)
+        self.szabad_elek: List[Tuple[int, int, float]] = szabad_elek    # (kezdet, veg, delta) of its free edges
+    def __repr__(self) -> str:
+        return f"{self.melyseg}. szintű nyitott csúcs ({self.also:.2f})"
+
+class Legjobb_elso_kereses:
+    """
+    This class represents the best-first (and hybrid) search of the solution tree of a solver.
+    nyitott_csucsok_hatara limits the number of the open nodes (0: unlimited, pure best-first search).
+    """
+    def __init__(self, solver: Solver, nyitott_csucsok_hatara: int = 0) -> None:
+        assert solver.dg_o
+        self.solver: Solver = solver
+        self.dg_o: Vezerles = solver.dg_o
+        self.nyitott_csucsok_hatara: int = nyitott_csucsok_hatara
+        self.nyitott: List[Tuple[float, int, int, Nyitott_csucs]] = []  # kupac: (alsó, -mélység, sorszám, csúcs)
+        self.sorszam: int = 0
+        self.kifejtesek_szama: int = 0
+        self.legtobb_nyitott_csucs: int = 0
+        self.melysegi_reszfak_szama: int = 0
+        self.maximalis_melysegszint: int = self.dg_o.maximalis_melysegszint
+        self.kezdeti_sorrend: List[Tuple[Muveletcsucs | None, Muveletcsucs | None]] = []
+    def nyitott_csucs_aktualisbol(self, melyseg: int) -> Nyitott_csucs:
+        """
+        It describes the recent node of the solver as an open node (melyseg is the level of ag[0]).
+        """
+        return Nyitott_csucs(self.dg_o.kisk, melyseg + len(self.dg_o.ag) - 1, self.dg_o.rogzitett_elek_leirasa(),
+                             self.dg_o.aktualis_szabad_elek().leirasa(self.dg_o.muvelet))
+    def berakas(self, csucs: Nyitott_csucs) -> None:
+        self.sorszam += 1
+        heappush(self.nyitott, (csucs.also, -csucs.melyseg, self.sorszam, csucs))
+        self.legtobb_nyitott_csucs = max(self.legtobb_nyitott_csucs, len(self.nyitott))
+    def van_hely(self) -> bool:
+        return self.nyitott_csucsok_hatara == 0 or len(self.nyitott) < self.nyitott_csucsok_hatara
+    def csucs_beallitasa(self, csucs: Nyitott_csucs) -> None:
+        """
+        It sets up the node as the root of the solution tree of the solver (the incumbent is kept),
+        with the depth limit of its level.
+        """
+        dg_o: Vezerles = self.dg_o
+        kezdeti_sorrend_visszaallitasa(dg_o, self.kezdeti_sorrend)
+        aktualis_opt_atfutasi_ido: float = dg_o.aktualis_opt_atfutasi_ido
+        dg_o.gyokeret_megoldasfaba()
+        dg_o.megoldasok_szama -= 1                  # a csúcsot már számoltuk
+        dg_o.aktualis_opt_atfutasi_ido = aktualis_opt_atfutasi_ido
+        dg_o.rogzitett_elek_visszajatszasa(csucs.elek)
+        dg_o.szabad_elek_beallitasa(dg_o.aktualis_megoldascsucs(), csucs.szabad_elek)
+        dg_o.maximalis_melysegszint = (0 if self.maximalis_melysegszint == 0
+                                       else max(1, self.maximalis_melysegszint - csucs.melyseg + 1))
+    def csucs_elhagyasa(self, csucs: Nyitott_csucs, elert_melyseg: int) -> None:
+        """
+        It restores the depth limit of the whole tree, and the deepest level reached in it.
+        """
+        self.dg_o.maximalis_melysegszint = self.maximalis_melysegszint
+        self.dg_o.reached_max_solution_tree_depth = max(
+            elert_melyseg, self.dg_o.reached_max_solution_tree_depth + csucs.melyseg - 1)
+    def csucs_kifejtese(self, csucs: Nyitott_csucs) -> List[Nyitott_csucs]:
+        """
+        It creates the children of the node one after the other as the depth-first search would do:
+        a child is bounded, evaluated if it is not pruned, and put into the queue with its free edges.
+        After a child the node is bounded again (see Solver.regi_csucs_vizsgalata).
+        It serves the children not fitting in the queue.
+        """
+        dg_o: Vezerles = self.dg_o
+        solver: Solver = self.solver
+        elert_melyseg: int = dg_o.reached_max_solution_tree_depth
+        tulcsordulas: List[Nyitott_csucs] = []
+        self.csucs_beallitasa(csucs)
+        self.kifejtesek_szama += 1
+        dg_o.reached_max_solution_tree_depth = 1
+        while dg_o.van_szabad_el() and not dg_o.egyeb_ok_van_leallasra():
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+            if not dg_o.korlatozas(False):
+                also: float = dg_o.kisk
+                dg_o.kiertekeles()
+                dg_o.kiertekelesek_szama += 1
+                dg_o.vezerles_aktualizalasa()
+                if dg_o.megoldasfa_melyitheto():
+                    dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+                    if dg_o.van_szabad_el():
+                        dg_o.kisk = also
+                        gyermek: Nyitott_csucs = self.nyitott_csucs_aktualisbol(csucs.melyseg)
+                        if self.van_hely():
+                            self.berakas(gyermek)
+                        else:
+                            tulcsordulas.append(gyermek)
+            dg_o.visszalepes()
+            dg_o.visszalepesek_szama += 1
+            solver.step_back = True
+            solver.regi_csucs_vizsgalata()
+            if solver.step_back:                    # a csúcs maradéka is levágható
+                break
+        self.csucs_elhagyasa(csucs, elert_melyseg)
+        return tulcsordulas
+    def melysegi_bejaras(self, csucs: Nyitott_csucs) -> None:
+        """
+        It searches the subtree of the node depth-first (see Solver.regi_csucsrol_indulva).
+        """
+        dg_o: Vezerles = self.dg_o
+        solver: Solver = self.solver
+        elert_melyseg: int = dg_o.reached_max_solution_tree_depth
+        self.csucs_beallitasa(csucs)
+        self.melysegi_reszfak_szama += 1
+        dg_o.reached_max_solution_tree_depth = 1
+        solver.step_back = False
+        solver.my_continue = True
+        solver.regi_csucsrol_indulva()
+        while True:
+            dg_o.vezerles_aktualizalasa()
+            if not solver.kell_a_tovabbi_kutatas():
+                break
+            solver.iteracio()
+        self.csucs_elhagyasa(csucs, elert_melyseg)
+    def iteraciok(self) -> None:
+        """
+        It is the counterpart of Solver.iteraciok. The solver must have set up its beginning order.
+        """
+        dg_o: Vezerles = self.dg_o
+        self.kezdeti_sorrend = kezdeti_sorrend_mentese(dg_o)
+        self.solver.elso_iteracio()
+        dg_o.vezerles_aktualizalasa()
+        if dg_o.megoldasfa_melyitheto():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+            if dg_o.van_szabad_el():
+                dg_o.kisk = dg_o.feladat_also_korlatja
+                self.berakas(self.nyitott_csucs_aktualisbol(1))
+        while self.nyitott and not dg_o.egyeb_ok_van_leallasra():
+            csucs: Nyitott_csucs = heappop(self.nyitott)[3]
+            if csucs.also > dg_o.viszonyitasi_alap - 1.0e-10:   # a többi sem jobb
+                self.nyitott.clear()
+                break
+            for gyermek in self.csucs_kifejtese(csucs):
+                if gyermek.also <= dg_o.viszonyitasi_alap - 1.0e-10 and not dg_o.egyeb_ok_van_leallasra():
+                    self.melysegi_bejaras(gyermek)
+        print(f"* Legjobb-először keresés: {self.kifejtesek_szama} kifejtett csúcs, "
+              f"legfeljebb {self.legtobb_nyitott_csucs} nyitott, {self.melysegi_reszfak_szama} mélységi részfa *")
+
+def csucsvalasztassal_iteraciok(solver: Solver, csucsvalasztas: str, nyitott_csucsok_hatara: int) -> None:
+    """
+    It searches the solution tree of the solver by the node-selection policy csucsvalasztas (see CSUCSVALASZTASOK).
+    """
+    if csucsvalasztas == "melysegi":
+        solver.iteraciok()
+    elif csucsvalasztas == "legjobb":
+        Legjobb_elso_kereses(solver).iteraciok()
+    else:
+        Legjobb_elso_kereses(solver, max(1, nyitott_csucsok_hatara)).iteraciok()
@@ -8,15 +8,18 @@ This module serves high level functionalities based on the class and subclasses
     Vezerles
  for the main module ('dg_main.py').  
  This module continues the concept of "black boxes" of the above classes but
- it does not create new classes for all level as was the case in the origin SIMULA program.
+ it does not create new classes for all level as was the case in the origin SIMULA program:
+ the pseudo black boxes are methods of one reentrant class (see Solver).
 """
-from typing import TypedDict
+from typing import Callable, TypedDict
 
 from vezerles  import Vezerles
+from dg_standard_input import DgStandardInput
+from dg_standard_input import dg_inint, dg_lastitem
 
-# visszalepes_kovetkezik: bool - Instead of this origin property see my_control_dict["step_back"]
+# visszalepes_kovetkezik: bool - Instead of this origin property see Solver.step_back
 # grabowsky_algoritmus_nem_allt_le: bool -
-#                                Instead of this origin property see my_control_dict["my_continue"]
+#                                Instead of this origin property see Solver.my_continue
 
 
 # class GuiControlInfo(TypedDict):
@@ -65,173 +68,358 @@ This global variable includes some important main control property:
 "my_continue" : Controls the main loop of solution tree traversaling
 """
 
-# These functions below forming a pseudo class or pseudo black box implement
-#   the original SIMULA program's class named "KORLATOZAS     ISMETELT KORLATOZAS".
-# @pseudo black box
-# Vezerles                                          # 1080. origin sor
-#   CLASS KORLATOZAS     ISMETELT KORLATOZAS
+class Solver:
+    """
+    This class is the reentrant engine of the search: it owns its Vezerles object (dg_o),
+    its control flags (step_back, my_continue) and, optionally, its input stream (bemenet),
+    so more solvers can run side by side in one process or thread pool.
+    The module-level functions below are thin wrappers around a Solver
+    whose state is the global my_control_dict (see _Globalis_solver).
+    """
+    def __init__(self, dg_o: Vezerles | None = None, bemenet: DgStandardInput | None = None) -> None:
+        self.dg_o: Vezerles | None = dg_o
+        self.step_back: bool = False        # Controls stepping back on the solution tree
+        self.my_continue: bool = True       # Controls the main loop of solution tree traversaling
+        self.bemenet: DgStandardInput | None = bemenet  # None: the global input (see dg_standard_input)
+        self.mentes: Callable[[Solver, int, bool], None] | None = None  # checkpoint hook (see dg_mentes)
+        if dg_o is not None and bemenet is not None:
+            dg_o.bemenet = bemenet
 
-def korlatozas_alapjan_visszalephetek() -> bool:
+    def kovetkezo_graf(self) -> bool:
+        """
+        It creates the Vezerles object of the next Disjunctive Graph of the input,
+        and resets the control flags. It serves False at the end of the input.
+        """
+        if dg_lastitem() if self.bemenet is None else self.bemenet.dg_lastitem():
+            return False
+        if self.bemenet is None:
+            self.dg_o = Vezerles(dg_inint(), dg_inint())   # muveletszam: int, gepszam: int
+        else:
+            self.dg_o = Vezerles(self.bemenet.dg_inint(), self.bemenet.dg_inint())
+            self.dg_o.bemenet = self.bemenet
+        self.step_back = False
+        self.my_continue = True
+        return True
+
+    def megoldas(self) -> float:
+        """
+        It reads the recent Disjunctive Graph, and searches for the optimal order of its operations
+        without printing the input and the result. It serves the best critical path length found
+        (or -1.0 if the technological requirements are contradictory).
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        self.adatelokeszites()
+        if not dg_o.megelozo_elemzes_mast_nem_mond():
+            return -1.0
+        dg_o.kezdeti_sorrend_felallitasa()
+        self.iteraciok()
+        return dg_o.aktualis_opt_atfutasi_ido
+
+    # These methods below forming a pseudo class or pseudo black box implement
+    #   the original SIMULA program's class named "KORLATOZAS     ISMETELT KORLATOZAS".
+    # @pseudo black box
+    # Vezerles                                          # 1080. origin sor
+    #   CLASS KORLATOZAS     ISMETELT KORLATOZAS
+
+    def korlatozas_alapjan_visszalephetek(self) -> bool:
+        """
+        This method is responsible for
+
+            TODO:
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        return dg_o.korlatozas(False)
+
+    def regi_csucs_vizsgalata(self) -> None:
+        """
+        This method is responsible for
+
+            TODO:
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        if dg_o.van_szabad_el():
+            self.esszeru_ismetelt_korlatozas()
+
+    def esszeru_ismetelt_korlatozas(self) -> None:
+        """
+        This method is responsible for
+
+            TODO:
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        korlatozas_sikeres: bool = False
+        if dg_o.remenyteli_az_ismetelt_korlatozas():
+            korlatozas_sikeres = dg_o.korlatozas(korlatozas_sikeres)
+            if dg_o.info:
+                print("* . *")
+            dg_o.ismetelt_korlatozasok_szama += 1
+        if korlatozas_sikeres:
+            dg_o.sikeres_ismetelt_korlatozasok_szama += 1
+        else:
+            self.step_back = False
+
+    # This method below–alone–making a pseudo class or pseudo black box implement
+    #   the original SIMULA program's class named "REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA".
+    # @pseudo black box
+    # KORLATOZAS     ISMETELT KORLATOZAS                # 1120. origin sor
+    #   CLASS REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA
+
+    def uj_megoldas_kereses_hatra_indulva(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        self.step_back = True
+        while self.step_back:
+            if dg_o.gyokerben_vagyok():
+                self.my_continue = False
+                self.step_back = False
+            else:
+                dg_o.visszalepes()
+                dg_o.visszalepesek_szama += 1
+                self.regi_csucs_vizsgalata()
+        if self.my_continue: # itt self.step_back == False
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+
+    # These methods below forming a pseudo class or pseudo black box implement
+    #   the original SIMULA program's class "UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA".
+    # @pseudo black box
+    # REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA         # 1140. origin sor
+    #   CLASS UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA
+
+    def uj_kiertekelendo_megoldas_keresese(self) -> None:
+        self.uj_megoldas_kereses_elore_indulva()
+        while False if not self.my_continue else self.korlatozas_alapjan_visszalephetek():
+            self.uj_megoldas_kereses_hatra_indulva()
+
+    def regi_csucsrol_indulva(self) -> None:
+        """
+        It continues the search from the recent node, whose free edges have been given (e.g. taken
+        over from an other worker, see dg_parallel_search), as if it had just stepped back to it.
+        It evaluates the new solution, if there is one.
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        self.step_back = True
+        self.regi_csucs_vizsgalata()
+        if self.step_back:
+            self.uj_megoldas_kereses_hatra_indulva()
+        else:
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+        while False if not self.my_continue else self.korlatozas_alapjan_visszalephetek():
+            self.uj_megoldas_kereses_hatra_indulva()
+        if self.my_continue:
+            dg_o.kiertekeles()
+            dg_o.kiertekelesek_szama += 1
+
+    def uj_megoldas_kereses_elore_indulva(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        if dg_o.megoldasfa_melyitheto() and dg_o.van_szabad_el():
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+        else:
+            self.uj_megoldas_kereses_hatra_indulva()
+
+    # These methods below forming a pseudo class or pseudo black box implement
+    #   the original SIMULA program's class "GRABOWSKY ALGORITMUS VEGET FIGYELI".
+    # @pseudo black box
+    # UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA     # 1170. origin sor
+    #   CLASS GRABOWSKY ALGORITMUS VEGET FIGYELI
+
+    def iteracio(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        if dg_o.megoldasfa_melyitheto():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        self.uj_kiertekelendo_megoldas_keresese()
+        if self.my_continue:
+            dg_o.kiertekeles()
+            dg_o.kiertekelesek_szama += 1
+
+    def kell_a_tovabbi_kutatas(self) -> bool:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        return self.my_continue and not dg_o.egyeb_ok_van_leallasra()
+
+    def elso_iteracio(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        dg_o.gyokeret_megoldasfaba()
+        dg_o.kiertekeles()
+        dg_o.kiertekelesek_szama += 1
+        if dg_o.info:
+            print("** A kezdeti sorrend **")
+            dg_o.aktualis_optimalis_megoldas_nyomtatasa()
+        else:
+            assert dg_o.nyelo
+            print("* A kezdetként felállított sorrend kritikus úthossza: "
+                  f"{dg_o.nyelo.forrastol1:8.2f} *\n")
+        dg_o.tabu_kereses()
+
+    # These methods below forming a pseudo class or pseudo black box implement
+    #   the original SIMULA program's class "CLASS VEZERLESI HELYEK".
+    # @pseudo black box
+    # GRABOWSKY ALGORITMUS VEGET FIGYELI                # 1200. origin sor
+    #   CLASS VEZERLESI HELYEK
+
+    def adatelokeszites(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        dg_o.vezerles_inicializalasa()
+        dg_o.graf_beolvasasa()
+
+    def iteraciok(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        self.elso_iteracio()
+        dg_o.vezerles_aktualizalasa()
+        self.iteraciok_folytatasa()
+
+    def iteraciok_folytatasa(self, i: int = 1) -> None:
+        """
+        The loop of iteraciok from its i-th iteration, e.g. on a search resumed from a checkpoint (see dg_mentes).
+        The checkpoint hook (mentes) is called after every iteration and at the end.
+        """
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        b: bool = dg_o.info  # 2024-02-27
+        while self.kell_a_tovabbi_kutatas():
+            if b:
+                if (True if i <= 1000 else
+                    True if i < 10000 and i % 100 == 0 else
+                    True if i < 100000 and i % 1000 == 0 else
+                    True if i < 1000000 and i % 10000 == 0 else
+                    not bool( i % 100000 )
+                   ):
+                    if dg_o.info:
+                        print("***************")
+                    print((f"{i}. iteration, Length of solution tree: {len(dg_o.ag)}, "
+                            "ID of max. last ten solutions:"
+                          ),
+                          ",".join(str(x.sorszam) for x in dg_o.ag[-10:]))
+                    if i >= 1000 and dg_o.info:
+                        dg_o.info = False
+                        print("*" * 75)
+                        print("Writing detailed LOG has been stopped "
+                              "because of the amount of iterations.")
+                        print("*" * 75)  # 2024-02-27
+            i += 1
+            self.iteracio()
+            dg_o.vezerles_aktualizalasa()
+            if self.mentes is not None:
+                self.mentes(self, i, False)
+        if self.mentes is not None:
+            self.mentes(self, i, True)
+
+    def eredmeny(self) -> None:
+        assert self.dg_o
+        dg_o: Vezerles = self.dg_o
+        dg_o.informaciok_nyomtatasa()
+        print("** A talált legjobb megoldás **")
+        dg_o.aktualis_optimalis_megoldas_nyomtatasa()
+
+
+class _Globalis_solver(Solver):
     """
-    This method is responsible for
+    The Solver of the module-level functions: its state is kept in my_control_dict,
+    so the former users of my_control_dict (e.g. dg_main.py) work unchanged.
+    """
+    def __init__(self) -> None:     # pylint: disable=super-init-not-called
+        self.bemenet = None         # the global input
+        self.mentes = None
+    @property
+    def dg_o(self) -> Vezerles | None:      # type: ignore[override]
+        return my_control_dict["dg_o"]
+    @dg_o.setter
+    def dg_o(self, ertek: Vezerles | None) -> None:
+        my_control_dict["dg_o"] = ertek
+    @property
+    def step_back(self) -> bool:            # type: ignore[override]
+        return my_control_dict["step_back"]
+    @step_back.setter
+    def step_back(self, ertek: bool) -> None:
+        my_control_dict["step_back"] = ertek
+    @property
+    def my_continue(self) -> bool:          # type: ignore[override]
+        return my_control_dict["my_continue"]
+    @my_continue.setter
+    def my_continue(self, ertek: bool) -> None:
+        my_control_dict["my_continue"] = ertek
+
+_globalis_solver: Solver = _Globalis_solver()
 
-        TODO:
+# The functions below are the former interface of this module; they drive the global solver.
+
+def korlatozas_alapjan_visszalephetek() -> bool:
     """
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    return dg_o.korlatozas(False)
+    See Solver.korlatozas_alapjan_visszalephetek
+    """
+    return _globalis_solver.korlatozas_alapjan_visszalephetek()
 
 def regi_csucs_vizsgalata() -> None:
     """
-    This method is responsible for
-
-        TODO:
+    See Solver.regi_csucs_vizsgalata
     """
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    if dg_o.van_szabad_el():
-        esszeru_ismetelt_korlatozas()
+    _globalis_solver.regi_csucs_vizsgalata()
 
 def esszeru_ismetelt_korlatozas() -> None:
     """
-    This method is responsible for
-
-        TODO:
+    See Solver.esszeru_ismetelt_korlatozas
     """
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    korlatozas_sikeres: bool = False
-    if dg_o.remenyteli_az_ismetelt_korlatozas():
-        korlatozas_sikeres = dg_o.korlatozas(korlatozas_sikeres)
-        if dg_o.info:
-            print("* . *")
-        dg_o.ismetelt_korlatozasok_szama += 1
-    if korlatozas_sikeres:
-        dg_o.sikeres_ismetelt_korlatozasok_szama += 1
-    else:
-        my_control_dict["step_back"] = False
-
-# This function below–alone–making a pseudo class or pseudo black box implement
-#   the original SIMULA program's class named "REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA".
-# @pseudo black box
-# KORLATOZAS     ISMETELT KORLATOZAS                # 1120. origin sor
-#   CLASS REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA
+    _globalis_solver.esszeru_ismetelt_korlatozas()
 
 def uj_megoldas_kereses_hatra_indulva() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    my_control_dict["step_back"]  = True
-    while my_control_dict["step_back"] :
-        if dg_o.gyokerben_vagyok():
-            my_control_dict["my_continue"] = False
-            my_control_dict["step_back"]  = False
-        else:
-            dg_o.visszalepes()
-            dg_o.visszalepesek_szama += 1
-            regi_csucs_vizsgalata()
-    if my_control_dict["my_continue"]: # itt my_control_dict["step_back"] == False
-        dg_o.uj_megoldas_illesztese_megoldasfara()
-
-# These functions below forming a pseudo class or pseudo black box implement
-#   the original SIMULA program's class "UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA".
-# @pseudo black box
-# REGI MEGOLDASOKON KERESZTUL UJ MEGOLDASBA         # 1140. origin sor
-#   CLASS UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA
+    """
+    See Solver.uj_megoldas_kereses_hatra_indulva
+    """
+    _globalis_solver.uj_megoldas_kereses_hatra_indulva()
 
 def uj_kiertekelendo_megoldas_keresese() -> None:
-    uj_megoldas_kereses_elore_indulva()
-    while False if not my_control_dict["my_continue"] else korlatozas_alapjan_visszalephetek():
-        uj_megoldas_kereses_hatra_indulva()
+    """
+    See Solver.uj_kiertekelendo_megoldas_keresese
+    """
+    _globalis_solver.uj_kiertekelendo_megoldas_keresese()
 
 def uj_megoldas_kereses_elore_indulva() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    if dg_o.megoldasfa_melyitheto() and dg_o.van_szabad_el():
-        dg_o.uj_megoldas_illesztese_megoldasfara()
-    else:
-        uj_megoldas_kereses_hatra_indulva()
-
-# These functions below forming a pseudo class or pseudo black box implement
-#   the original SIMULA program's class "GRABOWSKY ALGORITMUS VEGET FIGYELI".
-# @pseudo black box
-# UJ MEGOLDASOKON KERESZTUL UJ KIERTEKELENDO MEGOLDASBA     # 1170. origin sor
-#   CLASS GRABOWSKY ALGORITMUS VEGET FIGYELI
+    """
+    See Solver.uj_megoldas_kereses_elore_indulva
+    """
+    _globalis_solver.uj_megoldas_kereses_elore_indulva()
 
 def iteracio() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    if dg_o.megoldasfa_melyitheto():
-        dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
-    uj_kiertekelendo_megoldas_keresese()
-    if my_control_dict["my_continue"]:
-        dg_o.kiertekeles()
-        dg_o.kiertekelesek_szama += 1
+    """
+    See Solver.iteracio
+    """
+    _globalis_solver.iteracio()
 
 def kell_a_tovabbi_kutatas() -> bool:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    return my_control_dict["my_continue"] and not dg_o.egyeb_ok_van_leallasra()
+    """
+    See Solver.kell_a_tovabbi_kutatas
+    """
+    return _globalis_solver.kell_a_tovabbi_kutatas()
 
 def elso_iteracio() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    dg_o.gyokeret_megoldasfaba()
-    dg_o.kiertekeles()
-    dg_o.kiertekelesek_szama += 1
-    if dg_o.info:
-        print("** A kezdeti sorrend **")
-        dg_o.aktualis_optimalis_megoldas_nyomtatasa()
-    else:
-        assert dg_o.nyelo
-        print("* A kezdetként felállított sorrend kritikus úthossza: "
-              f"{dg_o.nyelo.forrastol1:8.2f} *\n")
-
-# These functions below forming a pseudo class or pseudo black box implement
-#   the original SIMULA program's class "CLASS VEZERLESI HELYEK".
-# @pseudo black box
-# GRABOWSKY ALGORITMUS VEGET FIGYELI                # 1200. origin sor
-#   CLASS VEZERLESI HELYEK
+    """
+    See Solver.elso_iteracio
+    """
+    _globalis_solver.elso_iteracio()
 
 def adatelokeszites() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    dg_o.vezerles_inicializalasa()
-    dg_o.graf_beolvasasa()
+    """
+    See Solver.adatelokeszites
+    """
+    _globalis_solver.adatelokeszites()
 
 def iteraciok() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    elso_iteracio()
-    dg_o.vezerles_aktualizalasa()
-    i: int = 1
-    b: bool = dg_o.info  # 2024-02-27
-    while kell_a_tovabbi_kutatas():
-        if b:
-            if (True if i <= 1000 else
-                True if i < 10000 and i % 100 == 0 else
-                True if i < 100000 and i % 1000 == 0 else
-                True if i < 1000000 and i % 10000 == 0 else
-                not bool( i % 100000 )
-               ):
-                if dg_o.info:
-                    print("***************")
-                print((f"{i}. iteration, Length of solution tree: {len(dg_o.ag)}, "
-                        "ID of max. last ten solutions:"
-                      ),
-                      ",".join(str(x.sorszam) for x in dg_o.ag[-10:]))
-                if i >= 1000 and dg_o.info:
-                    dg_o.info = False
-                    print("*" * 75)
-                    print("Writing detailed LOG has been stopped "
-                          "because of the amount of iterations.")
-                    print("*" * 75)  # 2024-02-27
-        i += 1
-        iteracio()
-        dg_o.vezerles_aktualizalasa()
+    """
+    See Solver.iteraciok
+    """
+    _globalis_solver.iteraciok()
 
 def eredmeny() -> None:
-    assert my_control_dict["dg_o"]
-    dg_o: Vezerles = my_control_dict["dg_o"]
-    dg_o.informaciok_nyomtatasa()
-    print("** A talált legjobb megoldás **")
-    dg_o.aktualis_optimalis_megoldas_nyomtatasa()
+    """
+    See Solver.eredmeny
+    """
+    _globalis_solver.eredmeny()
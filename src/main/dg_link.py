@@ -1,23 +1,69 @@
 """
 This module encapsulates the functionality of the SIMSET class from SIMULA'67,
 with a focus on the `HEAD` and `LINK` classes, representing a *linked list structure*.
+
+DgHead is a true (intrusive) doubly linked list: it knows its first and last element
+and their number, so INTO, PRECEDE, FOLLOW, OUT, FIRST, LAST and the others take constant time.
+The former implementation (see ListDgHead) kept the whole list in a Python list
+and relinked every element after each change. It can be switched back (see use_legacy_lists),
+e.g. to compare the two implementations on the same run (differential testing).
+A DgLink element lets its head do the work, so it can be an element of either kind of head.
+Both kinds derive from BaseDgHead, a Sequence of DgLink elements.
+
+Python lists of DgLink elements (e.g. Muveletcsucs.megelozok, scanned by Python loops)
+are linked by the functions below (see dg_into, dg_out_last, dg_link_list).
+
+DgLink and the engine classes derived from it (Muveletcsucs, Csatlakozas, El, Megoldascsucs)
+declare __slots__ (see dg_slots): their instances have no __dict__, so they are smaller,
+and their attributes are read faster. The former classes with __dict__ can be switched back
+by the DG_NO_SLOTS=1 environment variable, e.g. to compare the two (see src/test/dg_bench_slots.py).
 """
 
-from typing import Sequence # , List, Any
+import os
+from abc import abstractmethod
+from typing import Iterator, List, Sequence, Tuple # , Any
 
 from typing_extensions import deprecated
 
+LEGACY_LISTS: bool = os.environ.get("DG_LINK_LEGACY", "") == "1"
+"""
+True: the new heads (see dg_new_head) and the list functions work as the former implementation did.
+"""
+
+def use_legacy_lists(legacy: bool) -> None:
+    """
+    It switches to the former implementation of the linked lists (legacy is True), or back.
+    The heads made before keep their kind.
+    """
+    global LEGACY_LISTS     # pylint: disable=global-statement
+    LEGACY_LISTS = legacy
+
+SLOTS: bool = os.environ.get("DG_NO_SLOTS", "") != "1"
+"""
+True: DgLink and its subclasses declare __slots__. It is read once, when the classes are made.
+"""
+
+def dg_slots(*nevek: str) -> Tuple[str, ...]:
+    """
+    The __slots__ of a subclass of DgLink: the names of its own attributes, or none if SLOTS is False
+    (then the instances keep their attributes in __dict__ inherited from DgLink, as before).
+    A subclass without __slots__ (e.g. in a test) gets a __dict__ as usual.
+    """
+    return nevek if SLOTS else ()
+
 class DgLink:
     """
     This class represents the elements of a linked list.
     It replaces the original `LINK` class.
     """
+    if SLOTS:
+        __slots__ = ("head", "suc", "pred")
     def __init__(self, head = None) -> None:
         """
         Args:
             head: refers to the `DgHead` object managing the element's linked list
         """
-        self.head: DgHead | None = head    # the linked list itself
+        self.head: BaseDgHead | None = head    # the linked list itself
         self.suc:  DgLink | None = None    # successor DgLink element
         self.pred: DgLink | None = None    # predecessor DgLink element
     def is_free(self) -> bool:
@@ -37,15 +83,13 @@ class DgLink:
         """
         Ensure that the DgLink element is already part of a linked list
         """
-        loc_bool: bool = (self.head is not None and self.head.is_loaded() and
-                     not (self.suc is None and self.pred is None and len(self.head.l) > 1)
-        )
+        loc_bool: bool = self.head is not None and self.head.contains(self)
         if loc_bool:    # 2024-02-27 08:51
-            if not self.head:
-                assert bool(self.head), "Alert is_linked! A DgLink element's head is empty."
+            if self.head is None:
+                assert self.head is not None, "Alert is_linked! A DgLink element's head is empty."
                 return False
-            if not self in self.head.l:
-                assert self in self.head.l, "Alert is_linked! A DgLink element's head is corrupt."
+            if not self in self.head:   # in constant time in a DgHead
+                assert self in self.head, "Alert is_linked! A DgLink element's head is corrupt."
         return loc_bool
     def into(self, head) -> None:
         """
@@ -57,11 +101,9 @@ class DgLink:
             head: refers to the `DgHead` object managing the element's linked list
         """
         assert self.is_free(), "Alert INTO! The DgLink element is already member of a DgHead!"
-        h: DgHead = head
+        h: BaseDgHead = head
         assert h is not None and h.is_loaded(), "Alert INTO! The DgHead is totally empty!"
-        assert isinstance(h.l, list) # cast(list, h.l)
-        h.l.append(self)
-        h.link_elements()
+        h.insert(self, None)
     def precede(self, internal) -> None:
         """
         Insert the DgLink element into a linked list before a specified internal element.  
@@ -73,47 +115,294 @@ class DgLink:
         """
         assert self.is_free(), "Alert PRECEDE! The DgLink element is already member of a DgHead!"
         s: DgLink = internal
-        assert s is not None and s.is_linked(), (
+        assert s is not None and s.is_linked() and s.head is not None, (
             "Alert PRECEDE! The following element (internal) is not linked yet!"
         )
-        h: DgHead | None = s.head
-        if not h:
-            assert bool(h), "Alert PRECEDE! The internal.head is empty!"
-            return
-        assert isinstance(h.l, list) # cast(list, h.l)
-        h.l.insert(h.l.index(s), self)
-        h.link_elements()
+        s.head.insert(self, s)
+    def follow(self, internal) -> None:
+        """
+        Insert the DgLink element into a linked list after a specified internal element.  
+        It throws exception if the self is not free, i.e. is_free() False,
+        and if the internal is not in a linked list, i.e. is_linked() False.
+
+        Args:
+            internal: refers to the `DgLink` object that should precede the element being inserted.
+        """
+        assert self.is_free(), "Alert FOLLOW! The DgLink element is already member of a DgHead!"
+        p: DgLink = internal
+        assert p is not None and p.is_linked() and p.head is not None, (
+            "Alert FOLLOW! The preceding element (internal) is not linked yet!"
+        )
+        p.head.insert(self, p.suc)
     def out(self) -> None:
         """
         Take the DgLink element out from the linked list.  
         It throws exception if the self is not linked yet, i.e. is_linked() False.
         """
-        assert self.is_linked(), "Alert OUT! The DgLink element is not linked yet!"
-        h: DgHead | None = self.head
-        self.suc = None
-        self.pred = None
-        self.head = None
-        if not h:
-            assert bool(h), "Alert OUT! The self.head is empty!"
-            return
-        assert isinstance(h.l, list) # cast(list, h.l)
-        h.l.remove(self)
-        h.link_elements()
+        assert self.is_linked() and self.head is not None, "Alert OUT! The DgLink element is not linked yet!"
+        self.head.remove(self)
+
+class BaseDgHead(Sequence[DgLink]):
+    """
+    This class represents HEAD of the linked list in general: the common base of DgHead and ListDgHead.
+    It is a Python sequence of the DgLink elements (len, iteration, indexing).
+    The elements are served untyped, as the heads hold objects of the subclasses of DgLink.
+    """
+    @abstractmethod
+    def __iter__(self) -> Iterator:
+        """
+        The elements from the first to the last one.
+        """
+    @abstractmethod
+    def __getitem__(self, index):
+        """
+        The element of the index, or the elements of a slice.
+        """
+    @abstractmethod
+    def is_loaded(self) -> bool:
+        """
+        Ensure that the head is not totally empty
+        """
+    @abstractmethod
+    def contains(self, node: DgLink) -> bool:
+        """
+        True, if node is an element of the linked list.
+        """
+    @abstractmethod
+    def insert(self, node: DgLink, internal: DgLink | None) -> None:
+        """
+        It links node before internal, or after the last element if internal is None.
+        """
+    @abstractmethod
+    def remove(self, node: DgLink) -> None:
+        """
+        It unlinks node.
+        """
+    @abstractmethod
+    def link_elements(self) -> None:
+        """
+        It brings the successor (SUC) and predecessor (PRED) information up to date.
+        """
+    @abstractmethod
+    def first(self) -> DgLink | None:
+        """
+        This method presents the first element of the linked list, if any exists in.
+        """
+    @abstractmethod
+    def last(self) -> DgLink | None:
+        """
+        This method presents the last element of the linked list, if any exists in.
+        """
+    @abstractmethod
+    def empty(self) -> bool:
+        """
+        True, if the linked list has no element.
+        """
+    @abstractmethod
+    def cardinal(self) -> int:
+        """
+        The number of the elements.
+        """
+    @abstractmethod
+    def out_first(self) -> DgLink | None:
+        """
+        Take the first DgLink element out from the linked list, and returns it.
+        """
+    @abstractmethod
+    def out_last(self) -> DgLink | None:
+        """
+        Take the last DgLink element out from the linked list, and returns it.
+        """
+    @abstractmethod
+    def clear(self) -> None:
+        """
+        Take all the elements out from the linked list.
+        """
 
-class DgHead:
+class DgHead(BaseDgHead):
     """
     This class represents HEAD of the linked list.
-    Actually, it contains the whole linked list in a Python list also.
+    It keeps the first and the last element and their number, the elements are chained by suc and pred.
+    It can be read as a Python sequence as well (len, iteration, indexing), which is what
+    the former, Python list based implementation offered (see ListDgHead).
+    """
+    def __init__(self, l: Sequence[DgLink] | None = None) -> None:
+        self.first_link: DgLink | None = None
+        self.last_link:  DgLink | None = None
+        self.size: int = 0
+        if l is not None:
+            for node in l:
+                node.into(self)
+    def __repr__(self) -> str:
+        return f"DgHead of {self.size} elements"
+    def __len__(self) -> int:
+        return self.size
+    def __iter__(self) -> Iterator:
+        node: DgLink | None = self.first_link
+        while node is not None:
+            suc: DgLink | None = node.suc       # the element may be taken out meanwhile
+            yield node
+            node = suc
+    def __contains__(self, node: object) -> bool:
+        return isinstance(node, DgLink) and node.head is self
+    def __getitem__(self, index):
+        """
+        The element of the index: the first and the last one (0, -1) in constant time,
+        the others by walking from the nearer end. A slice is served as a Python list.
+        """
+        if isinstance(index, slice):
+            return list(self)[index]
+        if index < 0:
+            index += self.size
+        if not 0 <= index < self.size:
+            raise IndexError("DgHead index out of range")
+        node: DgLink | None
+        if index <= self.size // 2:
+            node = self.first_link
+            for _ in range(index):
+                assert node
+                node = node.suc
+        else:
+            node = self.last_link
+            for _ in range(self.size - 1 - index):
+                assert node
+                node = node.pred
+        return node
+    @property
+    def l(self) -> List[DgLink]:
+        """
+        The elements in a Python list, for backward compatibility (it is a copy).
+        """
+        return list(self)
+    def is_loaded(self) -> bool:
+        """
+        Ensure that the DgHead is not totally empty (it never is)
+        """
+        return True
+    def link_elements(self) -> None:
+        """
+        The successor (SUC) and predecessor (PRED) information is always up to date, nothing to do.
+        """
+    def contains(self, node: DgLink) -> bool:
+        return node.head is self
+    def insert(self, node: DgLink, internal: DgLink | None) -> None:
+        """
+        It links node before internal, or after the last element if internal is None.
+        """
+        node.head = self
+        node.suc = internal
+        if internal is None:
+            node.pred = self.last_link
+            self.last_link = node
+        else:
+            node.pred = internal.pred
+            internal.pred = node
+        if node.pred is None:
+            self.first_link = node
+        else:
+            node.pred.suc = node
+        self.size += 1
+    def remove(self, node: DgLink) -> None:
+        """
+        It unlinks node.
+        """
+        if node.pred is None:
+            self.first_link = node.suc
+        else:
+            node.pred.suc = node.suc
+        if node.suc is None:
+            self.last_link = node.pred
+        else:
+            node.suc.pred = node.pred
+        node.head = None
+        node.suc = None
+        node.pred = None
+        self.size -= 1
+    def first(self) -> DgLink | None:
+        """
+        This method presents the first element of the linked list, if any exists in.
+        """
+        return self.first_link
+    def last(self) -> DgLink | None:
+        """
+        This method presents the last element of the linked list, if any exists in.
+        """
+        return self.last_link
+    def empty(self) -> bool:
+        return self.size == 0
+    def cardinal(self) -> int:
+        return self.size
+    def out_first(self) -> DgLink | None:
+        """
+        Take the first DgLink element out from the linked list, and returns it.
+        """
+        f: DgLink | None = self.first_link
+        if f is not None:
+            self.remove(f)
+        return f
+    def out_last(self) -> DgLink | None:
+        """
+        Take the last DgLink element out from the linked list, and returns it.
+        """
+        l: DgLink | None = self.last_link
+        if l is not None:
+            self.remove(l)
+        return l
+    def clear(self) -> None:
+        """
+        Take all the elements out from the linked list.
+        """
+        while self.last_link is not None:
+            self.remove(self.last_link)
+
+class ListDgHead(BaseDgHead):
+    """
+    This class represents HEAD of the linked list the former way.
+    Actually, it contains the whole linked list in a Python list also,
+    and it updates the links of all the elements after every change.
     """
     def __init__(self, l: Sequence[DgLink] | None = None) -> None: # List[DgLink] helyett
         self.l:  Sequence[DgLink] = []      # the whole linked list # List[DgLink] helyett
         if l is not None:
             self.l = l
+    def __repr__(self) -> str:
+        return f"ListDgHead of {len(self.l)} elements"
+    def __len__(self) -> int:
+        return len(self.l)
+    def __iter__(self) -> Iterator:
+        return iter(list(self.l))
+    def __contains__(self, node: object) -> bool:
+        return node in self.l
+    def __getitem__(self, index):
+        return self.l[index]
     def is_loaded(self) -> bool:
         """
         Ensure that the DgHead is not totally empty
         """
         return self.l is not None
+    def contains(self, node: DgLink) -> bool:
+        loc_bool: bool = (self.is_loaded() and
+                     not (node.suc is None and node.pred is None and len(self.l) > 1)
+        )
+        if loc_bool:    # 2024-02-27 08:51
+            if not node in self.l:
+                assert node in self.l, "Alert is_linked! A DgLink element's head is corrupt."
+        return loc_bool
+    def insert(self, node: DgLink, internal: DgLink | None) -> None:
+        assert isinstance(self.l, list) # cast(list, h.l)
+        node.head = self
+        if internal is None:
+            self.l.append(node)
+        else:
+            self.l.insert(self.l.index(internal), node)
+        self.link_elements()
+    def remove(self, node: DgLink) -> None:
+        node.suc = None
+        node.pred = None
+        node.head = None
+        assert isinstance(self.l, list) # cast(list, h.l)
+        self.l.remove(node)
+        self.link_elements()
     def link_elements(self) -> None:
         """
         This method updates the successor (SUC) and predecessor (PRED)
@@ -148,6 +437,10 @@ class DgHead:
         if self.l:
             return self.l[-1]
         return None
+    def empty(self) -> bool:
+        return len(self.l) == 0
+    def cardinal(self) -> int:
+        return len(self.l)
     def out_first(self) -> DgLink | None:
         """
         Take the first DgLink element out from the linked list, and returns it.
@@ -172,6 +465,51 @@ class DgHead:
         if l:
             l.out()
         return l
+    def clear(self) -> None:
+        while self.l:
+            self.out_last()
+
+def dg_new_head() -> BaseDgHead:
+    """
+    It makes an empty head of the recent implementation (see use_legacy_lists).
+    """
+    return ListDgHead([]) if LEGACY_LISTS else DgHead()
+
+def dg_into(l: List, e: DgLink) -> None:
+    """
+    INTO for a Python list of DgLink elements: it appends e, and links it after the last element
+    in constant time (the former implementation relinks the whole list, see dg_link_list).
+    """
+    if LEGACY_LISTS:
+        l.append(e)
+        dg_link_list(l)
+        return
+    assert e.is_free(), "Alert dg_into! The DgLink element is already member of a list!"
+    if l:
+        utolso: DgLink = l[-1]
+        utolso.suc = e
+        e.pred = utolso
+        e.head = utolso.head
+    else:
+        e.head = ListDgHead(l)
+    l.append(e)
+
+def dg_out_last(l: List) -> DgLink | None:
+    """
+    LAST.OUT for a Python list of DgLink elements in constant time
+    (the former implementation relinks the whole list).
+    """
+    if not l:
+        return None
+    e: DgLink = l.pop()
+    e.suc = None
+    e.pred = None
+    e.head = None
+    if LEGACY_LISTS:
+        dg_link_list(l)
+    elif l:
+        l[-1].suc = None
+    return e
 
 # class Dg_link:
 #     def __init__(self) -> None:
@@ -189,6 +527,8 @@ def dg_first(l: Sequence[DgLink]) -> DgLink | None:  # instead of Link[DgLink]
     Deprecated: This method presents the first element of the linked list, if any exists in.  
     It is deprecated. Use DgHead.first() instead of it.
     """
+    if isinstance(l, BaseDgHead):
+        return l.first()
     if len(l) > 0:
         return l[0]
     return None
@@ -213,7 +553,11 @@ def dg_out(l: Sequence[DgLink], e: DgLink) -> None:  # List[DgLink]
     assert l, "Alert dg_out! The parameter l (list) is empty!"
     if not l or not e.head:
         return
-    assert l == e.head.l, "Alert dg_out! The parameter l (list) is different from e.head.l!"
+    if isinstance(l, BaseDgHead):
+        assert l is e.head, "Alert dg_out! The parameter l (head) is different from e.head!"
+        e.out()
+        return
+    assert l == list(e.head), "Alert dg_out! The parameter l (list) is different from e.head.l!"
     e.out()
 
 # def dg_link_elements(nodes: List[Dg_link]) -> None:         # Link the nodes together
@@ -237,6 +581,16 @@ def dg_link_elements(nodes: Sequence[DgLink]) -> None: # instead of Link[DgLink]
     However, you do not need to explicitly call it, as it is
     invoked automatically if necessary.
     """
+    if isinstance(nodes, BaseDgHead):
+        nodes.link_elements()
+        return
+    dg_link_list(nodes)
+
+def dg_link_list(nodes: Sequence[DgLink]) -> None:
+    """
+    This method links the elements of a Python list of DgLink elements together
+    (SUC, PRED and the missing head), e.g. after the list was filled by append.
+    """
     for i, node in enumerate(nodes):
         if i > 0:
             node.pred = nodes[i - 1]    # prev
@@ -253,7 +607,7 @@ def dg_set_head(nodes: Sequence[DgLink]) -> None: # instead of Link[DgLink]
     This method complements DgLink objects by setting the missing
     'head' attribute for backward compatibility purposes.  2024-02-27
     """
-    h: DgHead | None = None
+    h: BaseDgHead | None = None
     for node in nodes:
         if node.head is not None:
             if h is not None:
@@ -262,7 +616,7 @@ def dg_set_head(nodes: Sequence[DgLink]) -> None: # instead of Link[DgLink]
             else:
                 h = node.head
     if nodes and h is None:
-        h = DgHead(nodes)
+        h = ListDgHead(nodes)
     for node in nodes:
         if not node.head:
             node.head = h
@@ -12,15 +12,21 @@ Result:
 """
 from typing import List, cast
 
+import argparse
 import sys
 from traceback import print_tb
 from io import TextIOWrapper
 from os import path
 
-from dg_link import dg_first
 from diszjunktiv_graf import Csatlakozas, Muveletcsucs
 from vezerles  import Vezerles
-from dg_high_level_pseudo_black_boxes import my_control_dict, adatelokeszites, iteraciok, eredmeny
+from dg_high_level_pseudo_black_boxes import Solver, my_control_dict, adatelokeszites, iteraciok, eredmeny
+from dg_parallel_search import parhuzamos_iteraciok
+from dg_best_first_search import CSUCSVALASZTASOK, csucsvalasztassal_iteraciok
+from dg_portfolio import portfolio_kezdeti_sorrend
+from dg_mentes import Mentes, mentes_beolvasasa, mentett_iteraciok
+from korlatok import KORLATOK, ALAPERTELMEZETT_KORLATOK
+from sorrendi_szabalyok import ALAPERTELMEZETT_SZABALY, PORTFOLIO, SZABALYOK, szabalyok_felsorolasa
 from dg_standard_input import DgInpSource, DgStandardInput, my_dict_for_input
 from dg_standard_input import dg_inint, dg_lastitem # , dg_inreal
 
@@ -122,7 +128,7 @@ def print_input_data_hungarian(l_dg: Vezerles) -> None:
     for k in range(l_dg.muveletszam): # range(0, l_dg.muveletszam) is the same
         muv = l_dg.muvelet[l_dg.muvkod[k]]
         l: List = []                # egyelőre üres a techn. előzmény műveletek listája
-        megelozo: Csatlakozas | None = cast(Csatlakozas, dg_first(muv.megelozok))   # FIRST
+        megelozo: Csatlakozas | None = muv.megelozok[0] if muv.megelozok else None   # FIRST
         while megelozo:
             if megelozo.szomszed.azonosito > 0: # a forrást és nyelőt ki kell hagyni
                 l.append(megelozo.szomszed.azonosito)
@@ -157,7 +163,7 @@ def print_input_data_english(l_dg: Vezerles) -> None:
     for k in range(l_dg.muveletszam): # range(0, l_dg.muveletszam) is the same
         muv = l_dg.muvelet[l_dg.muvkod[k]]
         l: List = []                # initially empty list of technical precursor operations
-        megelozo: Csatlakozas | None = cast(Csatlakozas, dg_first(muv.megelozok))   # FIRST
+        megelozo: Csatlakozas | None = muv.megelozok[0] if muv.megelozok else None   # FIRST
         while megelozo:
             if megelozo.szomszed.azonosito > 0: # sources and sinks must be omitted
                 l.append(megelozo.szomszed.azonosito)
@@ -245,14 +251,72 @@ class MyResourceManager:
             print_tb(loc_traceback)
         print(f'MyResourceManager {self.name} has been released')
 
-if __name__ == '__main__':
-    if len(sys.argv) != 2:
-        print("Usage: python dg_main.py <input file name and/or full path>")
-        sys.exit(1)
+def parancssor_ertelmezese(argv: List[str]) -> argparse.Namespace:
+    """
+    It parses the command-line arguments.
+    The options override the corresponding settings in the header of the input.
+    """
+    parser: argparse.ArgumentParser = argparse.ArgumentParser(
+        prog="dg_main.py",
+        description="It searches for the minimax critical path of Directed Disjunctive Graphs.")
+    parser.add_argument("input", help="input file name and/or full path")
+    parser.add_argument("--korlatok", metavar="STRATEGIES",
+                        help="lower-bound strategies separated by commas "
+                             f"(known: {', '.join(KORLATOK)}; default: {ALAPERTELMEZETT_KORLATOK})")
+    parser.add_argument("--folyamatok", metavar="N", type=int, default=1,
+                        help="number of worker processes of the parallel search (default: 1, sequential)")
+    parser.add_argument("--hasitasi-melyseg", metavar="D", type=int, default=3,
+                        help="the solution tree is split into subproblems at this level (default: 3, min.: 2)")
+    parser.add_argument("--munkalopas", action=argparse.BooleanOptionalAction, default=True,
+                        help="idle workers take over the oldest unexplored subtrees of the busy ones "
+                             "(default: on; --no-munkalopas: static pool of the subproblems)")
+    parser.add_argument("--csucsvalasztas", choices=CSUCSVALASZTASOK, default="melysegi",
+                        help="node selection of the sequential search: depth-first (default), "
+                             "best-bound-first, or their hybrid with a limited queue")
+    parser.add_argument("--nyitott-csucsok", metavar="N", type=int, default=10000,
+                        help="the limit of the open nodes in the hybrid node selection (default: 10000)")
+    parser.add_argument("--kezdeti-sorrend", metavar="RULES", default=ALAPERTELMEZETT_SZABALY,
+                        help="dispatch rules of the beginning order separated by commas; the best one "
+                             f"of several is taken (known: {', '.join(SZABALYOK)}, veletlen<seed>; "
+                             f"default: {ALAPERTELMEZETT_SZABALY}; a portfolio e.g.: {PORTFOLIO})")
+    parser.add_argument("--mentes", metavar="FILE",
+                        help="checkpoint file of the sequential depth-first search, written periodically "
+                             "in the background and at the end")
+    parser.add_argument("--mentesi-idokoz", metavar="SEC", type=float, default=60.0,
+                        help="seconds between two checkpoints (default: 60)")
+    parser.add_argument("--folytatas", metavar="FILE",
+                        help="resume the search from this checkpoint file (the graphs before its graph are skipped)")
+    parser.add_argument("--max-ido", metavar="SEC", type=float,
+                        help="wall-clock limit of the search overriding the one of the input (0: unlimited)")
+    parser.add_argument("--max-kiertekelesek", metavar="N", type=int, default=0,
+                        help="stop after N evaluations (default: 0, unlimited); "
+                             "unlike the wall-clock limit it gives the same result on any machine; "
+                             "with --folyamatok > 1 the counter budgets apply to each worker")
+    parser.add_argument("--max-visszalepesek", metavar="N", type=int, default=0,
+                        help="stop after N backtracks (default: 0, unlimited)")
+    parser.add_argument("--max-csucsok", metavar="N", type=int, default=0,
+                        help="stop after N nodes of the solution tree (default: 0, unlimited)")
+    parser.add_argument("--max-memoria", metavar="MB", type=float, default=0.0,
+                        help="stop when the peak resident memory exceeds MB (default: 0, unlimited; "
+                             "not measured on Windows)")
+    parser.add_argument("--ellenorzesi-koz", metavar="N", type=int, default=64,
+                        help="read the clock and the memory in every N-th iteration (default: 64)")
+    parser.add_argument("--tabu-ido", metavar="SEC", type=float, default=0.0,
+                        help="time limit of the tabu search improving the beginning order "
+                             "before the search of the solution tree (default: 0, no tabu search; "
+                             "being limited by the clock, its result may depend on the machine)")
+    parser.add_argument("--tenyleges-elertekek", action="store_true",
+                        help="order the free edges of the nodes by the real critical path length after their "
+                             "reversal (batched evaluation) instead of the estimate")
+    return parser.parse_args(argv)
 
+if __name__ == '__main__':
     # Get command-line arguments
-    arg_str_fn = sys.argv[1]
+    args: argparse.Namespace = parancssor_ertelmezese(sys.argv[1:])
+    arg_str_fn = args.input
     dg_o: Vezerles | None = None
+    graf_sorszam: int = -1
+    mentes: Mentes | None = mentes_beolvasasa(args.folytatas) if args.folytatas else None
 
     with MyResourceManager('for->test_dg_input_read'):
         # Perform some operations with the resource
@@ -261,6 +325,7 @@ if __name__ == '__main__':
         #
         while not dg_lastitem():
             dg_o = Vezerles(dg_inint(), dg_inint()) # muveletszam: int, gepszam: int
+            graf_sorszam += 1
             my_control_dict["dg_o"] = dg_o          # propagate to lower levels
             my_control_dict["step_back"] = False    # initialize
             my_control_dict["my_continue"] = True   # initialize
@@ -278,6 +343,15 @@ if __name__ == '__main__':
 
             # Megelőző elemzést végez
             adatelokeszites()
+            if args.korlatok:
+                dg_o.korlatok_beallitasa(args.korlatok)
+            dg_o.tabu_kereses_ideje = args.tabu_ido
+            dg_o.tenyleges_szabad_el_ertekek = args.tenyleges_elertekek
+            if args.max_ido is not None:
+                dg_o.futas_maximalis_ideje = args.max_ido
+            dg_o.futasi_keret.hatarok_beallitasa((args.max_kiertekelesek, args.max_visszalepesek,
+                                                  args.max_csucsok, args.max_memoria))
+            dg_o.futasi_keret.ellenorzesi_koz = max(1, args.ellenorzesi_koz)
             # print("** Gépeken végrehajtandó műveletek darabszáma a gépek sorrendjében **")
             # l: List = [dg_o.gep_muveletszama[k] for k in range(dg_o.gepszam)]
             # print(l)
@@ -287,9 +361,28 @@ if __name__ == '__main__':
             # print(l)
             print_input_data_hungarian(dg_o)
 
-            if dg_o.megelozo_elemzes_mast_nem_mond():
-                dg_o.kezdeti_sorrend_felallitasa()
-                iteraciok()
+            folytatando: Mentes | None = (mentes if mentes is not None and mentes["graf_sorszam"] == graf_sorszam
+                                          else None)
+            if mentes is not None and graf_sorszam < mentes["graf_sorszam"]:
+                print("* Skipped: the search is resumed from a checkpoint of a later graph. *")
+            elif dg_o.megelozo_elemzes_mast_nem_mond():
+                szabalyok: List[str] = (szabalyok_felsorolasa(args.kezdeti_sorrend) if folytatando is None
+                                        else [folytatando["kezdeti_sorrend"]])
+                if len(szabalyok) > 1:
+                    portfolio_kezdeti_sorrend(dg_o, arg_str_fn, graf_sorszam, szabalyok, args.folyamatok)
+                else:
+                    dg_o.kezdeti_sorrend_szabalya = szabalyok[0]
+                    dg_o.kezdeti_sorrend_felallitasa()
+                if args.folyamatok > 1:
+                    parhuzamos_iteraciok(Solver(dg_o), arg_str_fn, graf_sorszam,
+                                         args.folyamatok, max(2, args.hasitasi_melyseg), args.munkalopas)
+                elif args.csucsvalasztas != "melysegi":
+                    csucsvalasztassal_iteraciok(Solver(dg_o), args.csucsvalasztas, args.nyitott_csucsok)
+                elif args.mentes or folytatando is not None:
+                    mentett_iteraciok(Solver(dg_o), arg_str_fn, graf_sorszam,
+                                      args.mentes, args.mentesi_idokoz, folytatando)
+                else:
+                    iteraciok()
                 eredmeny()
                 dg_o.print_cp()
             print("* The determination of the minimax critical path length "
@@ -0,0 +1,208 @@
+"""
+This module serves the checkpoints of the depth-first search of the solution tree (see Solver.iteraciok).
+
+A checkpoint (see Mentes) is a JSON file: the fixed edges of the branch in their order
+(see Diszjunktiv_graf_manipulacioi.rogzitett_elek_leirasa), the free edges left at its nodes,
+the incumbent order and the counters of Vezerles. It is taken between two iterations,
+when the deepest node of the branch has just been evaluated, so the search can be resumed
+exactly from there (see folytatas): the branch is rebuilt on the beginning order (see Megoldasfa.ag_visszaallitasa),
+and the loop of the iterations goes on (see Solver.iteraciok_folytatasa).
+
+The snapshot is taken in the search loop; it is written into the file by a background thread
+(see Aszinkron_mento), so the loop waits neither for the serialization nor for the disk.
+A file is replaced atomically, so a crash while writing leaves the former checkpoint intact.
+"""
+import json
+import os
+from datetime import datetime, timedelta
+from threading import Condition, Thread
+from time import monotonic
+from typing import Dict, List, Tuple, TypedDict
+
+from dg_exceptions import InputValueError
+from dg_high_level_pseudo_black_boxes import Solver
+from vezerles import Vezerles
+
+MENTES_VALTOZATA: int = 1
+"""
+The version of the format of the checkpoints.
+"""
+
+SZAMLALOK: Tuple[str, ...] = ("kiertekelesek_szama", "megoldasok_szama", "visszalepesek_szama",
+                              "ismetelt_korlatozasok_szama", "sikeres_ismetelt_korlatozasok_szama",
+                              "melyseghatar_eleresenek_szama", "reached_max_solution_tree_depth",
+                              "maximalis_melysegszint", "futas_maximalis_ideje", "info",
+                              "viszonyitasi_alap", "kisk", "nagyk", "aktualis_optimalis_megvaltozott",
+                              "feladat_also_korlatja", "remenybeli_felso_korlat", "keresesi_stadiumban_tartunk",
+                              "also_felso_korlat_megegyezik", "idohiany")
+"""
+The attributes of Vezerles saved as they are.
+"""
+
+class Mentes(TypedDict):
+    """
+    A checkpoint of the search of a Disjunctive Graph.
+    """
+    valtozat: int                           # MENTES_VALTOZATA
+    fajlnev: str                            # the input file
+    graf_sorszam: int                       # the Disjunctive Graph of the input file (0: the first one)
+    muveletszam: int
+    gepszam: int
+    kezdeti_sorrend: str                    # the dispatch rule of the beginning order (see sorrendi_szabalyok)
+    korlatok: str                           # the lower-bound strategies
+    iteracio: int                           # the serial number of the last iteration
+    eltelt_ido: float                       # seconds since the start of the search
+    elek: List[Tuple[int, int, bool]]       # the fixed edges of the branch (see rogzitett_elek_leirasa)
+    szabad_elek: List[List[Tuple[int, int, float]]]    # (kezdet, veg, delta) of the free edges by node of the branch
+    sorszamok: List[int]                    # the serial numbers of the nodes of the branch
+    legjobb: float                          # the critical path length of the incumbent
+    sorrend: List[Tuple[int, int, int]]     # (operation, opt_elozo, opt_koveto) identifiers of the incumbent (0: none)
+    step_back: bool
+    my_continue: bool
+    szamlalok: Dict[str, float]             # see SZAMLALOK
+    korlat_szamlalok: List[Tuple[int, int, int]]    # (hivasok_szama, vagasok_szama, gyorstar_talalatok) by strategy
+    transzpozicios_tabla: Tuple[int, int, int]      # (talalatok, hianyok, kiszoritasok)
+
+def mentes_osszeallitasa(solver: Solver, fajlnev: str, graf_sorszam: int, iteracio: int) -> Mentes:
+    """
+    It takes the snapshot of the search of the solver after its iteration-th iteration.
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    return {
+        "valtozat": MENTES_VALTOZATA,
+        "fajlnev": fajlnev,
+        "graf_sorszam": graf_sorszam,
+        "muveletszam": dg_o.muveletszam,
+        "gepszam": dg_o.gepszam,
+        "kezdeti_sorrend": dg_o.kezdeti_sorrend_szabalya,
+        "korlatok": ",".join(korlat.nev for korlat in dg_o.korlatok),
+        "iteracio": iteracio,
+        "eltelt_ido": dg_o.duration_in_seconds(),
+        "elek": dg_o.rogzitett_elek_leirasa(),
+        "szabad_elek": [mcs.szabad_elek.leirasa(dg_o.muvelet) for mcs in dg_o.ag],
+        "sorszamok": [mcs.sorszam for mcs in dg_o.ag],
+        "legjobb": dg_o.aktualis_opt_atfutasi_ido,
+        "sorrend": [(muv.azonosito,
+                     0 if muv.opt_elozo is None else muv.opt_elozo.azonosito,
+                     0 if muv.opt_koveto is None else muv.opt_koveto.azonosito) for muv in dg_o.muvelet],
+        "step_back": solver.step_back,
+        "my_continue": solver.my_continue,
+        "szamlalok": {nev: getattr(dg_o, nev) for nev in SZAMLALOK},
+        "korlat_szamlalok": [(k.hivasok_szama, k.vagasok_szama, k.gyorstar_talalatok) for k in dg_o.korlatok],
+        "transzpozicios_tabla": (dg_o.transzpozicios_tabla.talalatok, dg_o.transzpozicios_tabla.hianyok,
+                                 dg_o.transzpozicios_tabla.kiszoritasok)
+    }
+
+def mentes_irasa(fajlnev: str, mentes: Mentes) -> None:
+    """
+    It writes the checkpoint into a temporary file, and replaces the file fajlnev with it.
+    """
+    ideiglenes: str = fajlnev + ".tmp"
+    with open(ideiglenes, "wt", encoding= 'utf-8') as f:
+        json.dump(mentes, f)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(ideiglenes, fajlnev)
+
+def mentes_beolvasasa(fajlnev: str) -> Mentes:
+    with open(fajlnev, "rt", encoding= 'utf-8') as f:
+        mentes: Mentes = json.load(f)
+    if mentes.get("valtozat") != MENTES_VALTOZATA:
+        raise InputValueError(f"Unknown checkpoint format in {fajlnev!r}: {mentes.get('valtozat')!r}.")
+    return mentes
+
+def folytatas(solver: Solver, mentes: Mentes) -> int:
+    """
+    It restores the search of the solver from the checkpoint, and serves the serial number of its last iteration
+    (see Solver.iteraciok_folytatasa). The solver must be on the beginning order of the dispatch rule of the checkpoint.
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    if (mentes["muveletszam"], mentes["gepszam"]) != (dg_o.muveletszam, dg_o.gepszam):
+        raise InputValueError("The checkpoint belongs to an other Disjunctive Graph.")
+    assert mentes["kezdeti_sorrend"] == dg_o.kezdeti_sorrend_szabalya
+    dg_o.korlatok_beallitasa(mentes["korlatok"])
+    dg_o.ag_visszaallitasa(mentes["elek"], mentes["szabad_elek"], mentes["sorszamok"])
+    for azonosito, elozo, koveto in mentes["sorrend"]:
+        muv = dg_o.muvelet[dg_o.muvkod[azonosito - 1]]
+        muv.opt_elozo = None if elozo == 0 else dg_o.muvelet[dg_o.muvkod[elozo - 1]]
+        muv.opt_koveto = None if koveto == 0 else dg_o.muvelet[dg_o.muvkod[koveto - 1]]
+    dg_o.aktualis_opt_atfutasi_ido = mentes["legjobb"]
+    for nev, ertek in mentes["szamlalok"].items():
+        setattr(dg_o, nev, ertek)
+    for korlat, (hivasok, vagasok, talalatok) in zip(dg_o.korlatok, mentes["korlat_szamlalok"]):
+        korlat.hivasok_szama, korlat.vagasok_szama, korlat.gyorstar_talalatok = hivasok, vagasok, talalatok
+    (dg_o.transzpozicios_tabla.talalatok, dg_o.transzpozicios_tabla.hianyok,
+     dg_o.transzpozicios_tabla.kiszoritasok) = mentes["transzpozicios_tabla"]
+    dg_o.kezdesi_ido_beallitasa(datetime.now() - timedelta(seconds= mentes["eltelt_ido"]))
+    solver.step_back = mentes["step_back"]
+    solver.my_continue = mentes["my_continue"]
+    return mentes["iteracio"]
+
+class Aszinkron_mento:
+    """
+    This class represents the checkpoint hook of a Solver (see Solver.mentes). Called in every iteration,
+    it takes a snapshot at most in every idokoz seconds, and at the end of the search.
+    The snapshots are written by a background thread; if a newer one comes before the former
+    has been written, only the newer one is written.
+    """
+    def __init__(self, fajlnev: str, bemenet: str, graf_sorszam: int, idokoz: float = 60.0) -> None:
+        self.fajlnev: str = fajlnev
+        self.bemenet: str = bemenet
+        self.graf_sorszam: int = graf_sorszam
+        self.idokoz: float = idokoz
+        self.kovetkezo: float = monotonic() + idokoz
+        self.fuggo: Mentes | None = None            # a még ki nem írt legújabb pillanatkép
+        self.feltetel: Condition = Condition()
+        self.vege: bool = False
+        self.irasok_szama: int = 0
+        self.iro: Thread = Thread(target= self.irasok, daemon= True)
+        self.iro.start()
+    def __call__(self, solver: Solver, iteracio: int, vegso: bool) -> None:
+        if not vegso and monotonic() < self.kovetkezo:
+            return
+        self.kovetkezo = monotonic() + self.idokoz
+        mentes: Mentes = mentes_osszeallitasa(solver, self.bemenet, self.graf_sorszam, iteracio)
+        with self.feltetel:
+            self.fuggo = mentes
+            self.feltetel.notify()
+        if vegso:
+            self.lezaras()
+    def irasok(self) -> None:
+        """
+        The loop of the background thread.
+        """
+        while True:
+            with self.feltetel:
+                while self.fuggo is None and not self.vege:
+                    self.feltetel.wait()
+                if self.fuggo is None:
+                    return
+                mentes, self.fuggo = self.fuggo, None
+            mentes_irasa(self.fajlnev, mentes)
+            self.irasok_szama += 1
+    def lezaras(self) -> None:
+        """
+        It waits for the last snapshot to be written, and stops the background thread.
+        """
+        with self.feltetel:
+            self.vege = True
+            self.feltetel.notify()
+        self.iro.join()
+
+def mentett_iteraciok(solver: Solver, fajlnev: str, graf_sorszam: int,
+                      mentesi_fajl: str | None, idokoz: float, mentes: Mentes | None = None) -> None:
+    """
+    It is Solver.iteraciok with checkpoints into mentesi_fajl (None: no checkpoints) in every idokoz seconds,
+    or its resumption from the checkpoint mentes. The graph graf_sorszam of the fajlnev input file must be
+    on its beginning order (of the dispatch rule of mentes).
+    """
+    if mentesi_fajl:
+        solver.mentes = Aszinkron_mento(mentesi_fajl, fajlnev, graf_sorszam, idokoz)
+    if mentes is None:
+        solver.iteraciok()
+    else:
+        iteracio: int = folytatas(solver, mentes)
+        print(f"* A keresés folytatása a {iteracio}. iteráció utáni mentésből *\n")
+        solver.iteraciok_folytatasa(iteracio)
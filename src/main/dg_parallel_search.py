@@ -0,0 +1,512 @@
+"""
+This module serves the parallel search of the solution tree in processes.
+
+The tree is split near the root: the depth-limited search of the main process
+(see reszfeladatok_felsorolasa) collects the nodes at the split depth,
+each described by its fixed edges (see Diszjunktiv_graf_manipulacioi.rogzitett_elek_leirasa).
+A worker reads the same Disjunctive Graph of the input file again, replays the fixed edges
+on the beginning order, and searches the subtree below the node as if it was the root
+(see reszfeladat_elokeszitese, reszfa_bejarasa).
+
+The subtrees may be searched in a static pool (see reszfeladat_megoldasa) or with work stealing
+(see Munkamegosztas, munkas_futtatasa): a busy worker hands over the oldest unexplored siblings
+of its branch (the remainder of szabad_elek nearest to its root) when an other worker is idle.
+
+The best critical path length found so far is shared in a multiprocessing.Value,
+so every worker prunes against the global incumbent (see viszonyitasi_alap).
+"""
+import traceback
+from concurrent.futures import ProcessPoolExecutor
+from datetime import datetime
+from multiprocessing import Process, Queue, Value
+from multiprocessing.sharedctypes import Synchronized
+from queue import Empty
+from time import perf_counter
+from typing import Callable, List, Tuple, TypedDict, cast
+
+from dg_standard_input import DgStandardInput
+from diszjunktiv_graf import Muveletcsucs
+from megoldasfa import Megoldascsucs
+from sorrendi_szabalyok import ALAPERTELMEZETT_SZABALY
+from dg_high_level_pseudo_black_boxes import Solver
+from vezerles import Vezerles
+
+class Reszfeladat(TypedDict):
+    """
+    A subtree of the solution tree to be searched by a worker.
+    """
+    fajlnev: str                            # the input file
+    graf_sorszam: int                       # the Disjunctive Graph of the input file (0: the first one)
+    korlatok: str                           # the lower-bound strategies of the main process
+    kezdeti_sorrend: str                    # the dispatch rule of the beginning order (see sorrendi_szabalyok)
+    kezdesi_ido: datetime                   # the start of the main process (see futas_maximalis_ideje)
+    keret: Tuple[int, int, int, float]      # the limits of the budget of a worker (see Futasi_keret.hatarok)
+    maximalis_melysegszint: int             # the depth limit of the whole solution tree (0: unlimited)
+    melyseg: int                            # the level of the root of the subtree (the root of the tree is on 1)
+    elek: List[Tuple[int, int, bool]]       # the fixed edges of the root of the subtree
+    szabad_elek: List[Tuple[int, int, float]]   # (kezdet, veg, delta) of the free edges left at the root
+                                                # (empty: they have to be enumerated, see reszfa_bejarasa)
+
+class Reszeredmeny(TypedDict):
+    """
+    The result of one or more Reszfeladat. The root of a subtree is not counted
+    (the main process or the worker handing it over has counted it).
+    """
+    legjobb: float                          # 1.0e+300, if the worker did not improve the incumbent
+    sorrend: List[Tuple[int, int, int]]     # (operation, opt_elozo, opt_koveto) identifiers of the best order (0: none)
+    kiertekelesek_szama: int
+    megoldasok_szama: int
+    visszalepesek_szama: int
+    ismetelt_korlatozasok_szama: int
+    sikeres_ismetelt_korlatozasok_szama: int
+    melyseghatar_eleresenek_szama: int
+    reached_max_solution_tree_depth: int    # in the whole solution tree
+    korlatok: List[Tuple[int, int, int]]    # (hivasok_szama, vagasok_szama, gyorstar_talalatok) by strategy
+    transzpozicios_tabla: Tuple[int, int, int]  # (talalatok, hianyok, kiszoritasok)
+    idohiany: bool
+    keret_kimerult: str                     # the budget exhausted in the worker (see Futasi_keret.kimerult)
+
+class Munkasjelentes(Reszeredmeny):
+    """
+    The final report of a worker of the work stealing search.
+    """
+    munkas: int                             # the serial number of the worker
+    feladatok: int                          # the number of the subtrees searched
+    atadott: int                            # the number of the subtrees handed over to other workers
+    foglalt_ido: float                      # seconds spent on searching
+    teljes_ido: float                       # seconds from the start to the end of the worker
+    hiba: str                               # the traceback of an exception ("" if there was none)
+
+_kozos_legjobb: Synchronized | None = None
+"""
+The incumbent shared by the processes (see _folyamat_inicializalasa).
+"""
+
+def _folyamat_inicializalasa(kozos_legjobb: Synchronized) -> None:
+    """
+    The initializer of the worker processes: it takes over the shared incumbent.
+    """
+    global _kozos_legjobb       # pylint: disable=global-statement
+    _kozos_legjobb = kozos_legjobb
+
+def kozos_legjobb_atvetele(dg_o: Vezerles, kozos_legjobb: Synchronized) -> None:
+    """
+    It takes over the shared incumbent if it is better than the own one,
+    with the consequences of vezerles_aktualizalasa.
+    """
+    ertek: float = kozos_legjobb.value
+    if ertek < dg_o.aktualis_opt_atfutasi_ido:
+        dg_o.aktualis_opt_atfutasi_ido = ertek
+        dg_o.viszonyitasi_alap_ujraallitasa()
+        if dg_o.viszonyitasi_alap <= dg_o.remenybeli_felso_korlat:
+            dg_o.keresesi_stadiumban_tartunk = False
+        if dg_o.viszonyitasi_alap <= dg_o.feladat_also_korlatja + 1.0e-10:
+            dg_o.also_felso_korlat_megegyezik = True
+
+def kozos_legjobb_javitasa(dg_o: Vezerles, kozos_legjobb: Synchronized) -> None:
+    """
+    It publishes the own incumbent if it is better than the shared one.
+    """
+    with kozos_legjobb.get_lock():
+        kozos_legjobb.value = min(kozos_legjobb.value, dg_o.aktualis_opt_atfutasi_ido)
+
+def graf_beolvasasa_fajlbol(solver: Solver, graf_sorszam: int, kezdeti_sorrend: str = ALAPERTELMEZETT_SZABALY) -> bool:
+    """
+    It reads the Disjunctive Graph graf_sorszam of the input of the solver (skipping the former ones),
+    and sets up its beginning order by the dispatch rule kezdeti_sorrend.
+    It serves False if there is no such graph, or it is contradictory.
+    """
+    for _ in range(graf_sorszam + 1):
+        if not solver.kovetkezo_graf():
+            return False
+        solver.adatelokeszites()
+    assert solver.dg_o
+    solver.dg_o.info = False
+    if not solver.dg_o.megelozo_elemzes_mast_nem_mond():
+        return False
+    solver.dg_o.kezdeti_sorrend_szabalya = kezdeti_sorrend
+    solver.dg_o.kezdeti_sorrend_felallitasa()
+    return True
+
+def reszfeladat_elokeszitese(solver: Solver, feladat: Reszfeladat) -> None:
+    """
+    It sets up the root of the subtree of feladat as the root of the solution tree of the solver.
+    The solver must be on the beginning order of the operations without fixed edges.
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    dg_o.maximalis_melysegszint = (0 if feladat["maximalis_melysegszint"] == 0
+                                   else max(1, feladat["maximalis_melysegszint"] - feladat["melyseg"] + 1))
+    dg_o.reached_max_solution_tree_depth = 1
+    dg_o.gyokeret_megoldasfaba()
+    dg_o.megoldasok_szama -= 1                  # a részfa gyökerét már számoltuk
+    dg_o.rogzitett_elek_visszajatszasa(feladat["elek"])
+    dg_o.szabad_elek_beallitasa(dg_o.aktualis_megoldascsucs(), feladat["szabad_elek"])
+    solver.step_back = False
+    solver.my_continue = True
+
+def reszfa_bejarasa(solver: Solver, feladat: Reszfeladat, kozos_legjobb: Synchronized,
+                    atadas: Callable[[], None] | None = None) -> float:
+    """
+    It searches the subtree set up by reszfeladat_elokeszitese. The root of the subtree is not left:
+    the search ends when it would step back from it. atadas is called between the iterations
+    (see munkas_futtatasa). It serves the best critical path length found by itself (1.0e+300: none).
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    sajat_legjobb: float = 1.0e+300
+    dg_o.aktualis_optimalis_megvaltozott = False
+    kozos_legjobb_atvetele(dg_o, kozos_legjobb)
+    if feladat["szabad_elek"]:
+        solver.regi_csucsrol_indulva()
+    else:
+        dg_o.kiertekeles()                      # a gyökeret a főfolyamat már kiértékelte, de a sorrendet ki kell számolni
+    while True:
+        if dg_o.aktualis_optimalis_megvaltozott:
+            sajat_legjobb = dg_o.aktualis_opt_atfutasi_ido
+            kozos_legjobb_javitasa(dg_o, kozos_legjobb)
+        dg_o.vezerles_aktualizalasa()
+        kozos_legjobb_atvetele(dg_o, kozos_legjobb)
+        if not solver.kell_a_tovabbi_kutatas():
+            break
+        if atadas is not None:
+            atadas()
+        solver.iteracio()
+    return sajat_legjobb
+
+def reszeredmeny_osszeallitasa(dg_o: Vezerles, legjobb: float, melyseg: int) -> Reszeredmeny:
+    """
+    It collects the counters of the worker, and its best order if it has improved the incumbent (legjobb).
+    melyseg is the deepest level reached in the whole solution tree.
+    """
+    sorrend: List[Tuple[int, int, int]] = []
+    if legjobb < 1.0e+300:
+        sorrend = [(muv.azonosito,
+                    0 if muv.opt_elozo is None else muv.opt_elozo.azonosito,
+                    0 if muv.opt_koveto is None else muv.opt_koveto.azonosito) for muv in dg_o.muvelet]
+    return {
+        "legjobb": legjobb,
+        "sorrend": sorrend,
+        "kiertekelesek_szama": dg_o.kiertekelesek_szama,
+        "megoldasok_szama": dg_o.megoldasok_szama,
+        "visszalepesek_szama": dg_o.visszalepesek_szama,
+        "ismetelt_korlatozasok_szama": dg_o.ismetelt_korlatozasok_szama,
+        "sikeres_ismetelt_korlatozasok_szama": dg_o.sikeres_ismetelt_korlatozasok_szama,
+        "melyseghatar_eleresenek_szama": dg_o.melyseghatar_eleresenek_szama,
+        "reached_max_solution_tree_depth": melyseg,
+        "korlatok": [(k.hivasok_szama, k.vagasok_szama, k.gyorstar_talalatok) for k in dg_o.korlatok],
+        "transzpozicios_tabla": (dg_o.transzpozicios_tabla.talalatok, dg_o.transzpozicios_tabla.hianyok,
+                                 dg_o.transzpozicios_tabla.kiszoritasok),
+        "idohiany": dg_o.idohiany,
+        "keret_kimerult": dg_o.futasi_keret.kimerult
+    }
+
+def munkas_solver(feladat: Reszfeladat) -> Solver:
+    """
+    It creates the solver of a worker: it reads the Disjunctive Graph of feladat,
+    and sets up its beginning order and the settings of the main process.
+    """
+    # pylint: disable=import-outside-toplevel
+    from dg_main import InputTextFile                   # dg_main imports this module
+    itf: InputTextFile = InputTextFile(feladat["fajlnev"])
+    with open(feladat["fajlnev"], "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        solver: Solver = Solver(bemenet=DgStandardInput(itf))
+        beolvasva: bool = graf_beolvasasa_fajlbol(solver, feladat["graf_sorszam"], feladat["kezdeti_sorrend"])
+        itf.close_input()
+    assert beolvasva and solver.dg_o
+    solver.dg_o.korlatok_beallitasa(feladat["korlatok"])
+    solver.dg_o.kezdesi_ido_beallitasa(feladat["kezdesi_ido"])
+    solver.dg_o.futasi_keret.hatarok_beallitasa(feladat["keret"])
+    return solver
+
+def reszfeladat_megoldasa(feladat: Reszfeladat) -> Reszeredmeny:
+    """
+    It searches the subtree of feladat in a worker process of the static pool.
+    """
+    assert _kozos_legjobb is not None
+    solver: Solver = munkas_solver(feladat)
+    assert solver.dg_o
+    reszfeladat_elokeszitese(solver, feladat)
+    legjobb: float = reszfa_bejarasa(solver, feladat, _kozos_legjobb)
+    return reszeredmeny_osszeallitasa(solver.dg_o, legjobb,
+                                      solver.dg_o.reached_max_solution_tree_depth + feladat["melyseg"] - 1)
+
+class Munkamegosztas:
+    """
+    This class represents the shared state of the work stealing search: the queue of the subtrees
+    waiting for a worker, the queue of the final reports, the shared incumbent and three counters.
+    An idle worker increments ehesek; a busy worker hands over a subtree while there are more idle
+    workers than waiting subtrees (see kell_atadni). fuggo counts the subtrees waiting or being searched,
+    the search is over when it is zero.
+    """
+    def __init__(self, legjobb: float) -> None:
+        self.feladatsor: Queue = Queue()
+        self.jelentesek: Queue = Queue()
+        self.kozos_legjobb: Synchronized = Value('d', legjobb)
+        self.fuggo: Synchronized = Value('i', 0)
+        self.varakozok: Synchronized = Value('i', 0)
+        self.ehesek: Synchronized = Value('i', 0)
+    def berakas(self, feladat: Reszfeladat) -> None:
+        """
+        It puts a subtree into the queue.
+        """
+        with self.fuggo.get_lock():
+            self.fuggo.value += 1
+        with self.varakozok.get_lock():
+            self.varakozok.value += 1
+        self.feladatsor.put(feladat)
+    def kivetel(self, varakozas: float) -> Reszfeladat | None:
+        """
+        It takes a subtree from the queue, waiting at most varakozas seconds. It serves None if there was none.
+        """
+        try:
+            feladat: Reszfeladat = self.feladatsor.get(timeout= varakozas)
+        except Empty:
+            return None
+        with self.varakozok.get_lock():
+            self.varakozok.value -= 1
+        return feladat
+    def kesz(self) -> None:
+        """
+        A subtree taken from the queue has been searched.
+        """
+        with self.fuggo.get_lock():
+            self.fuggo.value -= 1
+    def ehseg(self, valtozas: int) -> None:
+        """
+        A worker becomes idle (+1) or busy (-1).
+        """
+        with self.ehesek.get_lock():
+            self.ehesek.value += valtozas
+    def kell_atadni(self) -> bool:
+        return self.ehesek.value > self.varakozok.value
+    def vege(self) -> bool:
+        return self.fuggo.value == 0
+
+def legregebbi_testverek_atadasa(solver: Solver, feladat: Reszfeladat) -> Reszfeladat | None:
+    """
+    It takes the unexplored siblings nearest to the root of the subtree of feladat, i.e. the free edges left
+    at the shallowest node of the branch (ag) which has a child on the branch, and serves them as
+    a new subtree: its root is that node with the edge of the child fixed as normal
+    (as after stepping back from the child, see Diszjunktiv_graf_manipulacioi.elek_visszaallitasaval_regi_sorrend).
+    It serves None if there are no such siblings.
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    csucsok: List[Megoldascsucs] = cast(List[Megoldascsucs], list(dg_o.ag))
+    szint: int = next((i for i, mcs in enumerate(csucsok[:-1]) if mcs.szabad_elek), -1)
+    if szint < 0:
+        return None
+    leiras: List[Tuple[int, int, bool]] = dg_o.rogzitett_elek_leirasa()
+    forditott: int = sum(1 for _, _, normal in feladat["elek"] if not normal) + szint + 1
+    hely: int = -1
+    while forditott > 0:                    # a gyermek fordított éle: az ág fordított élei a csúcsok sorrendjében jönnek
+        hely += 1
+        if not leiras[hely][2]:
+            forditott -= 1
+    kezdet, veg, _ = leiras[hely]
+    testverek: Reszfeladat = dict(feladat)  # type: ignore[assignment]
+    testverek["melyseg"] = feladat["melyseg"] + szint
+    testverek["elek"] = leiras[:hely] + [(veg, kezdet, True)]
+    testverek["szabad_elek"] = csucsok[szint].szabad_elek.leirasa(dg_o.muvelet)
+    csucsok[szint].szabad_elek.uritese()
+    return testverek
+
+def kezdeti_sorrend_mentese(dg_o: Vezerles) -> List[Tuple[Muveletcsucs | None, Muveletcsucs | None]]:
+    """
+    It saves the beginning order of the operations on the machines (see kezdeti_sorrend_visszaallitasa).
+    """
+    return [(muv.gepen_elozo, muv.gepen_koveto) for muv in dg_o.muvelet]
+
+def kezdeti_sorrend_visszaallitasa(dg_o: Vezerles,
+                                   kezdeti_sorrend: List[Tuple[Muveletcsucs | None, Muveletcsucs | None]]) -> None:
+    """
+    It removes the fixed edges of a searched subtree and restores the beginning order,
+    so the next subtree can be set up on the same graph (see reszfeladat_elokeszitese).
+    """
+    dg_o.megmaradt_fixalt_elek_eltavolitasa()
+    for muv, (elozo, koveto) in zip(dg_o.muvelet, kezdeti_sorrend):
+        muv.gepen_elozo = elozo; muv.gepen_koveto = koveto
+    dg_o.tomor_ervenytelenites()
+
+def munkas_futtatasa(sorszam: int, beallitasok: Reszfeladat, megosztas: Munkamegosztas,
+                     atadasi_gyakorisag: int = 16) -> None:
+    """
+    The main function of a worker process of the work stealing search. It searches the subtrees
+    taken from the queue one after the other on one copy of the graph. In every atadasi_gyakorisag-th
+    iteration it checks whether an other worker is idle, and if so, it hands over its oldest unexplored siblings.
+    At the end it sends its report (see Munkasjelentes).
+    """
+    kezdet: float = perf_counter()
+    foglalt_ido: float = 0.0
+    feladatok: int = 0
+    atadott: int = 0
+    melyseg: int = 1
+    legjobb: float = 1.0e+300
+    hiba: str = ""
+    solver: Solver = munkas_solver(beallitasok)
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    kezdeti_sorrend: List[Tuple[Muveletcsucs | None, Muveletcsucs | None]] = kezdeti_sorrend_mentese(dg_o)
+    ehes: bool = False
+    while not megosztas.vege():
+        feladat: Reszfeladat | None = megosztas.kivetel(0.01)
+        if feladat is None:
+            if not ehes:
+                ehes = True
+                megosztas.ehseg(+1)
+            continue
+        if ehes:
+            ehes = False
+            megosztas.ehseg(-1)
+        aktualis: Reszfeladat = feladat
+        lepes: int = 0
+        def atadas() -> None:
+            nonlocal lepes, atadott
+            lepes += 1
+            if lepes % atadasi_gyakorisag == 0 and megosztas.kell_atadni():
+                testverek: Reszfeladat | None = legregebbi_testverek_atadasa(solver, aktualis)
+                if testverek is not None:
+                    megosztas.berakas(testverek)
+                    atadott += 1
+        eleje: float = perf_counter()
+        try:
+            reszfeladat_elokeszitese(solver, aktualis)
+            legjobb = min(legjobb, reszfa_bejarasa(solver, aktualis, megosztas.kozos_legjobb, atadas))
+            melyseg = max(melyseg, dg_o.reached_max_solution_tree_depth + aktualis["melyseg"] - 1)
+            kezdeti_sorrend_visszaallitasa(dg_o, kezdeti_sorrend)
+        except Exception:   # pylint: disable=broad-exception-caught
+            hiba = traceback.format_exc()
+        foglalt_ido += perf_counter() - eleje
+        feladatok += 1
+        megosztas.kesz()
+        if hiba:
+            break
+    if ehes:
+        megosztas.ehseg(-1)
+    jelentes: Munkasjelentes = {**reszeredmeny_osszeallitasa(dg_o, legjobb, melyseg),   # type: ignore[typeddict-item]
+                                "munkas": sorszam, "feladatok": feladatok, "atadott": atadott,
+                                "foglalt_ido": foglalt_ido, "teljes_ido": perf_counter() - kezdet, "hiba": hiba}
+    megosztas.jelentesek.put(jelentes)
+
+def reszfeladatok_felsorolasa(solver: Solver, hasitasi_melyseg: int) -> List[List[Tuple[int, int, bool]]]:
+    """
+    It runs the search of the solver down to the depth hasitasi_melyseg (the root is on level 1),
+    and collects the fixed edges of the nodes reached on that level. Their subtrees are left to the workers.
+    The incumbent found meanwhile stays in the solver.
+    """
+    assert solver.dg_o
+    dg_o: Vezerles = solver.dg_o
+    maximalis_melysegszint: int = dg_o.maximalis_melysegszint
+    melyseghatar_eleresenek_szama: int = dg_o.melyseghatar_eleresenek_szama
+    dg_o.maximalis_melysegszint = hasitasi_melyseg
+    reszfeladatok: List[List[Tuple[int, int, bool]]] = []
+    solver.elso_iteracio()
+    dg_o.vezerles_aktualizalasa()
+    while solver.kell_a_tovabbi_kutatas():
+        solver.iteracio()
+        dg_o.vezerles_aktualizalasa()
+        if solver.my_continue and len(dg_o.ag) == hasitasi_melyseg:
+            reszfeladatok.append(dg_o.rogzitett_elek_leirasa())
+    dg_o.maximalis_melysegszint = maximalis_melysegszint
+    dg_o.melyseghatar_eleresenek_szama = melyseghatar_eleresenek_szama
+    return reszfeladatok
+
+def reszeredmeny_atvetele(dg_o: Vezerles, eredmeny: Reszeredmeny) -> None:
+    """
+    It adds the counters of a worker to the ones of the main process, and takes over its order
+    if it is better than the incumbent of the main process.
+    """
+    dg_o.kiertekelesek_szama += eredmeny["kiertekelesek_szama"]
+    dg_o.megoldasok_szama += eredmeny["megoldasok_szama"]
+    dg_o.visszalepesek_szama += eredmeny["visszalepesek_szama"]
+    dg_o.ismetelt_korlatozasok_szama += eredmeny["ismetelt_korlatozasok_szama"]
+    dg_o.sikeres_ismetelt_korlatozasok_szama += eredmeny["sikeres_ismetelt_korlatozasok_szama"]
+    dg_o.melyseghatar_eleresenek_szama += eredmeny["melyseghatar_eleresenek_szama"]
+    dg_o.reached_max_solution_tree_depth = max(dg_o.reached_max_solution_tree_depth,
+                                               eredmeny["reached_max_solution_tree_depth"])
+    for korlat, (hivasok, vagasok, talalatok) in zip(dg_o.korlatok, eredmeny["korlatok"]):
+        korlat.hivasok_szama += hivasok
+        korlat.vagasok_szama += vagasok
+        korlat.gyorstar_talalatok += talalatok
+    talalatok, hianyok, kiszoritasok = eredmeny["transzpozicios_tabla"]
+    dg_o.transzpozicios_tabla.talalatok += talalatok
+    dg_o.transzpozicios_tabla.hianyok += hianyok
+    dg_o.transzpozicios_tabla.kiszoritasok += kiszoritasok
+    dg_o.idohiany = dg_o.idohiany or eredmeny["idohiany"]
+    dg_o.futasi_keret.kimerult = dg_o.futasi_keret.kimerult or eredmeny["keret_kimerult"]
+    if eredmeny["legjobb"] < dg_o.aktualis_opt_atfutasi_ido:
+        for azonosito, elozo, koveto in eredmeny["sorrend"]:
+            muv = dg_o.muvelet[dg_o.muvkod[azonosito - 1]]
+            muv.opt_elozo = None if elozo == 0 else dg_o.muvelet[dg_o.muvkod[elozo - 1]]
+            muv.opt_koveto = None if koveto == 0 else dg_o.muvelet[dg_o.muvkod[koveto - 1]]
+        dg_o.aktualis_opt_atfutasi_ido = eredmeny["legjobb"]
+        dg_o.aktualis_optimalis_megvaltozott = True
+        dg_o.vezerles_aktualizalasa()
+
+def munkalopo_kereses(dg_o: Vezerles, feladatok: List[Reszfeladat], folyamatok: int,
+                      atadasi_gyakorisag: int = 16) -> List[Munkasjelentes]:
+    """
+    It searches the subtrees of feladatok by folyamatok worker processes with work stealing
+    (see munkas_futtatasa), and takes over their results. It serves the reports of the workers.
+    """
+    megosztas: Munkamegosztas = Munkamegosztas(dg_o.aktualis_opt_atfutasi_ido)
+    for feladat in feladatok:
+        megosztas.berakas(feladat)
+    munkasok: List[Process] = [Process(target= munkas_futtatasa, args= (k + 1, feladatok[0], megosztas, atadasi_gyakorisag))
+                               for k in range(folyamatok)]
+    for munkas in munkasok:
+        munkas.start()
+    jelentesek: List[Munkasjelentes] = [megosztas.jelentesek.get() for _ in munkasok]
+    for munkas in munkasok:
+        munkas.join()
+    jelentesek.sort(key=lambda jelentes: jelentes["munkas"])
+    hibak: List[str] = [jelentes["hiba"] for jelentes in jelentesek if jelentes["hiba"]]
+    if hibak:
+        raise RuntimeError("A worker of the parallel search has failed:\n" + hibak[0])
+    for jelentes in jelentesek:
+        reszeredmeny_atvetele(dg_o, jelentes)
+    return jelentesek
+
+def parhuzamos_iteraciok(solver: Solver, fajlnev: str, graf_sorszam: int,
+                         folyamatok: int, hasitasi_melyseg: int = 3, munkalopas: bool = True) -> None:
+    """
+    It is the parallel counterpart of Solver.iteraciok: the subtrees below the level hasitasi_melyseg
+    are searched by folyamatok processes, with work stealing (see munkalopo_kereses)
+    or in a static pool (munkalopas is False). The solver must have read the graph graf_sorszam
+    of the fajlnev input file, and set up its beginning order.
+    """
+    assert solver.dg_o and hasitasi_melyseg >= 2
+    dg_o: Vezerles = solver.dg_o
+    if 0 < dg_o.maximalis_melysegszint <= hasitasi_melyseg:
+        solver.iteraciok()
+        return
+    reszfeladatok: List[List[Tuple[int, int, bool]]] = reszfeladatok_felsorolasa(solver, hasitasi_melyseg)
+    feladatok: List[Reszfeladat] = [{
+        "fajlnev": fajlnev,
+        "graf_sorszam": graf_sorszam,
+        "korlatok": ",".join(korlat.nev for korlat in dg_o.korlatok),
+        "kezdeti_sorrend": dg_o.kezdeti_sorrend_szabalya,
+        "kezdesi_ido": dg_o.kezdesi_ido,
+        "keret": dg_o.futasi_keret.hatarok(),
+        "maximalis_melysegszint": dg_o.maximalis_melysegszint,
+        "melyseg": hasitasi_melyseg,
+        "elek": elek,
+        "szabad_elek": []
+    } for elek in reszfeladatok]
+    jelentesek: List[Munkasjelentes] = []
+    if feladatok and not dg_o.egyeb_ok_van_leallasra():
+        if munkalopas:
+            jelentesek = munkalopo_kereses(dg_o, feladatok, folyamatok)
+        else:
+            kozos_legjobb: Synchronized = Value('d', dg_o.aktualis_opt_atfutasi_ido)
+            with ProcessPoolExecutor(max_workers= folyamatok, initializer= _folyamat_inicializalasa,
+                                     initargs= (kozos_legjobb,)) as vegrehajto:
+                for eredmeny in vegrehajto.map(reszfeladat_megoldasa, feladatok):
+                    reszeredmeny_atvetele(dg_o, eredmeny)
+    print(f"* Párhuzamos keresés: {len(feladatok)} részfeladat, {folyamatok} folyamat *")
+    for jelentes in jelentesek:
+        kihasznaltsag: float = 100.0 * jelentes["foglalt_ido"] / max(jelentes["teljes_ido"], 1.0e-9)
+        print(f"* Munkás {jelentes['munkas']}: {jelentes['feladatok']} részfeladat, "
+              f"{jelentes['atadott']} átadott, kihasználtság {kihasznaltsag:5.1f}% *")
@@ -0,0 +1,75 @@
+"""
+This module serves the portfolio of the dispatch rules of the beginning order (see sorrendi_szabalyok).
+Every rule builds its beginning order (see Diszjunktiv_graf_manipulacioi.kezdeti_sorrend_felallitasa),
+which is evaluated by the same critical path calculation (see Diszjunktiv_graf.kritikus_ut_odafele).
+The rules may be tried in worker processes: a worker reads the same Disjunctive Graph of the input file
+again, as the workers of the parallel search do (see dg_parallel_search.graf_beolvasasa_fajlbol).
+The rule of the shortest critical path sets up the root order of the solution tree.
+The critical path length and the runtime of every rule are printed, so the useless ones can be dropped.
+"""
+from concurrent.futures import ProcessPoolExecutor
+from time import perf_counter
+from typing import List, Tuple, TypedDict
+
+from dg_standard_input import DgStandardInput
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_parallel_search import graf_beolvasasa_fajlbol
+from vezerles import Vezerles
+
+class Szabaly_eredmenye(TypedDict):
+    """
+    The beginning order of a dispatch rule.
+    """
+    szabaly: str                            # the name of the rule (see sorrendi_szabalyok.szabaly_letrehozasa)
+    atfutasi_ido: float                     # the critical path length of its beginning order
+    ido: float                              # seconds spent on building and evaluating it
+
+def szabaly_kiertekelese(dg_o: Vezerles, szabaly: str) -> Szabaly_eredmenye:
+    """
+    It sets up the beginning order of the rule on dg_o and evaluates it.
+    """
+    kezdet: float = perf_counter()
+    dg_o.kezdeti_sorrend_szabalya = szabaly
+    dg_o.kezdeti_sorrend_felallitasa()
+    dg_o.kritikus_ut_odafele()
+    assert dg_o.nyelo
+    return {"szabaly": szabaly, "atfutasi_ido": dg_o.nyelo.forrastol1, "ido": perf_counter() - kezdet}
+
+def szabaly_kiertekelese_fajlbol(feladat: Tuple[str, int, str]) -> Szabaly_eredmenye:
+    """
+    The function of the worker processes: feladat is (fajlnev, graf_sorszam, szabaly).
+    """
+    # pylint: disable=import-outside-toplevel
+    from dg_main import InputTextFile                   # dg_main imports this module
+    fajlnev, graf_sorszam, szabaly = feladat
+    itf: InputTextFile = InputTextFile(fajlnev)
+    with open(fajlnev, "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        solver: Solver = Solver(bemenet=DgStandardInput(itf))
+        beolvasva: bool = graf_beolvasasa_fajlbol(solver, graf_sorszam)
+        itf.close_input()
+    assert beolvasva and solver.dg_o
+    return szabaly_kiertekelese(solver.dg_o, szabaly)
+
+def portfolio_kezdeti_sorrend(dg_o: Vezerles, fajlnev: str, graf_sorszam: int,
+                              szabalyok: List[str], folyamatok: int = 1) -> List[Szabaly_eredmenye]:
+    """
+    It tries the rules one after the other on dg_o (folyamatok == 1), or in folyamatok worker processes
+    on the graph graf_sorszam of the fajlnev input file. Then it sets up the beginning order of the best rule
+    (the first one of the equal ones) on dg_o. It serves the results of the rules in their order.
+    """
+    eredmenyek: List[Szabaly_eredmenye]
+    if folyamatok > 1 and len(szabalyok) > 1:
+        with ProcessPoolExecutor(max_workers= min(folyamatok, len(szabalyok))) as vegrehajto:
+            eredmenyek = list(vegrehajto.map(szabaly_kiertekelese_fajlbol,
+                                             [(fajlnev, graf_sorszam, szabaly) for szabaly in szabalyok]))
+    else:
+        eredmenyek = [szabaly_kiertekelese(dg_o, szabaly) for szabaly in szabalyok]
+    for eredmeny in eredmenyek:
+        print(f"* Kezdeti sorrend ({eredmeny['szabaly']:10}): kritikus úthossz {eredmeny['atfutasi_ido']:8.2f}, "
+              f"{1000 * eredmeny['ido']:8.3f} ms *")
+    legjobb: Szabaly_eredmenye = min(eredmenyek, key=lambda eredmeny: eredmeny["atfutasi_ido"])
+    print(f"* A választott kezdeti sorrend: {legjobb['szabaly']} *\n")
+    dg_o.kezdeti_sorrend_szabalya = legjobb["szabaly"]
+    dg_o.kezdeti_sorrend_felallitasa()
+    return eredmenyek
@@ -260,6 +260,19 @@ class DgStandardInput:
                                       "The data being refused is: " +
                                       self.prepare_wrong_data(self.dg_list_buff[self.dg_index]))
         return ret_bool
+    def dg_intext_if_any(self) -> str:
+        """
+        This method serves the next item of the recent input line if it is a text,
+        otherwise an empty string. It never asks for a new line, so it can read
+        an optional text at the end of a line (e.g. the lower-bound strategies in the header).
+        """
+        ret_value: str = ""
+        if (self.input_source_obj.get_state() == "serve" and
+            self.dg_index < len(self.dg_list_buff) and
+            isinstance(self.dg_list_buff[self.dg_index], str)):
+            ret_value = self.dg_list_buff[self.dg_index]
+            self.dg_index += 1
+        return ret_value
     @deprecated("It must be done in a ResourceManager")
     def close_input(self) -> None:      # deprecated!
         """
@@ -322,6 +335,18 @@ def dg_inreal() -> float:
     o: DgStandardInput = my_dict_for_input["dg_input_object"]
     return o.dg_inreal()
 
+def dg_intext_if_any() -> str:
+    """
+    This function serves an optional text item at the end of the recent input line.
+    It propagates the DgStandardInput.dg_intext_if_any() method.
+    """
+    if (my_dict_for_input["dg_input_object"] is None
+        or not isinstance(my_dict_for_input["dg_input_object"], DgStandardInput)
+    ):
+        return ""
+    o: DgStandardInput = my_dict_for_input["dg_input_object"]
+    return o.dg_intext_if_any()
+
 @deprecated("It must be done in a ResourceManager")
 def dg_close_input() -> None:   # deprecated!
     """
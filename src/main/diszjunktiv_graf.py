@@ -16,13 +16,18 @@ The situation is analogous with classes.
 Each module's main class shares the module's name and forms
 a chain of subclasses in the same order.
 """
-from typing import List, cast
+from array import array
+from collections import deque
+from heapq import heapify, heappop, heappush
+from math import inf
+from typing import Deque, List, Sequence, Tuple, cast
 
 from dg_link import DgLink
-from dg_link import dg_first
-from dg_link import dg_link_elements
+from dg_link import dg_slots
+from dg_link import dg_link_list
 
-from dg_standard_input import dg_inint, dg_inreal # , dg_close_input
+from dg_standard_input import DgStandardInput
+from dg_standard_input import dg_inint, dg_inreal, dg_intext_if_any # , dg_close_input
 
 # In Python, you can disable assertions globally by running the interpreter with the -O (optimize) option.
 
@@ -40,6 +45,10 @@ class Muveletcsucs(DgLink):   #: CSak később, a Diszjunktiv_graf leszármazott
     """
     This class represents an operation.  
     """
+    __slots__ = dg_slots("azonosito", "gepje", "kiindultak", "kiindulok", "beerkezettek", "beerkezok",
+                         "idotartam", "forrastol1", "forrastol2", "nyeloig1", "nyeloig2", "megelozok", "rakovetkezok",
+                         "gepen_elozo", "gepen_koveto", "opt_elozo", "opt_koveto", "kritikus_elozo",
+                         "kritikus_elozo_sorrendi", "belso_index")
     def __init__(self) -> None:
         super().__init__()                                                                      #: Kell a DgLink super()
         self.azonosito: int = 0; self.gepje: int = 0
@@ -52,6 +61,7 @@ class Muveletcsucs(DgLink):   #: CSak később, a Diszjunktiv_graf leszármazott
         self.opt_elozo: Muveletcsucs | None = None;   self.opt_koveto: Muveletcsucs | None = None   #: Muveletcsucs
         self.kritikus_elozo: Muveletcsucs | None = None                                             #: Muveletcsucs
         self.kritikus_elozo_sorrendi:bool = False
+        self.belso_index: int = -1  # index a Tomor_graf tömbjeiben (forrás: muveletszam, nyelő: muveletszam + 1)
     def __repr__(self) -> str:
         if self.azonosito == 0: return super().__repr__()
         if self.azonosito == -1: return "Forras Muveletcsucs"
@@ -67,6 +77,7 @@ class Csatlakozas(DgLink):
     These relations may come from the input data of the Disjunctive Graph
     but can also come from operations such as fixing a 'free' sequential edge.
     """
+    __slots__ = dg_slots("szomszed")
     def __init__(self, szomszed: Muveletcsucs) -> None:                                         #: Muveletcsucs
         super().__init__()
         self.szomszed: Muveletcsucs = szomszed                                                  #: Muveletcsucs
@@ -74,6 +85,447 @@ class Csatlakozas(DgLink):
         if self.szomszed is None: return super().__repr__()
         return f"Csatlakozas {repr(self.szomszed)} szomszeddal"
 
+class Tomor_graf:
+    """
+    This class represents the compact (array-backed, CSR-like) store of the Disjunctive Graph.  
+    The operations are indexed 0..n-1, the source (forras) is n and the sink (nyelo) is n+1
+    (see Muveletcsucs.belso_index).
+    The technological predecessor and successor arcs are kept in flat integer arrays
+    with offset tables (megelozo_kezdet, rakovetkezo_kezdet), the durations, heads and tails
+    in contiguous float arrays.  
+    The sequential edges fixed during the search (see El.fixalas) change in time,
+    so they are kept beside the flat arrays in the short tobblet_* lists,
+    together with the recent order of operations on the machines (gepen_elozo, gepen_koveto).
+    The store follows the El operations of the search step by step (szomszedcsere, el_hozzaadasa,
+    el_elvetele), so it always holds the recent graph. An order set otherwise is loaded
+    by Diszjunktiv_graf.tomor_ervenytelenites.
+    """
+    def __init__(self, csucsok: Sequence[Muveletcsucs]) -> None:
+        """
+        Args:
+            csucsok: the operations in the order of their belso_index, the source and the sink
+                     at the end. Their megelozok and rakovetkezok lists must be complete.
+        """
+        n: int = len(csucsok)
+        self.csucsszam: int = n
+        self.forras: int = n - 2
+        self.nyelo: int = n - 1
+        self.idotartam: array = array('d', (c.idotartam for c in csucsok))
+        self.megelozo_kezdet: array = array('i', [0])
+        self.megelozok: array = array('i')
+        self.rakovetkezo_kezdet: array = array('i', [0])
+        self.rakovetkezok: array = array('i')
+        for c in csucsok:
+            self.megelozok.extend(cs.szomszed.belso_index for cs in c.megelozok)
+            self.megelozo_kezdet.append(len(self.megelozok))
+            self.rakovetkezok.extend(cs.szomszed.belso_index for cs in c.rakovetkezok)
+            self.rakovetkezo_kezdet.append(len(self.rakovetkezok))
+        self.forrastol1: array = array('d', [0.0]) * n
+        self.forrastol2: array = array('d', [0.0]) * n
+        self.nyeloig1: array = array('d', [0.0]) * n
+        self.nyeloig2: array = array('d', [0.0]) * n
+        self.kritikus_elozo: array = array('i', [-1]) * n      # -1: nincs (None)
+        self.kritikus_elozo_sorrendi: array = array('b', [0]) * n
+        self.gepen_elozo: array = array('i', [-1]) * n         # -1: nincs (None)
+        self.gepen_koveto: array = array('i', [-1]) * n
+        self.tobblet_megelozok: List[List[int]] = [[] for _ in range(n)]      # fixált élek
+        self.tobblet_rakovetkezok: List[List[int]] = [[] for _ in range(n)]   # fixált élek
+        self.pozicio: array = array('i', [0]) * n               # topologikus sorszám (inkrementális motor)
+        self.fejek_ervenyesek: bool = False                     # forrastol* a mostani gráfhoz tartozik (a piszkos_fejek kivételével)
+        self.farkak_ervenyesek: bool = False                    # nyeloig* a mostani gráfhoz tartozik (a piszkos_farkak kivételével)
+        self.piszkos_fejek: set = set()
+        self.piszkos_farkak: set = set()
+        self.nyomvonal: List[Tuple[array, int, float]] = []   # (tömb, index, régi érték) a visszalépéshez
+        self.nemzedek: int = 0                                  # a nyomvonal_jel()-ek érvényességéhez
+    def kritikus_ut_odafele(self) -> None:
+        """
+        The compact counterpart of Diszjunktiv_graf.kritikus_ut_odafele (together with torles).
+        It visits the nodes in the same order, so the ties are resolved the same way.
+        """
+        n: int = self.csucsszam
+        forrastol1: array = self.forrastol1; forrastol2: array = self.forrastol2
+        kritikus_elozo: array = self.kritikus_elozo; sorrendi: array = self.kritikus_elozo_sorrendi
+        idotartam: array = self.idotartam
+        rk: array = self.rakovetkezo_kezdet; rakovetkezok: array = self.rakovetkezok
+        tobblet: List[List[int]] = self.tobblet_rakovetkezok
+        gepen_koveto: array = self.gepen_koveto
+        mk: array = self.megelozo_kezdet; gepen_elozo: array = self.gepen_elozo
+        tobblet_elozok: List[List[int]] = self.tobblet_megelozok
+        hatra: List[int] = [mk[k + 1] - mk[k] + len(tobblet_elozok[k])              # a még be nem érkezett élek
+                            + (gepen_elozo[k] >= 0) for k in range(n)]
+        regi: List[array] = [array(a.typecode, a) for a in (forrastol1, forrastol2, kritikus_elozo, sorrendi, self.pozicio)]
+        forrastol1[:] = array('d', [-1.0]) * n                      # torles
+        kritikus_elozo[:] = array('i', [-1]) * n
+        sorrendi[:] = array('b', [0]) * n
+        forrastol1[self.forras] = forrastol2[self.forras] = 0.0
+        forrastol1[self.nyelo] = 0.0
+        elintezettek: Deque[int] = deque([self.forras])             # FIFO
+        sorrend: List[int] = []                                     # a FIFO sorrend topologikus sorrend
+        while elintezettek:
+            u: int = elintezettek.popleft()
+            sorrend.append(u)
+            hossz: float = forrastol2[u]
+            kuszob: float = hossz - 1.0e-10
+            for v in rakovetkezok[rk[u]:rk[u + 1]].tolist() + tobblet[u]:
+                if forrastol1[v] < kuszob:
+                    forrastol1[v] = hossz; kritikus_elozo[v] = u; sorrendi[v] = 0
+                hatra[v] -= 1
+                if not hatra[v]:
+                    elintezettek.append(v)
+                    forrastol2[v] = forrastol1[v] + idotartam[v]
+            v = gepen_koveto[u]
+            if v >= 0:
+                if forrastol1[v] < kuszob:
+                    forrastol1[v] = hossz; kritikus_elozo[v] = u; sorrendi[v] = 1
+                hatra[v] -= 1
+                if not hatra[v]:
+                    elintezettek.append(v)
+                    forrastol2[v] = forrastol1[v] + idotartam[v]
+        self.fejek_ervenyesek = len(sorrend) == n                   # különben kör van a gráfban
+        self.piszkos_fejek.clear()
+        if not self.fejek_ervenyesek:
+            self.uj_nemzedek()
+            return
+        for k, v in enumerate(sorrend):
+            self.pozicio[v] = k
+        for tomb, regi_tomb in zip((forrastol1, forrastol2, kritikus_elozo, sorrendi, self.pozicio), regi):
+            self.valtozasok_naplozasa(tomb, regi_tomb)
+    def kritikus_uthosszak_visszafele(self) -> None:
+        """
+        The compact counterpart of Diszjunktiv_graf.kritikus_uthosszak_visszafele
+        (together with the nyeloig2 part of torles).
+        """
+        n: int = self.csucsszam
+        nyeloig1: array = self.nyeloig1; nyeloig2: array = self.nyeloig2
+        regi: List[array] = [array('d', nyeloig1), array('d', nyeloig2)]
+        nyeloig2[:] = array('d', [-1.0]) * n                        # torles
+        nyeloig2[self.forras] = nyeloig2[self.nyelo] = 0.0
+        idotartam: array = self.idotartam
+        mk: array = self.megelozo_kezdet; megelozok: array = self.megelozok
+        tobblet: List[List[int]] = self.tobblet_megelozok
+        gepen_elozo: array = self.gepen_elozo
+        rk: array = self.rakovetkezo_kezdet; gepen_koveto: array = self.gepen_koveto
+        tobblet_kovetok: List[List[int]] = self.tobblet_rakovetkezok
+        hatra: List[int] = [rk[k + 1] - rk[k] + len(tobblet_kovetok[k])            # a még ki nem indult élek
+                            + (gepen_koveto[k] >= 0) for k in range(n)]
+        nyeloig1[self.nyelo] = 0.0
+        elintezettek: Deque[int] = deque([self.nyelo])              # FIFO
+        bejart: int = 0
+        while elintezettek:
+            u: int = elintezettek.popleft()
+            bejart += 1
+            hossz: float = nyeloig1[u]
+            elozok: List[int] = megelozok[mk[u]:mk[u + 1]].tolist() + tobblet[u]
+            if gepen_elozo[u] >= 0:
+                elozok.append(gepen_elozo[u])
+            for v in elozok:
+                if nyeloig2[v] < hossz:
+                    nyeloig2[v] = hossz
+                hatra[v] -= 1
+                if not hatra[v]:
+                    elintezettek.append(v)
+                    nyeloig1[v] = nyeloig2[v] + idotartam[v]
+        self.farkak_ervenyesek = self.fejek_ervenyesek and bejart == n
+        self.piszkos_farkak.clear()
+        if not self.farkak_ervenyesek:
+            self.uj_nemzedek()
+            return
+        self.valtozasok_naplozasa(nyeloig1, regi[0])
+        self.valtozasok_naplozasa(nyeloig2, regi[1])
+
+    # Inkrementális kiértékelés: egy-egy gépi él megfordítása után csak a fordított
+    # műveletpártól lefelé (forrastol*), illetve attól fölfelé (nyeloig*) eső csúcsokat számoljuk újra.
+    def rakovetkezo_csucsok(self, u: int) -> List[int]:
+        """
+        It serves all the recent successors of u (technological, fixed and the one on the machine).
+        """
+        ret_val: List[int] = self.rakovetkezok[self.rakovetkezo_kezdet[u]:self.rakovetkezo_kezdet[u + 1]].tolist()
+        ret_val.extend(self.tobblet_rakovetkezok[u])
+        if self.gepen_koveto[u] >= 0: ret_val.append(self.gepen_koveto[u])
+        return ret_val
+    def megelozo_csucsok(self, v: int) -> List[int]:
+        """
+        It serves all the recent predecessors of v (technological, fixed and the one on the machine).
+        """
+        ret_val: List[int] = self.megelozok[self.megelozo_kezdet[v]:self.megelozo_kezdet[v + 1]].tolist()
+        ret_val.extend(self.tobblet_megelozok[v])
+        if self.gepen_elozo[v] >= 0: ret_val.append(self.gepen_elozo[v])
+        return ret_val
+    def ervenytelenites(self) -> None:
+        """
+        The order on the machines or the fixed edges have changed without notice
+        (e.g. kezdeti_sorrend_felallitasa), so the next evaluation must be a full one.
+        """
+        self.fejek_ervenyesek = self.farkak_ervenyesek = False
+        self.uj_nemzedek()
+    def uj_nemzedek(self) -> None:
+        """
+        The values have been (or will be) rewritten without the trail,
+        so the former marks of the trail are worthless.
+        """
+        self.nemzedek += 1
+        self.nyomvonal.clear()
+    def valtozasok_naplozasa(self, tomb: array, regi: array) -> None:
+        """
+        A full pass has rewritten the whole array tomb: its elements differing from their former
+        values (regi) go onto the trail, so the marks taken before the pass stay valid.
+        """
+        if tomb == regi:
+            return
+        nyomvonal: List[Tuple[array, int, float]] = self.nyomvonal
+        for k, ertek in enumerate(regi):
+            if tomb[k] != ertek:
+                nyomvonal.append((tomb, k, ertek))
+    def nyomvonal_jel(self) -> Tuple[int, int] | None:
+        """
+        It brings the heads and the tails up to date, and serves the mark of the trail
+        belonging to this state (None, if the incremental state is not valid).
+        """
+        if not self.fejek_ervenyesek:
+            return None
+        self.fejek_frissitese()
+        if self.farkak_ervenyesek: self.farkak_frissitese()
+        else: self.kritikus_uthosszak_visszafele()
+        return (self.nemzedek, len(self.nyomvonal))
+    def visszagorgetes(self, jel: Tuple[int, int] | None) -> None:
+        """
+        It restores the heads, the tails, the critical predecessors and the topological order
+        as they were at the mark jel, in time proportional to the changes since then.
+        The machine order and the fixed edges must have been restored before
+        (up to "normal" fixed edges, which do not change any length).
+        The full passes since the mark are undone from the trail as well (see valtozasok_naplozasa);
+        only a cycle or invalid heads at the time of the backtrack need a full evaluation.
+        """
+        if jel is None or jel[0] != self.nemzedek or not self.fejek_ervenyesek:
+            self.ervenytelenites()
+            return
+        nyomvonal: List[Tuple[array, int, float]] = self.nyomvonal
+        while len(nyomvonal) > jel[1]:
+            tomb, k, ertek = nyomvonal.pop()
+            tomb[k] = ertek
+        self.piszkos_fejek.clear()
+        self.piszkos_farkak.clear()
+        self.farkak_ervenyesek = True                               # a jel idején (nyomvonal_jel) érvényesek voltak
+    def valtozas(self, v: int, u: int) -> None:
+        """
+        The set of the predecessors of v and the set of the successors of u have changed.
+        """
+        self.piszkos_fejek.add(v)
+        self.piszkos_farkak.add(u)
+    def el_hozzaadasa(self, u: int, v: int) -> None:
+        """
+        The mirror of El.fixalas: the fixed edge u -> v is added.
+        """
+        self.tobblet_rakovetkezok[u].append(v)
+        self.tobblet_megelozok[v].append(u)
+        if not self.fejek_ervenyesek: return                        # a következő kiértékelés teljes lesz
+        self.valtozas(v, u)
+        if self.pozicio[v] < self.pozicio[u]:
+            self.topologikus_atrendezes(u, v)
+    def el_elvetele(self, u: int, v: int) -> None:
+        """
+        The mirror of El.eltavolitas: the last fixed edge u -> v is removed.
+        """
+        assert self.tobblet_rakovetkezok[u][-1] == v and self.tobblet_megelozok[v][-1] == u, \
+            'Alert el_elvetele, it is not the last fixed edge.'
+        self.tobblet_rakovetkezok[u].pop()
+        self.tobblet_megelozok[v].pop()
+        if not self.fejek_ervenyesek: return                        # a következő kiértékelés teljes lesz
+        self.valtozas(v, u)
+    def szomszedcsere(self, u: int, v: int) -> None:
+        """
+        The mirror of El.konjugalasaval_sorrend_modositas: u directly precedes v on their machine,
+        and after it v will directly precede u.
+        """
+        gepen_elozo: array = self.gepen_elozo; gepen_koveto: array = self.gepen_koveto
+        assert gepen_koveto[u] == v, 'Alert szomszedcsere, the operations are not neighbours.'
+        elso: int = gepen_elozo[u]
+        utolso: int = gepen_koveto[v]
+        if elso >= 0: gepen_koveto[elso] = v
+        gepen_elozo[u] = v; gepen_koveto[u] = utolso
+        gepen_elozo[v] = elso; gepen_koveto[v] = u
+        if utolso >= 0: gepen_elozo[utolso] = u
+        if not self.fejek_ervenyesek: return                        # a következő kiértékelés teljes lesz
+        self.valtozas(u, v)                                         # v -> u (u -> v helyett)
+        if elso >= 0: self.valtozas(v, elso)                        # elso -> v (elso -> u helyett)
+        else: self.piszkos_fejek.add(v)
+        if utolso >= 0: self.valtozas(utolso, u)                    # u -> utolso (v -> utolso helyett)
+        else: self.piszkos_farkak.add(u)
+        self.topologikus_atrendezes(v, u)
+    def topologikus_atrendezes(self, x: int, y: int) -> None:
+        """
+        The new edge x -> y contradicts the topological order kept in pozicio.
+        It restores the order locally (the Pearce-Kelly algorithm): the nodes reachable from y
+        and preceding x, and the nodes reaching x and following y are renumbered
+        on their own positions only.
+        """
+        pozicio: array = self.pozicio
+        also: int = pozicio[y]
+        felso: int = pozicio[x]
+        elore: List[int] = []; latott: set = {y}; verem: List[int] = [y]
+        while verem:
+            w: int = verem.pop()
+            elore.append(w)
+            for z in self.rakovetkezo_csucsok(w):
+                assert z != x, 'Alert topologikus_atrendezes, the new edge closes a cycle.'
+                if z not in latott and pozicio[z] < felso:
+                    latott.add(z); verem.append(z)
+        hatra: List[int] = []; latott = {x}; verem = [x]
+        while verem:
+            w = verem.pop()
+            hatra.append(w)
+            for z in self.megelozo_csucsok(w):
+                if z not in latott and pozicio[z] > also:
+                    latott.add(z); verem.append(z)
+        hatra.sort(key=pozicio.__getitem__)
+        elore.sort(key=pozicio.__getitem__)
+        helyek: List[int] = sorted(pozicio[w] for w in hatra + elore)
+        for w, k in zip(hatra + elore, helyek):
+            if pozicio[w] != k:
+                self.nyomvonal.append((pozicio, w, pozicio[w]))
+                pozicio[w] = k
+    def fejek_frissitese(self) -> None:
+        """
+        It recomputes forrastol1, forrastol2 and kritikus_elozo of the nodes whose predecessors
+        have changed, in topological order, and goes on with the successors only where
+        forrastol1 has changed indeed.
+        """
+        forrastol1: array = self.forrastol1; forrastol2: array = self.forrastol2
+        kritikus_elozo: array = self.kritikus_elozo; sorrendi: array = self.kritikus_elozo_sorrendi
+        idotartam: array = self.idotartam; pozicio: array = self.pozicio
+        mk: array = self.megelozo_kezdet; megelozok: array = self.megelozok
+        tobblet: List[List[int]] = self.tobblet_megelozok; gepen_elozo: array = self.gepen_elozo
+        nyomvonal: List[Tuple[array, int, float]] = self.nyomvonal
+        kupac: List[Tuple[int, int]] = [(pozicio[v], v) for v in self.piszkos_fejek if v != self.forras]
+        heapify(kupac)
+        bent: set = {v for _, v in kupac}
+        self.piszkos_fejek.clear()
+        while kupac:
+            _, v = heappop(kupac)
+            bent.discard(v)
+            hossz: float = 0.0 if v == self.nyelo else -1.0
+            krit: int = -1; s: int = 0
+            for j in range(mk[v], mk[v + 1]):
+                if hossz < forrastol2[megelozok[j]] - 1.0e-10:
+                    hossz = forrastol2[megelozok[j]]; krit = megelozok[j]
+            for u in tobblet[v]:
+                if hossz < forrastol2[u] - 1.0e-10:
+                    hossz = forrastol2[u]; krit = u
+            u = gepen_elozo[v]
+            if u >= 0 and hossz < forrastol2[u] - 1.0e-10:
+                hossz = forrastol2[u]; krit = u; s = 1
+            if krit != kritikus_elozo[v] or s != sorrendi[v]:
+                nyomvonal.append((kritikus_elozo, v, kritikus_elozo[v])); nyomvonal.append((sorrendi, v, sorrendi[v]))
+                kritikus_elozo[v] = krit; sorrendi[v] = s
+            if hossz != forrastol1[v]:
+                nyomvonal.append((forrastol1, v, forrastol1[v])); nyomvonal.append((forrastol2, v, forrastol2[v]))
+                forrastol1[v] = hossz
+                forrastol2[v] = hossz + idotartam[v]
+                for w in self.rakovetkezo_csucsok(v):
+                    if w not in bent:
+                        bent.add(w); heappush(kupac, (pozicio[w], w))
+    def farkak_frissitese(self) -> None:
+        """
+        It recomputes nyeloig1 and nyeloig2 of the nodes whose successors have changed,
+        in reverse topological order, and goes on with the predecessors only where
+        nyeloig1 has changed indeed.
+        """
+        nyeloig1: array = self.nyeloig1; nyeloig2: array = self.nyeloig2
+        idotartam: array = self.idotartam; pozicio: array = self.pozicio
+        rk: array = self.rakovetkezo_kezdet; rakovetkezok: array = self.rakovetkezok
+        tobblet: List[List[int]] = self.tobblet_rakovetkezok; gepen_koveto: array = self.gepen_koveto
+        nyomvonal: List[Tuple[array, int, float]] = self.nyomvonal
+        kupac: List[Tuple[int, int]] = [(-pozicio[u], u) for u in self.piszkos_farkak if u != self.nyelo]
+        heapify(kupac)
+        bent: set = {u for _, u in kupac}
+        self.piszkos_farkak.clear()
+        while kupac:
+            _, u = heappop(kupac)
+            bent.discard(u)
+            hossz: float = 0.0 if u == self.forras else -1.0
+            for j in range(rk[u], rk[u + 1]):
+                hossz = max(hossz, nyeloig1[rakovetkezok[j]])
+            for v in tobblet[u]:
+                hossz = max(hossz, nyeloig1[v])
+            if gepen_koveto[u] >= 0:
+                hossz = max(hossz, nyeloig1[gepen_koveto[u]])
+            if hossz != nyeloig2[u]:
+                nyomvonal.append((nyeloig2, u, nyeloig2[u]))
+                nyeloig2[u] = hossz
+            if hossz + idotartam[u] != nyeloig1[u]:
+                nyomvonal.append((nyeloig1, u, nyeloig1[u]))
+                nyeloig1[u] = hossz + idotartam[u]
+                for w in self.megelozo_csucsok(u):
+                    if w not in bent:
+                        bent.add(w); heappush(kupac, (-pozicio[w], w))
+
+    # Kötegelt kiértékelés: sok, egymástól csak egy-egy szomszédcserében eltérő sorrend kritikus úthossza
+    # egy hívásban. A cserék közös kiindulása a mostani fejek; egy-egy csere után csak a fordított
+    # műveletpártól lefelé eső csúcsokat számoljuk újra, majd a nyomvonalon visszagörgetünk.
+    def csere_kort_zarna(self, u: int, v: int) -> bool:
+        """
+        True, if v is reachable from u not only through the machine arc u -> v,
+        so the swap of the neighbours u, v would close a cycle. It expects valid pozicio values:
+        only the nodes between u and v in the topological order are visited.
+        """
+        assert self.gepen_koveto[u] == v, 'Alert csere_kort_zarna, the operations are not neighbours.'
+        pozicio: array = self.pozicio
+        felso: int = pozicio[v]
+        kovetok: List[int] = self.rakovetkezo_csucsok(u)[:-1]      # a gépi él (u -> v) az utolsó
+        latott: set = {u}
+        while kovetok:
+            z: int = kovetok.pop()
+            if z == v:
+                return True
+            if z not in latott and pozicio[z] < felso:
+                latott.add(z)
+                kovetok.extend(self.rakovetkezo_csucsok(z))
+        return False
+    def cserek_kiertekelese(self, parok: Sequence[Tuple[int, int]],
+                            utak: List[List[int]] | None = None) -> List[float]:
+        """
+        It serves the length of the critical path after each swap of the neighbours (u, v) of parok
+        (u directly precedes v on their machine), one by one, relative to the recent order,
+        which is kept. A swap closing a cycle gets math.inf (it has no schedule at all). If utak is given, the critical path
+        of each swap (the nodes from the first operation to the last one) is appended to it.
+        The heads must be valid (fejek_ervenyesek); the dirty tails are kept for the next evaluation.
+        """
+        assert self.fejek_ervenyesek, 'Alert cserek_kiertekelese, the heads are not valid.'
+        self.fejek_frissitese()
+        gepen_elozo: array = self.gepen_elozo; gepen_koveto: array = self.gepen_koveto
+        kritikus_elozo: array = self.kritikus_elozo
+        nyomvonal: List[Tuple[array, int, float]] = self.nyomvonal
+        jel: int = len(nyomvonal)
+        piszkos_farkak: set = set(self.piszkos_farkak)
+        ret_val: List[float] = []
+        for u, v in parok:
+            if self.csere_kort_zarna(u, v):
+                ret_val.append(inf)
+                if utak is not None: utak.append([])
+                continue
+            elso: int = gepen_elozo[u]
+            self.szomszedcsere(u, v)
+            self.fejek_frissitese()
+            ret_val.append(self.forrastol1[self.nyelo])
+            if utak is not None:
+                ut: List[int] = []
+                k: int = kritikus_elozo[self.nyelo]
+                while k >= 0 and k != self.forras:
+                    ut.append(k)
+                    k = kritikus_elozo[k]
+                ut.reverse()
+                utak.append(ut)
+            utolso: int = gepen_koveto[u]                           # a gépi sorrend visszaállítása
+            if elso >= 0: gepen_koveto[elso] = u
+            gepen_elozo[u] = elso; gepen_koveto[u] = v
+            gepen_elozo[v] = u; gepen_koveto[v] = utolso
+            if utolso >= 0: gepen_elozo[utolso] = v
+            while len(nyomvonal) > jel:
+                tomb, k, ertek = nyomvonal.pop()
+                tomb[k] = ertek
+            self.piszkos_farkak = set(piszkos_farkak)
+        return ret_val
+
 class Diszjunktiv_graf:
     """
     This class represents the first level of class and sub-classes,
@@ -96,10 +548,35 @@ class Diszjunktiv_graf:
         self.gep_muveletszama: List[int] =  [-999] * gepszam                                    #: int          ARRAY
         self.gep_elso_muvelete: List[int] =  [-999] * gepszam                                   #: int          ARRAY
         self.aktualis_opt_atfutasi_ido: float = 0.0                # 27. origin sor
+        self.tomor: Tomor_graf | None = None                        # see tomor_graf_felepitese()
+        self.tomor_csucsok: List[Muveletcsucs] = []                 # belso_index -> Muveletcsucs
+        self.tomor_motor: bool = False  # True: kritikus_ut_odafele és kritikus_uthosszak_visszafele a Tomor_graf-on fut
+                                        # (a tömör tároló ellenőrzésére; a teljes menetei nem gyorsabbak az objektumosnál)
+        self.inkrementalis_motor: bool = True   # True: a kiértékelés csak a megváltozott részt számolja újra (Tomor_graf)
+        self.bemenet: DgStandardInput | None = None # None: a dg_standard_input modul globális inputja (my_dict_for_input)
+        self.technologiai_elozok: List[int] = []    # bithalmazok belso_index szerint (lásd technologiai_elerhetoseg_felepitese)
+    def bemenet_inint(self) -> int:
+        """
+        It serves an int from the own input (bemenet) if there is one, otherwise from the global input.
+        """
+        return dg_inint() if self.bemenet is None else self.bemenet.dg_inint()
+    def bemenet_inreal(self) -> float:
+        """
+        It serves a float from the own input (bemenet) if there is one, otherwise from the global input.
+        """
+        return dg_inreal() if self.bemenet is None else self.bemenet.dg_inreal()
+    def bemenet_intext_if_any(self) -> str:
+        """
+        It serves the optional text item of the recent line of the own input (bemenet)
+        if there is one, otherwise of the global input.
+        """
+        return dg_intext_if_any() if self.bemenet is None else self.bemenet.dg_intext_if_any()
     def kritikus_ut_odafele(self) -> None:
-        elintezettek: List[Muveletcsucs] = []                                                   #: Muveletcsucs LIST
+        if self.tomor_motor:
+            self.tomor_kritikus_ut_odafele()
+            return
+        elintezettek: Deque[Muveletcsucs] = deque()                                            #: Muveletcsucs LIST (FIFO)
         elintezett_csucs: Muveletcsucs | None = None
-        csatolo: Csatlakozas | None = None
         hossz: float = 0.0
         self.torles()
         assert self.forras
@@ -117,21 +594,20 @@ class Diszjunktiv_graf:
                     muvelet.beerkezettek = 0
                     elintezettek.append(muvelet)                    # INTO
                     muvelet.forrastol2 = muvelet.forrastol1 + muvelet.idotartam
-        while len(elintezettek) > 0:                                # EMPTY
-            elintezett_csucs = cast(Muveletcsucs, dg_first(elintezettek))   # FIRST   Itt elintezettek[0] is jó lenne, mert tudjuk, hogy nem üres a lista
-            elintezettek = elintezettek[1:]                         # OUT     De, ha üres is volna, x = [][1:] egy üres listát ad vissza szépen!
-            csatolo = cast(Csatlakozas, dg_first(elintezett_csucs.rakovetkezok))    # FIRST
+        while elintezettek:                                         # EMPTY
+            elintezett_csucs = elintezettek.popleft()               # FIRST, OUT   O(1) a deque elején (a korábbi elintezettek[1:] az egész listát másolta)
             hossz = elintezett_csucs.forrastol2
-            while csatolo is not None:
+            for csatolo in elintezett_csucs.rakovetkezok:           # FIRST, SUC   a lista sorrendje azonos a láncolás sorrendjével
                 figyelembevetel(csatolo.szomszed, False)            # (sorrendi fixen False ezen az ágon)
-                csatolo = cast(Csatlakozas, csatolo.suc)
             if elintezett_csucs.gepen_koveto is not None:
                 figyelembevetel(elintezett_csucs.gepen_koveto, True) # 84. origin sor    (sorrendi fixen True nem maradhat ezen az ágon, ha itt olyan élek is lehetnek, amelyeknek van technológiai él megfelelőjük is!)
     def kritikus_uthosszak_visszafele(self) -> None:
-        elintezettek: List[Muveletcsucs] = []                                                   #: Muveletcsucs LIST
+        elintezettek: Deque[Muveletcsucs] = deque()                                            #: Muveletcsucs LIST (FIFO)
         elintezett_csucs: Muveletcsucs | None = None
-        csatolo: Csatlakozas | None = None
         hossz: float = 0.0   # self.torles()  itt nincs!!!
+        if self.tomor_motor:
+            self.tomor_kritikus_uthosszak_visszafele()
+            return
         assert self.nyelo
         elintezettek.append(self.nyelo)                             # INTO
         def figyelembevetel(muvelet: Muveletcsucs): # sorrendi itt nincs
@@ -144,57 +620,52 @@ class Diszjunktiv_graf:
                     muvelet.kiindultak = 0
                     elintezettek.append(muvelet)                    # INTO
                     muvelet.nyeloig1 = muvelet.nyeloig2 + muvelet.idotartam
-        while len(elintezettek) > 0:                                # EMPTY
-            elintezett_csucs = cast(Muveletcsucs, dg_first(elintezettek))   # FIRST   Itt elintezettek[0] is jó lenne, mert tudjuk, hogy nem üres a lista
-            elintezettek = elintezettek[1:]                         # OUT     De, ha üres is volna, x = [][1:] egy üres listát ad vissza szépen!
-            csatolo = cast(Csatlakozas, dg_first(elintezett_csucs.megelozok))   # FIRST
+        while elintezettek:                                         # EMPTY
+            elintezett_csucs = elintezettek.popleft()               # FIRST, OUT
             hossz = elintezett_csucs.nyeloig1
-            while csatolo is not None:
+            for csatolo in elintezett_csucs.megelozok:              # FIRST, SUC
                 figyelembevetel(csatolo.szomszed)
-                csatolo = cast(Csatlakozas, csatolo.suc)
             if elintezett_csucs.gepen_elozo is not None:
                 figyelembevetel(elintezett_csucs.gepen_elozo)       # 133. origin sor
     def sorrendisegi_elek_nelkul_uthosszak_odafele(self) -> None:
-        elintezettek: List[Muveletcsucs] = []                                                   #: Muveletcsucs LIST
-        elintezett_csucs: Muveletcsucs | None = None
-        csatolo: Csatlakozas | None = None
+        elintezettek: Deque[Muveletcsucs] = deque()                                            #: Muveletcsucs LIST (FIFO)
+        elintezett_csucs: Muveletcsucs
+        muvelet: Muveletcsucs
         hossz: float = 0.0
         self.torles()
         assert self.forras
         elintezettek.append(self.forras)                            # INTO
-        while len(elintezettek) > 0:                                # EMPTY
-            elintezett_csucs = cast(Muveletcsucs, dg_first(elintezettek))   # FIRST   Itt elintezettek[0] is jó lenne, mert tudjuk, hogy nem üres a lista
-            elintezettek = elintezettek[1:]                         # OUT     De, ha üres is volna, x = [][1:] egy üres listát ad vissza szépen!
-            csatolo = cast(Csatlakozas, dg_first(elintezett_csucs.rakovetkezok))    # FIRST
+        while elintezettek:                                         # EMPTY
+            elintezett_csucs = elintezettek.popleft()               # FIRST, OUT
             hossz = elintezett_csucs.forrastol2
-            while csatolo is not None:
-                csatolo.szomszed.beerkezettek += 1
-                csatolo.szomszed.forrastol1 = max(csatolo.szomszed.forrastol1, hossz)
-                if csatolo.szomszed.beerkezettek == csatolo.szomszed.beerkezok:
-                    csatolo.szomszed.beerkezettek = 0
-                    elintezettek.append(csatolo.szomszed)           # INTO
-                    csatolo.szomszed.forrastol2 = csatolo.szomszed.forrastol1 + csatolo.szomszed.idotartam
-                csatolo = cast(Csatlakozas, csatolo.suc)            # 168. origin sor
+            for csatolo in elintezett_csucs.rakovetkezok:           # FIRST, SUC
+                muvelet = csatolo.szomszed
+                muvelet.beerkezettek += 1
+                muvelet.forrastol1 = max(muvelet.forrastol1, hossz)
+                if muvelet.beerkezettek == muvelet.beerkezok:
+                    muvelet.beerkezettek = 0
+                    elintezettek.append(muvelet)                    # INTO
+                    muvelet.forrastol2 = muvelet.forrastol1 + muvelet.idotartam
+                                                                    # 168. origin sor
     def sorrendisegi_elek_nelkul_uthosszak_visszafele(self) -> None:
-        elintezettek: List[Muveletcsucs] = []                                                   #: Muveletcsucs LIST
-        elintezett_csucs: Muveletcsucs | None = None
-        csatolo: Csatlakozas | None = None
+        elintezettek: Deque[Muveletcsucs] = deque()                                            #: Muveletcsucs LIST (FIFO)
+        elintezett_csucs: Muveletcsucs
+        muvelet: Muveletcsucs
         hossz: float = 0.0   # self.torles()  itt nincs!!!
         assert self.nyelo
         elintezettek.append(self.nyelo)                             # INTO
-        while len(elintezettek) > 0:                                # EMPTY
-            elintezett_csucs = cast(Muveletcsucs, dg_first(elintezettek))   # FIRST   Itt elintezettek[0] is jó lenne, mert tudjuk, hogy nem üres a lista
-            elintezettek = elintezettek[1:]                         # OUT     De, ha üres is volna, x = [][1:] egy üres listát ad vissza szépen!
-            csatolo = cast(Csatlakozas, dg_first(elintezett_csucs.megelozok))   # FIRST
+        while elintezettek:                                         # EMPTY
+            elintezett_csucs = elintezettek.popleft()               # FIRST, OUT
             hossz = elintezett_csucs.nyeloig1
-            while csatolo is not None:
-                csatolo.szomszed.kiindultak += 1
-                csatolo.szomszed.nyeloig2 = max(csatolo.szomszed.nyeloig2, hossz)
-                if csatolo.szomszed.kiindultak == csatolo.szomszed.kiindulok:
-                    csatolo.szomszed.kiindultak = 0
-                    elintezettek.append(csatolo.szomszed)           # INTO
-                    csatolo.szomszed.nyeloig1 = csatolo.szomszed.nyeloig2 + csatolo.szomszed.idotartam
-                csatolo = cast(Csatlakozas, csatolo.suc)            # 202. origin sor
+            for csatolo in elintezett_csucs.megelozok:              # FIRST, SUC
+                muvelet = csatolo.szomszed
+                muvelet.kiindultak += 1
+                muvelet.nyeloig2 = max(muvelet.nyeloig2, hossz)
+                if muvelet.kiindultak == muvelet.kiindulok:
+                    muvelet.kiindultak = 0
+                    elintezettek.append(muvelet)                    # INTO
+                    muvelet.nyeloig1 = muvelet.nyeloig2 + muvelet.idotartam
+                                                                    # 202. origin sor
     def aktualis_optimalis_megoldas_atirasa(self) -> None:
         for k in range(0, self.muveletszam):
             self.muvelet[k].opt_elozo = self.muvelet[k].gepen_elozo
@@ -205,13 +676,14 @@ class Diszjunktiv_graf:
         for k in range(0, self.muveletszam):
             self.muvelet[k].gepen_koveto = self.muvelet[k].opt_koveto
             self.muvelet[k].gepen_elozo = self.muvelet[k].opt_elozo # 223. origin sor
+        self.tomor_ervenytelenites()
     def masodik_ut_forrastol(self, muvelet: Muveletcsucs) -> float:
         masodik_szomszed: Muveletcsucs | None = None
         csatolo: Csatlakozas | None = None
         seged: float = 0.0
         if muvelet.gepen_elozo is not None: masodik_szomszed = muvelet.gepen_elozo.gepen_elozo
         if masodik_szomszed is not None: seged = masodik_szomszed.forrastol2
-        csatolo = cast(Csatlakozas, dg_first(muvelet.megelozok))    # FIRST
+        csatolo = muvelet.megelozok[0] if muvelet.megelozok else None  # FIRST
         while csatolo is not None:
             seged = max(seged, csatolo.szomszed.forrastol2)
             csatolo = cast(Csatlakozas, csatolo.suc)
@@ -222,7 +694,7 @@ class Diszjunktiv_graf:
         seged: float = 0.0
         if muvelet.gepen_koveto is not None: masodik_szomszed = muvelet.gepen_koveto.gepen_koveto
         if masodik_szomszed is not None: seged = masodik_szomszed.nyeloig1
-        csatolo = cast(Csatlakozas, dg_first(muvelet.rakovetkezok)) # FIRST
+        csatolo = muvelet.rakovetkezok[0] if muvelet.rakovetkezok else None  # FIRST
         while csatolo is not None:
             seged = max(seged, csatolo.szomszed.forrastol2)
             csatolo = cast(Csatlakozas, csatolo.suc)
@@ -239,7 +711,7 @@ class Diszjunktiv_graf:
         m: int = 0                                  #    1   helyett  az első gép első művelete (gep_elso_muvelete) 0 lesz!
         for k in range(0, self.gepszam):
             self.gep_elso_muvelete[k] = m
-            self.gep_muveletszama[k] = dg_inint()
+            self.gep_muveletszama[k] = self.bemenet_inint()
             m += self.gep_muveletszama[k]
         assert m == self.muveletszam, (f"Alert! A gépeken szereplő műveletek össz száma ({m}) nem adja ki a teljes műveletszámot ({self.muveletszam})")
         # dg_link_elements(self.muvelet)
@@ -248,24 +720,24 @@ class Diszjunktiv_graf:
         #     megelozo.suc = None                                                              ÉS MÉG MINDIG KÉRDÉS, HA EGYSZERRE, EGY IDŐBEN TÖBB SIMSET LISTÁBAN IS ÉRDEKELT VAGYOK, amelyeknek lehet közös eleme!
         #     self.muvelet[self.gep_elso_muvelete[k]].pred = None                              SZERENCSÉRE, nincs ok aggodalomra, akkor ha Csatlakozas-ba burkoltan LINK-elünk.
         for k in range(0, self.muveletszam):
-            self.muvkod[dg_inint() - 1] = k # a belső 0:muveletszam-1 tartományba képzése a külső 1:muveletszam művelet azonosító tartománynak. VIGYÁZAT! self.muvkod[k] = (dg_inint())  HELYETT fordítva van, és a tartomány is el van tolva eggyel!!!
+            self.muvkod[self.bemenet_inint() - 1] = k # a belső 0:muveletszam-1 tartományba képzése a külső 1:muveletszam művelet azonosító tartománynak. VIGYÁZAT! self.muvkod[k] = (dg_inint())  HELYETT fordítva van, és a tartomány is el van tolva eggyel!!!
         # print("** Az input adatok **")
         # print("** Azon.  Gépje   Időtart.  Megelőzők         **")
         muv: Muveletcsucs
         for k in range(0, self.muveletszam):                        # 284. origin sor
-            m = dg_inint() - 1
+            m = self.bemenet_inint() - 1
             muv = self.muvelet[self.muvkod[m]]    # muv éppen az a művelet, amelynek a tulajdonságait olvassuk
             muv.azonosito = m + 1                               # külső azonosító (1-től kezdődő tartomány!)
-            muv.gepje = dg_inint()                              # külső sorszámozási tartományban (1-től keződően)
-            muv.idotartam = dg_inreal()
-            m = dg_inint() - 1          # technológiailag előzmény műveletek külső azonosítóinak felolvasása a 0-val kezdődő tartományba konvertáltan
+            muv.gepje = self.bemenet_inint()                    # külső sorszámozási tartományban (1-től keződően)
+            muv.idotartam = self.bemenet_inreal()
+            m = self.bemenet_inint() - 1          # technológiailag előzmény műveletek külső azonosítóinak felolvasása a 0-val kezdődő tartományba konvertáltan
             l: List = []                # egyelőre üres a techn. előzmény műveletek listája
             while m >= 0:
                 l.append(m+1)           # technológiailag előzmény művelet külső azonosítója
                 m = self.muvkod[m]      # technológiailag előzmény művelet belső indexe
                 muv.megelozok.append(Csatlakozas(self.muvelet[m]))
                 self.muvelet[m].rakovetkezok.append(Csatlakozas(muv))
-                m = dg_inint() - 1      # technológiailag előzmény műveletek külső azonosítóinak folytatólagos olvasása a 0-val kezdődő tartományba konvertáltan
+                m = self.bemenet_inint() - 1      # technológiailag előzmény műveletek külső azonosítóinak folytatólagos olvasása a 0-val kezdődő tartományba konvertáltan
             # print((f"[{muv.azonosito:6}, {muv.gepje:6}, {muv.idotartam:8.2f},   {str(l)} {' ' * (17-len(str(l)))}]")) # l szerepel (a külső művelet-azonosító int értékekkel) itt a muv.megelozok helyett, ami egy komplexebb lista
         # dg_close_input()
         for k in range(0, self.muveletszam):                        # 306. origin sor
@@ -280,57 +752,218 @@ class Diszjunktiv_graf:
             muv = self.muvelet[k]    # muv az a művelet, amelynél néhány db szám nyilvántartó attribútumot kitöltünk
             muv.kiindulok = len(muv.rakovetkezok)                   # CARDINAL
             muv.beerkezok = len(muv.megelozok)                      # CARDINAL
-            dg_link_elements(muv.megelozok)                         # Link the nodes together for a linked list
-            dg_link_elements(muv.rakovetkezok)                      # Link the nodes together for a linked list
+            dg_link_list(muv.megelozok)                             # Link the nodes together for a linked list
+            dg_link_list(muv.rakovetkezok)                          # Link the nodes together for a linked list
         self.forras.kiindulok = len(self.forras.rakovetkezok)       # CARDINAL
-        dg_link_elements(self.forras.rakovetkezok)                  # Link the nodes together for a linked list
+        dg_link_list(self.forras.rakovetkezok)                      # Link the nodes together for a linked list
         self.nyelo.beerkezok = len(self.nyelo.megelozok)            # CARDINAL
-        dg_link_elements(self.nyelo.megelozok)                      # Link the nodes together for a linked list
+        dg_link_list(self.nyelo.megelozok)                          # Link the nodes together for a linked list
+        self.tomor_graf_felepitese()
+        self.technologiai_elerhetoseg_felepitese()
+
+    def tomor_graf_felepitese(self) -> None:
+        """
+        This method builds the compact (array-backed) store of the graph read (see Tomor_graf).
+        It also numbers the operations, the source and the sink (see Muveletcsucs.belso_index).
+        """
+        assert self.forras and self.nyelo
+        self.tomor_csucsok = self.muvelet + [self.forras, self.nyelo]
+        for k, muv in enumerate(self.tomor_csucsok):
+            muv.belso_index = k
+        self.tomor = Tomor_graf(self.tomor_csucsok)
+    def technologiai_elerhetoseg_felepitese(self) -> None:
+        """
+        This method builds the transitive closure of the technological arcs read (before any sequential edge):
+        bit i of technologiai_elozok[k] is set, if the operation of belso_index i must precede
+        the one of belso_index k through technological arcs (see technologiailag_megelozi).
+        The sets are Python ints, built once in a topological order of the operations (Kahn).
+        They take at most muveletszam² bits. The operations of a cycle (see rigid_check_acyclicity) are left out.
+        """
+        n: int = self.muveletszam
+        elozok: List[int] = [0] * n
+        beerkezok: List[int] = [sum(1 for cs in muv.megelozok if cs.szomszed is not self.forras) for muv in self.muvelet]
+        sor: Deque[int] = deque(k for k in range(n) if beerkezok[k] == 0)
+        while sor:
+            k: int = sor.popleft()
+            bitek: int = elozok[k] | (1 << k)
+            for csatolo in self.muvelet[k].rakovetkezok:
+                j: int = csatolo.szomszed.belso_index
+                if j < n:                                           # nem a nyelő
+                    elozok[j] |= bitek
+                    beerkezok[j] -= 1
+                    if beerkezok[j] == 0:
+                        sor.append(j)
+        self.technologiai_elozok = elozok
+    def technologiailag_megelozi(self, elso: Muveletcsucs, masodik: Muveletcsucs) -> bool:
+        """
+        True, if the operation elso must precede the operation masodik through technological arcs
+        (directly or through other operations). An edge elso->masodik is implied by them then,
+        and its conjugate would close a cycle.
+        """
+        return bool(self.technologiai_elozok[masodik.belso_index] >> elso.belso_index & 1)
+    def tomor_allapot_betoltese(self) -> None:
+        """
+        This method copies the recent order of operations on the machines and
+        the fixed sequential edges (the tail of megelozok and rakovetkezok lists
+        behind the technological arcs) into the compact store.
+        It is needed only when they have been set without the El operations (see tomor_ervenytelenites),
+        because the compact store follows those step by step. The next evaluation must be a full one.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t
+        for k, muv in enumerate(self.tomor_csucsok):
+            t.gepen_elozo[k] = -1 if muv.gepen_elozo is None else muv.gepen_elozo.belso_index
+            t.gepen_koveto[k] = -1 if muv.gepen_koveto is None else muv.gepen_koveto.belso_index
+            db: int = t.megelozo_kezdet[k + 1] - t.megelozo_kezdet[k]
+            t.tobblet_megelozok[k] = [cs.szomszed.belso_index for cs in muv.megelozok[db:]]
+            db = t.rakovetkezo_kezdet[k + 1] - t.rakovetkezo_kezdet[k]
+            t.tobblet_rakovetkezok[k] = [cs.szomszed.belso_index for cs in muv.rakovetkezok[db:]]
+        t.ervenytelenites()                                         # a kritikus_ut_odafele() teszi újra érvényessé
+    def tomor_kritikus_ut_odafele(self) -> None:
+        """
+        kritikus_ut_odafele() on the compact store. The results are written back
+        to the Muveletcsucs objects, as if torles() and kritikus_ut_odafele() had run.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t and self.forras
+        t.kritikus_ut_odafele()
+        csucsok: List[Muveletcsucs] = self.tomor_csucsok
+        for k in range(t.csucsszam - 2):
+            muv: Muveletcsucs = csucsok[k]
+            muv.forrastol1 = t.forrastol1[k]; muv.forrastol2 = t.forrastol2[k]
+            muv.nyeloig2 = -1.0
+            muv.kritikus_elozo = None if t.kritikus_elozo[k] < 0 else csucsok[t.kritikus_elozo[k]]
+            muv.kritikus_elozo_sorrendi = bool(t.kritikus_elozo_sorrendi[k])
+        muv = csucsok[t.nyelo]
+        muv.forrastol1 = t.forrastol1[t.nyelo]; muv.forrastol2 = t.forrastol2[t.nyelo]
+        muv.kritikus_elozo = None if t.kritikus_elozo[t.nyelo] < 0 else csucsok[t.kritikus_elozo[t.nyelo]]
+        muv.kritikus_elozo_sorrendi = bool(t.kritikus_elozo_sorrendi[t.nyelo])
+        self.forras.nyeloig2 = 0.0
+    def tomor_kritikus_uthosszak_visszafele(self) -> None:
+        """
+        kritikus_uthosszak_visszafele() on the compact store. The results are written back
+        to the Muveletcsucs objects. It expects a tomor_kritikus_ut_odafele() run before.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t
+        t.kritikus_uthosszak_visszafele()
+        for k in range(t.csucsszam - 1):                            # a nyelő kimarad
+            muv: Muveletcsucs = self.tomor_csucsok[k]
+            muv.nyeloig1 = t.nyeloig1[k]; muv.nyeloig2 = t.nyeloig2[k]
+
+    def inkrementalis_kritikus_ut_odafele(self) -> None:
+        """
+        It brings forrastol1, forrastol2 and kritikus_elozo up to date in the compact store
+        recomputing only the nodes downstream of the changes since the previous evaluation
+        (see Tomor_graf.fejek_frissitese). Only the values of the sink are written back
+        to the Muveletcsucs objects.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t and self.nyelo
+        if t.fejek_ervenyesek:
+            t.fejek_frissitese()
+        else:
+            t.kritikus_ut_odafele()
+        k: int = t.nyelo
+        self.nyelo.forrastol1 = t.forrastol1[k]; self.nyelo.forrastol2 = t.forrastol2[k]
+        self.nyelo.kritikus_elozo = None if t.kritikus_elozo[k] < 0 else self.tomor_csucsok[t.kritikus_elozo[k]]
+        self.nyelo.kritikus_elozo_sorrendi = bool(t.kritikus_elozo_sorrendi[k])
+    def inkrementalis_uthosszak_visszafele(self) -> None:
+        """
+        It brings nyeloig1 and nyeloig2 up to date in the compact store recomputing only
+        the nodes upstream of the changes (see Tomor_graf.farkak_frissitese).
+        Only the values of the source are written back to the Muveletcsucs objects.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t and self.forras
+        if not t.fejek_ervenyesek:
+            self.inkrementalis_kritikus_ut_odafele()
+        if t.farkak_ervenyesek:
+            t.farkak_frissitese()
+        else:
+            t.kritikus_uthosszak_visszafele()
+        self.forras.nyeloig1 = t.nyeloig1[t.forras]; self.forras.nyeloig2 = t.nyeloig2[t.forras]
+    def cserek_kiertekelese(self, parok: Sequence[Tuple[Muveletcsucs, Muveletcsucs]],
+                            utak: List[List[Muveletcsucs]] | None = None) -> List[float]:
+        """
+        The lengths of the critical path of the orders differing from the recent one in the swap
+        of one pair (kezdet, veg) of neighbours on a machine each, in one call (see Tomor_graf.cserek_kiertekelese).
+        math.inf stands for a swap closing a cycle. If utak is given, the critical path of each
+        (the operations from the source to the sink, without them) is appended to it.
+        The recent order is kept. The compact store must follow it: the El operations of the search
+        keep it so, otherwise tomor_ervenytelenites() must have been called.
+        """
+        t: Tomor_graf | None = self.tomor
+        assert t
+        if not t.fejek_ervenyesek:
+            t.kritikus_ut_odafele()
+        belso_utak: List[List[int]] | None = None if utak is None else []
+        ret_val: List[float] = t.cserek_kiertekelese(
+            [(kezdet.belso_index, veg.belso_index) for kezdet, veg in parok], belso_utak)
+        if utak is not None and belso_utak is not None:
+            utak.extend([self.tomor_csucsok[k] for k in ut] for ut in belso_utak)
+        return ret_val
+    def tomor_nyomvonal_jel(self) -> Tuple[int, int] | None:
+        """
+        The mark of the trail of the compact store to which a backtrack can return later
+        (see Tomor_graf.nyomvonal_jel, Megoldascsucs.nyomvonal_jel).
+        """
+        if self.tomor is None or not self.inkrementalis_motor:
+            return None
+        return self.tomor.nyomvonal_jel()
+    def tomor_visszagorgetes(self, jel: Tuple[int, int] | None) -> None:
+        """
+        It restores the values of the compact store at the mark jel (see Tomor_graf.visszagorgetes).
+        """
+        if self.tomor is not None:
+            self.tomor.visszagorgetes(jel)
+    def tomor_ervenytelenites(self) -> None:
+        """
+        The order on the machines or the fixed edges have been set without the El operations:
+        they are loaded into the compact store, and its next evaluation must be a full one.
+        """
+        if self.tomor is not None:
+            self.tomor_allapot_betoltese()
 
     # The directed graph must be acyclic. It is a rigid test for this. 2024.02:
     def rigid_check_acyclicity(self) -> bool:
         """
-        The directed graph must be acyclic. This methon is a rigid test for this.
-        """
-        def check_for_cycle(cobj: Muveletcsucs, pred: List[Csatlakozas], cpath: List[int], clevel: int, circle: List[int]) -> None:
-            if circle: return
-            if cobj.azonosito in cpath[1:] or len(cpath) > self.muveletszam:
-                circle.extend(cpath)  # Preserve the original circle list
-                return
-            if not pred: return
-            p: int = pred[0].szomszed.azonosito
-            if p == cobj.azonosito:
-                cpath.append(p)
-                circle.extend(cpath)  # Preserve the original circle list
-                return
-            if len(pred) > 1:
-                check_for_cycle(cobj= cobj, pred= pred[1:], cpath= cpath[0:], clevel= clevel, circle = circle)
-            if p < 0:  return # i.g. pred[0].szomszed == self.nyelo
-            if not p in cpath:
-                cpath.append(p)
-                pred = self.muvelet[self.muvkod[p-1]].megelozok # predecessors
-                check_for_cycle(cobj= cobj, pred= pred[0:], cpath= cpath[0:], clevel= clevel + 1, circle = circle)
-            else:
-                i = cpath.index(p)
-                cpath.append(p)
-                # for k in range(i,len(cpath)): circle.append(cpath[k])
-                circle.extend(cpath[i:])  # Preserve the original circle list
-            return
-
+        The directed graph must be acyclic. This method is a rigid test for this.
+        It is a depth-first search along the predecessors (megelozok) with three colours, without recursion,
+        so it takes O(n + m) time even on long chains of operations. A predecessor still on the path
+        of the search closes a cycle, which is printed in the order of the predecessors, e.g. "a,b,c,a"
+        (b is a predecessor of a). The former version enumerated the paths recursively from every operation.
+        """
+        szin: List[int] = [0] * self.muveletszam   # 0: még nem érintett, 1: a keresés útján van, 2: kész
         circle: List[int] = []
-        for o in self.muvelet:
-            circle = []
-            check_for_cycle(cobj= o, pred= o.megelozok[0:], cpath= [o.azonosito], clevel= 1, circle= circle)
+        for kezdo in range(self.muveletszam):
+            if szin[kezdo] != 0:
+                continue
+            szin[kezdo] = 1
+            ut: List[int] = [kezdo]                 # a keresés útja (belső indexek)
+            hely: List[int] = [0]                   # az út csúcsainak a következő vizsgálandó megelőzője
+            while ut and not circle:
+                k: int = ut[-1]
+                megelozok: List[Csatlakozas] = self.muvelet[k].megelozok
+                if hely[-1] == len(megelozok):
+                    szin[k] = 2
+                    ut.pop()
+                    hely.pop()
+                    continue
+                p: int = megelozok[hely[-1]].szomszed.azonosito
+                hely[-1] += 1
+                if p < 0:  continue                 # i.g. the source (forras)
+                j: int = self.muvkod[p-1]
+                if szin[j] == 1:                    # kör: az útnak j-től a végéig tartó szakasza
+                    circle = [self.muvelet[x].azonosito for x in ut[ut.index(j):]] + [p]
+                elif szin[j] == 0:
+                    szin[j] = 1
+                    ut.append(j)
+                    hely.append(0)
             if circle: break
         if circle:
-            # s: str = ""
-            # for oid in circle: s += str(oid) + ","
-            # print(s[0:-1])
-            if circle[0] == circle[-1] and len(circle) >= 2:
-                s: str = ",".join(str(oid) for oid in circle)
-                print("*** The check of acyclicity of the disjunctive graph has failed. An example circle: " + s +" ***")
-            else:
-                print("*** The check of acyclicity of the directed disjunctive graph has totally failed. ***")
+            s: str = ",".join(str(oid) for oid in circle)
+            print("*** The check of acyclicity of the disjunctive graph has failed. An example circle: " + s +" ***")
             return False
         return True
 
@@ -6,16 +6,16 @@ It maintains records of machines states.
 It adds functionalities to the Disjunctive Graph,
 such as specifying the beginning order of the operations on the machines.
 """
-from typing import List, Sequence, cast
+from typing import List, Sequence, Tuple, cast
 
-from dg_link import DgLink
-from dg_link import dg_first
-from dg_link import dg_out
-from dg_link import dg_link_elements
+from dg_link import DgLink, BaseDgHead
+from dg_link import dg_new_head, dg_into, dg_out_last, dg_slots
 
 from diszjunktiv_graf import Muveletcsucs
 from diszjunktiv_graf import Csatlakozas
 from diszjunktiv_graf import Diszjunktiv_graf
+from transzpozicios_tabla import Zobrist_hasitas
+from sorrendi_szabalyok import ALAPERTELMEZETT_SZABALY, Sorrendi_szabaly, szabaly_letrehozasa
 
 class El(DgLink):                                                  # 363. origin sor
     """
@@ -23,6 +23,7 @@ class El(DgLink):                                                  # 363. origin
     The sequential edges define the order of operations on the machines
     in cases where the order is not defined by the initial graph.
     """
+    __slots__ = dg_slots("kezdet", "veg", "delta", "normal")
     def __init__(self, kezdet: Muveletcsucs, veg: Muveletcsucs) -> None:
         super().__init__()
         self.kezdet: Muveletcsucs = kezdet
@@ -41,41 +42,33 @@ class El(DgLink):                                                  # 363. origin
             return ret_val
         except AttributeError:
             return super().__repr__()
-    def behelyezes(self, p_fej) -> None:   # FIGYELEM! ÁLLATIRA figyelni kell, hogy ugyanaz az objektum (muvelet-csucs) ne legyen berakva több LIST-be! Ezen problémával kapcsolatos a Csatlakozas CLASS. !!!!!
-        fej: Sequence[El] = p_fej
-        bentlevo: El | None = cast(El, dg_first(fej))
-        link_index: int = 0
-        while False if bentlevo is None else bentlevo.delta < self.delta:
-            link_index += 1
-            assert bentlevo
-            bentlevo = cast(El, bentlevo.suc)
-        assert isinstance(fej, list) # cast(list, fej)
-        if bentlevo is None: fej.append(self)                       # INTO
-        else: fej.insert(link_index, self)                          # PRECEDE(bentlevo)
-        dg_link_elements(fej)
     def konjugalas(self) -> None:
         self.kezdet, self.veg = self.veg, self.kezdet # (self.kezdet, self.veg) = (self.veg, self.kezdet)   so-called tuple assignment. It's common in Python to omit the parentheses, resulting in the cleaner and more concise syntax. In Kotlin, the statement swaps the values using destructuring declarations an a Pair: self.kezdet, self.veg = self.veg to self.kezdet
-    def eltavolitas(self) -> None:
-        self.kezdet.rakovetkezok = self.kezdet.rakovetkezok[:-1]    # LAST.OUT
-        self.veg.megelozok = self.veg.megelozok[:-1]                # LAST.OUT
-        dg_link_elements(self.kezdet.rakovetkezok); dg_link_elements(self.veg.megelozok)
+    def eltavolitas(self, hasitas: Zobrist_hasitas | None = None) -> None:
+        if hasitas is not None:
+            hasitas.el_eltavolitasa(self.kezdet, self.veg)
+        dg_out_last(self.kezdet.rakovetkezok)                       # LAST.OUT
+        dg_out_last(self.veg.megelozok)                             # LAST.OUT
         self.kezdet.kiindulok -= 1
         self.veg.beerkezok -= 1
-    def fixalas(self, p_fixalt_elek) -> None:
-        fixalt_elek: List[El] = p_fixalt_elek
-        self.kezdet.rakovetkezok.append(Csatlakozas(self.veg))      # INTO
-        self.veg.megelozok.append(Csatlakozas(self.kezdet))         # INTO
-        dg_link_elements(self.kezdet.rakovetkezok); dg_link_elements(self.veg.megelozok)
+    def fixalas(self, p_fixalt_elek, hasitas: Zobrist_hasitas | None = None) -> None:
+        fixalt_elek: BaseDgHead = p_fixalt_elek
+        if hasitas is not None:
+            hasitas.el_fixalasa(self.kezdet, self.veg)
+        dg_into(self.kezdet.rakovetkezok, Csatlakozas(self.veg))    # INTO
+        dg_into(self.veg.megelozok, Csatlakozas(self.kezdet))       # INTO
         self.kezdet.kiindulok += 1
         self.veg.beerkezok += 1
         if self.is_linked():  # 2024-02-27 08:38   Ez egyben kiszedi a szabad élek (szabad_elek) közül!!!
             self.out()
         if self.head: # 2024-02-27 09:14
             assert not self.head, 'Alert fixalas, DgLink elem with head is not linked.'
-        fixalt_elek.append(self); dg_link_elements(fixalt_elek)     # INTO
-    def konjugalasaval_sorrend_modositas(self) -> None:             # 405. origin sor
+        self.into(fixalt_elek)                                      # INTO
+    def konjugalasaval_sorrend_modositas(self, hasitas: Zobrist_hasitas | None = None) -> None:     # 405. origin sor
         elso: Muveletcsucs | None = self.kezdet.gepen_elozo
         utolso: Muveletcsucs | None = self.veg.gepen_koveto
+        if hasitas is not None:                                     # a transzpozíciós tábla kulcsa is kövesse
+            hasitas.szomszedcsere(elso, self.kezdet, self.veg, utolso)
         if elso is not None: elso.gepen_koveto = self.veg
         self.kezdet.gepen_elozo = self.veg
         self.kezdet.gepen_koveto = utolso
@@ -89,7 +82,7 @@ class Gepelem():                                                    # (424. orig
     """
     def __init__(self, gepazon: int) -> None:
         self.gepazon: int = gepazon
-        self.so: List[Muveletcsucs] = [] # Ezek legyenek diszjunkt listák egymáshoz képest!     #: Muveletcsucs LIST
+        self.so: BaseDgHead = dg_new_head() # Ezek legyenek diszjunkt listák egymáshoz képest!     #: Muveletcsucs LIST
         self.utolso: Muveletcsucs | None = None
         self.c: float = 0.0
         self.h: float = 1.0e+300 # 1.8 × 10 a 308-okon in magnitude (a maximális float nagyságrend)
@@ -113,12 +106,18 @@ class Diszjunktiv_graf_manipulacioi(Diszjunktiv_graf):              # 360. origi
     """
     def __init__(self, muveletszam: int, gepszam: int) -> None:
         super().__init__(muveletszam, gepszam)
-        self.fixalt_elek: List[El] = []                             # 421. origin sor           #: El           LIST
+        self.fixalt_elek: BaseDgHead = dg_new_head()       # 421. origin sor           #: El           LIST
+        self.hasitas: Zobrist_hasitas = Zobrist_hasitas(muveletszam)   # a sorrend kulcsa és a fixált élek (lásd Transzpozicios_tabla)
+        self.kezdeti_sorrend_szabalya: str = ALAPERTELMEZETT_SZABALY  # lásd kezdeti_sorrend_felallitasa, dg_portfolio
     def kezdeti_sorrend_felallitasa(self) -> None:
         """
         This method specifies the beginning order of operations.  
         The Disjunctive Graph must be loaded before running (see Diszjunktiv_graf.graf_beolvasasa).
+        Of the operations that can start first on a machine the dispatch rule
+        kezdeti_sorrend_szabalya selects the next one (see sorrendi_szabalyok).
         """
+        szabaly: Sorrendi_szabaly = szabaly_letrehozasa(self.kezdeti_sorrend_szabalya)
+        szabaly.elokeszites(self)
         gepj: Gepelem                                               # 432. origin sor
         sgep: Gepelem
         gep: List[Gepelem] =  [Gepelem(-1)] * self.gepszam                                      #: Gepelem      ARRAY     The elements will be replaced soon
@@ -132,13 +131,12 @@ class Diszjunktiv_graf_manipulacioi(Diszjunktiv_graf):              # 360. origi
         self.torles()
         self.sorrendisegi_elek_nelkul_uthosszak_visszafele()
         assert self.forras
-        csatolo = cast(Csatlakozas, dg_first(self.forras.rakovetkezok)) # FIRST
+        csatolo = self.forras.rakovetkezok[0] if self.forras.rakovetkezok else None # FIRST
         aktmuvelet : Muveletcsucs
         while csatolo is not None:              # a forrás közvetlen rákövetkező műveleteit rárakjuk a gépjeikre:
             aktmuvelet = csatolo.szomszed
             aktgep: Gepelem = gep[aktmuvelet.gepje - 1]             # belső, 0-val kezdődő tartományba konvertálni
-            aktgep.so.append(aktmuvelet)                            # INTO
-            dg_link_elements(aktgep.so) # A műveleteket gépenként különböző sorrendező LIST-be helyezzük. A LIST-eknek, melyekbe csupasz műveleteket pakolunk - disznjunktaknak kell lenniük! Egyelőre ez ezekre a sorrendező LIST-ekre igaz, mert gépenként elkülönülnek a műveletek.
+            aktmuvelet.into(aktgep.so)                              # INTO  A műveleteket gépenként különböző sorrendező LIST-be helyezzük. A LIST-eknek, melyekbe csupasz műveleteket pakolunk - disznjunktaknak kell lenniük! Egyelőre ez ezekre a sorrendező LIST-ekre igaz, mert gépenként elkülönülnek a műveletek.
             aktmuvelet.forrastol1 = 0.0
             aktgep.h = min(aktgep.h, aktmuvelet.idotartam)
             csatolo = cast(Csatlakozas, csatolo.suc)
@@ -149,7 +147,7 @@ class Diszjunktiv_graf_manipulacioi(Diszjunktiv_graf):              # 360. origi
                 if seged > gep[k].h:
                     gepj = gep[k]
                     seged = gepj.h
-            muvj = cast(Muveletcsucs, dg_first(gepj.so))            # 467. origin sor: (2) comment jelű blokk kezdete; FIRST - ilyen most itt biztos hogy van, mert gepj.h nem a végtelen nagy érték már.
+            muvj = cast(Muveletcsucs, gepj.so.first())              # 467. origin sor: (2) comment jelű blokk kezdete; FIRST - ilyen most itt biztos hogy van, mert gepj.h nem a végtelen nagy érték már.
             k = 0    # 1 helyett  (belső sorszámozás miatt)
             while muvj.forrastol1 > gepj.h - 1.0e-10:  # 1e-8 # ITT FEL VAN TÉTELEZVE, hogy, amennyiben ez teljesül, akkor nem az utolsó műveleten állunk a gépre rakott műveletek között. Legelején mindenesetere ez nem teljesül, így a feltételezés egyelőre megáll.
                 muvj = cast(Muveletcsucs, muvj.suc)  # keressük az első olyan elemet, ahol muvj.forrastol1 < gepj.h egy pici tűréssel. A kód feltételezi, hogy van ilyen. Induláskor ez teljesül, mert a forrás rákövetkező műveleteinél forrastol1 = 0, gepj.h pedig > 0
@@ -159,30 +157,22 @@ class Diszjunktiv_graf_manipulacioi(Diszjunktiv_graf):              # 360. origi
                 smuv = cast(Muveletcsucs, smuv.suc)                 # 478. origin sor: (2a) comment jelű blokk kezdete
                 if smuv.forrastol1 > gepj.h - 1.0e-10:  # 1e-8
                     pass
-                elif smuv.nyeloig2 > muvj.nyeloig2 + 1.0e-10:  # 1e-8
-                    muvj = smuv
-                elif smuv.nyeloig2 < muvj.nyeloig2 - 1.0e-10:  # 1e-8
-                    pass
-                elif smuv.forrastol1 < muvj.forrastol1:
-                    muvj = smuv
-                elif smuv.forrastol1 > muvj.forrastol1:
-                    pass
-                elif smuv.idotartam < muvj.idotartam:
-                    muvj = smuv
-                else:
-                    pass                                            # 498. origin sor: (2a) comment jelű blokk vége
-            dg_out(gepj.so, muvj)                                   # OUT      Kivesszük - az ezek szerint csak átmeneti sorrendező LIST-ből - és ténylegesen a gépre rakjuk - aktuálisan - utolsóként
+                elif szabaly.elobbre_valo(smuv, muvj):              # az origin program szabálya: farok_szerint
+                    muvj = smuv                                     # 498. origin sor: (2a) comment jelű blokk vége
+            muvj.out()                                              # OUT      Kivesszük - az ezek szerint csak átmeneti sorrendező LIST-ből - és ténylegesen a gépre rakjuk - aktuálisan - utolsóként
+            assert gepj.utolso is None or not self.technologiailag_megelozi(muvj, gepj.utolso), (
+                f"Alert kezdeti_sorrend_felallitasa! {muvj} must precede {gepj.utolso}.")
             if gepj.utolso is not None: gepj.utolso.gepen_koveto = muvj
             muvj.gepen_elozo = gepj.utolso
             gepj.utolso = muvj
             gepj.c = muvj.forrastol1 + muvj.idotartam
             gepj.h = 1.0e+300                                       # 509. origin sor
-            smuv = cast(Muveletcsucs, dg_first(gepj.so))            # FIRST
+            smuv = cast(Muveletcsucs, gepj.so.first())              # FIRST
             while smuv is not None:
                 smuv.forrastol1 = max(smuv.forrastol1, gepj.c)
                 gepj.h = min(gepj.h, smuv.forrastol1 + smuv.idotartam)
                 smuv = cast(Muveletcsucs, smuv.suc)
-            csatolo = dg_first(muvj.rakovetkezok)                   # FIRST
+            csatolo = muvj.rakovetkezok[0] if muvj.rakovetkezok else None # FIRST
             while csatolo is not None:                              # 522. origin sor: (3) és (4) comment jelű blokk kezdete
                 aktmuvelet = csatolo.szomszed
                 aktmuvelet.beerkezettek += 1
@@ -192,41 +182,72 @@ class Diszjunktiv_graf_manipulacioi(Diszjunktiv_graf):              # 360. origi
                     if aktmuvelet == self.nyelo: nyelo_maradt = True
                     else:                                           # (6) comment jelű blokk kezdete
                         sgep = gep[aktmuvelet.gepje - 1]  # belső, 0-val kezdődő tartományba konvertálni
-                        sgep.so.append(aktmuvelet)                  # INTO
-                        dg_link_elements(sgep.so)
+                        aktmuvelet.into(sgep.so)                    # INTO
                         aktmuvelet.forrastol1 = max(aktmuvelet.forrastol1, sgep.c)
                         sgep.h = min(sgep.h, aktmuvelet.forrastol1 + aktmuvelet.idotartam)
                                                                     # (6), (5) és (4) commentjelű blokk vége
                 csatolo = csatolo.suc                               # (3), (2) és (1) commentjelű blokk vége
         for k in range(self.gepszam):
-            gep[k].utolso.gepen_koveto = None                       # 550. origin sor
+            utolso: Muveletcsucs | None = gep[k].utolso
+            assert utolso
+            utolso.gepen_koveto = None                              # 550. origin sor
+        self.tomor_ervenytelenites()
 
     def el_konjugalasaval_uj_megoldas(self, jelolt: El) -> None:
-        jelolt.konjugalasaval_sorrend_modositas()
+        jelolt.konjugalasaval_sorrend_modositas(self.hasitas)
         jelolt.konjugalas()
         jelolt.normal = False
-        jelolt.fixalas(self.fixalt_elek)
+        jelolt.fixalas(self.fixalt_elek, self.hasitas)
+        if self.tomor is not None:                                  # a Tomor_graf is kövesse (inkrementális motor)
+            self.tomor.szomszedcsere(jelolt.veg.belso_index, jelolt.kezdet.belso_index)
+            self.tomor.el_hozzaadasa(jelolt.kezdet.belso_index, jelolt.veg.belso_index)
     def elek_visszaallitasaval_regi_sorrend(self) -> None:
-        folosleges_el: El = self.fixalt_elek[-1]                    # LAST
+        folosleges_el: El = cast(El, self.fixalt_elek.last())       # LAST
         while folosleges_el.normal:
             # self.fixalt_elek = self.fixalt_elek[:-1]                # LAST OUT
             # dg_link_elements(self.fixalt_elek)
-            assert self.fixalt_elek[-1].head
-            self.fixalt_elek[-1].head.out_last()    # 2024-02-27 09:00 ez még mindig nem a végleges megoldás, a fixalt_elek listája egy  head-be  kellene burkolva legyen
-            folosleges_el.eltavolitas()
-            folosleges_el = self.fixalt_elek[-1]                    # LAST
+            self.fixalt_elek.out_last()                             # LAST OUT
+            folosleges_el.eltavolitas(self.hasitas)
+            if self.tomor is not None:
+                self.tomor.el_elvetele(folosleges_el.kezdet.belso_index, folosleges_el.veg.belso_index)
+            folosleges_el = cast(El, self.fixalt_elek.last())       # LAST
         # self.fixalt_elek = self.fixalt_elek[:-1]                    # LAST OUT   Ezt is kivesszük, de alább rögtön visszatesszük egy módosított formában
         # dg_link_elements(self.fixalt_elek)                          #    2024.02.
-        assert self.fixalt_elek[-1].head
-        self.fixalt_elek[-1].head.out_last()    # 2024-02-27 09:00 ez még mindig nem a végleges megoldás, a fixalt_elek listája egy  head-be  kellene burkolva legyen
-        folosleges_el.konjugalasaval_sorrend_modositas()
-        folosleges_el.eltavolitas()
+        self.fixalt_elek.out_last()                                 # LAST OUT
+        folosleges_el.konjugalasaval_sorrend_modositas(self.hasitas)
+        folosleges_el.eltavolitas(self.hasitas)
         folosleges_el.konjugalas()
         folosleges_el.normal = True
-        folosleges_el.fixalas(self.fixalt_elek)
+        folosleges_el.fixalas(self.fixalt_elek, self.hasitas)
+        if self.tomor is not None:                                  # előbb az élet vesszük el, hogy ne legyen kör
+            self.tomor.el_elvetele(folosleges_el.veg.belso_index, folosleges_el.kezdet.belso_index)
+            self.tomor.szomszedcsere(folosleges_el.veg.belso_index, folosleges_el.kezdet.belso_index)
+            self.tomor.el_hozzaadasa(folosleges_el.kezdet.belso_index, folosleges_el.veg.belso_index)
+    def rogzitett_elek_leirasa(self) -> List[Tuple[int, int, bool]]:
+        """
+        It describes the fixed edges in their order as (kezdet, veg, normal) triplets
+        of external operation identifiers. Together with the beginning order of the operations
+        it defines a node of the solution tree (see rogzitett_elek_visszajatszasa).
+        """
+        return [(el.kezdet.azonosito, el.veg.azonosito, el.normal) for el in self.fixalt_elek]
+    def rogzitett_elek_visszajatszasa(self, elek: Sequence[Tuple[int, int, bool]]) -> None:
+        """
+        It fixes the edges described by rogzitett_elek_leirasa in their order on the beginning order
+        of the operations: a reversed edge (normal is False) is flipped, a normal one is only fixed,
+        because its flip has been undone (see elek_visszaallitasaval_regi_sorrend).
+        """
+        for kezdet, veg, normal in elek:
+            k: Muveletcsucs = self.muvelet[self.muvkod[kezdet - 1]]
+            v: Muveletcsucs = self.muvelet[self.muvkod[veg - 1]]
+            if normal:
+                El(k, v).fixalas(self.fixalt_elek, self.hasitas)
+            else:
+                assert v.gepen_koveto is k, f"The {veg}->{kezdet} edge cannot be flipped."
+                self.el_konjugalasaval_uj_megoldas(El(v, k))
+        self.tomor_ervenytelenites()
     def megmaradt_fixalt_elek_eltavolitasa(self) -> None:
-        while len(self.fixalt_elek) > 0:                            # EMPTY (NOT EMPTY)
-            self.fixalt_elek[-1].eltavolitas()
+        while not self.fixalt_elek.empty():                         # EMPTY (NOT EMPTY)
+            cast(El, self.fixalt_elek.last()).eltavolitas(self.hasitas)
             # self.fixalt_elek = self.fixalt_elek[:-1]                # LAST OUT
-            assert self.fixalt_elek[-1].head
-            self.fixalt_elek[-1].head.out_last()    # 2024-02-27 09:00 ez még mindig nem a végleges megoldás, a fixalt_elek listája egy  head-be  kellene burkolva legyen
+            self.fixalt_elek.out_last()                             # LAST OUT
+        self.tomor_ervenytelenites()
@@ -6,6 +6,8 @@ from typing import List, cast
 
 from diszjunktiv_graf import Muveletcsucs
 from szabad_elek__korlatozas_egy_gepen import Szabad_elek__korlatozas_egy_gepen
+from korlatok import Korlat, ALAPERTELMEZETT_KORLATOK, korlatok_letrehozasa
+from transzpozicios_tabla import Transzpozicios_tabla
 
 class Finomitasok(Szabad_elek__korlatozas_egy_gepen):               # 800. origin sor
     """
@@ -26,8 +28,13 @@ class Finomitasok(Szabad_elek__korlatozas_egy_gepen):               # 800. origi
         self.kisk: float = 0.0
         self.nagyk: float = 0.0
         self.aktualis_optimalis_megvaltozott: bool = False
+        self.korlatok: List[Korlat] = korlatok_letrehozasa(ALAPERTELMEZETT_KORLATOK)   # lásd korlatok_beallitasa
+        self.transzpozicios_tabla: Transzpozicios_tabla = Transzpozicios_tabla()   # kulcsa: self.hasitas.sorrend
     def kiertekeles(self) -> None:
-        self.kritikus_ut_odafele()
+        if self.inkrementalis_motor:        # csak a nyelő értékei kellenek, elég a megváltozott részt újraszámolni
+            self.inkrementalis_kritikus_ut_odafele()
+        else:
+            self.kritikus_ut_odafele()
         assert self.nyelo
         if self.info:
             print("A kiertekeles() során elért kritikus úthossz "
@@ -37,27 +44,49 @@ class Finomitasok(Szabad_elek__korlatozas_egy_gepen):               # 800. origi
             self.aktualis_optimalis_megvaltozott = True
         else: self.aktualis_optimalis_megvaltozott = False
     def korlatozas(self, korlatozas_sikeres: bool) -> bool:
-        segedkisk: float = 0.0
-        segednagyk: float = 0.0
+        """
+        It estimates the length of the critical path from below (kisk) by the strategies
+        of self.korlatok in their order, and stops at the first one that reaches viszonyitasi_alap.
+        Each strategy contributes only through its own estimates: the length of the critical path
+        without the sequential edges counts only if "utak" is selected (see korlatok.Utak_korlat).
+        The per-machine strategies try the machines with the least slack first (see Korlat.gepek_sorrendje);
+        the decision does not depend on the order, only the number of the estimates does.
+        A state whose order has a lower bound proven earlier with a part of its fixed edges reaching
+        viszonyitasi_alap is pruned at once (see transzpozicios_tabla); the greatest estimate of the others
+        is recorded there.
+        """
         j: int = -1 # 0 helyett, igazodva a belső indexeléshez!
+        kulcs: int = self.hasitas.sorrend
+        tarolt: float | None = self.transzpozicios_tabla.kereses(kulcs, self.hasitas)
+        if tarolt is not None and tarolt > self.viszonyitasi_alap - 1.0e-10:
+            self.kisk = tarolt
+            if self.info:
+                print(f"korlatozas_sikeres: True, kisk: {self.kisk:.2f} (transzpozíciós tábla)")
+            return True
         self.sorrendisegi_elek_nelkul_uthosszak_odafele()
         self.sorrendisegi_elek_nelkul_uthosszak_visszafele()
-        assert self.nyelo
-        self.kisk = self.nagyk = self.nyelo.forrastol1
-        if self.kisk > self.viszonyitasi_alap - 1.0e-10:            # nagyobb egyenlő (>=)  (vö. origin 470. sorral!)
-            korlatozas_sikeres = True
-        while not korlatozas_sikeres and j < self.gepszam - 1: # -1, igazodva a belső indexeléshez!
-            j += 1
-            if self.gep_muveletszama[j] >= 2:
-                in_out_attr: List[float] = [segedkisk, segednagyk]
-                self.gepen_korlatozas(j, in_out_attr)
-                segedkisk = in_out_attr[0]
-                segednagyk = in_out_attr[1]
-                if segedkisk > self.kisk:
-                    self.kisk = segedkisk
-                    if self.kisk > self.viszonyitasi_alap - 1.0e-10:
-                        korlatozas_sikeres = True
+        self.valtozott_gepek_megjelolese()
+        self.kisk = self.nagyk = 0.0                # a nyelő úthossza is csak az "utak" stratégiával számít
+        for korlat in self.korlatok:
+            if korlatozas_sikeres:
+                break
+            korlat.hivasok_szama += 1
+            for gep, segedkisk, segednagyk in korlat.becslesek(self):
+                if gep >= 0:
+                    j = gep
+                self.kisk = max(self.kisk, segedkisk)
                 self.nagyk = max(self.nagyk, segednagyk)
+                if self.kisk > self.viszonyitasi_alap - 1.0e-10:    # nagyobb egyenlő (>=)  (vö. origin 470. sorral!)
+                    korlatozas_sikeres = True
+                    korlat.vagasok_szama += 1
+                if korlat.gepenkent:
+                    korlat.tanulas(gep, segedkisk, self.viszonyitasi_alap, korlatozas_sikeres)
+                if korlatozas_sikeres:
+                    break
+            else:
+                if korlat.gepenkent:
+                    j = self.gepszam - 1
+        self.transzpozicios_tabla.rogzites(kulcs, self.hasitas, self.kisk)
         if self.info:
             print(f"korlatozas_sikeres: {korlatozas_sikeres}, "
                   f"kisk: {self.kisk:.2f}, nagyk: {self.nagyk:.2f}, j: {j}, "
@@ -65,6 +94,12 @@ class Finomitasok(Szabad_elek__korlatozas_egy_gepen):               # 800. origi
                                                      if self.viszonyitasi_alap >= 1.0e+299
                                                      else self.viszonyitasi_alap))
         return korlatozas_sikeres
+    def korlatok_beallitasa(self, leiras: str) -> None:
+        """
+        It selects the lower-bound strategies of korlatozas by their names separated by commas
+        (see korlatok.KORLATOK), e.g. "utak,egy_gep,jackson".
+        """
+        self.korlatok = korlatok_letrehozasa(leiras)
     def aktualis_optimalis_megoldas_nyomtatasa(self) -> None:
         smuv: Muveletcsucs | None = None
         self.megmaradt_fixalt_elek_eltavolitasa()
@@ -0,0 +1,92 @@
+"""
+This module serves the budget of the search of the solution tree (see Vezerles.vezerles_aktualizalasa).
+Besides the wall-clock limit (futas_maximalis_ideje of the input), the search may be limited
+by the number of the evaluations, of the backtracks and of the nodes of the solution tree
+(see Megoldasfa.megoldasok_szama), and by the peak resident memory of the process.
+The counters are compared in every iteration. They do not depend on the speed of the machine,
+so a run limited by them can be repeated anywhere with the same result.
+The clock (a monotonic one) and the memory are read only in every ellenorzesi_koz-th iteration.
+"""
+import sys
+from time import monotonic
+from typing import Dict, Tuple
+
+try:
+    import resource                         # nincs Windows alatt
+except ImportError:
+    resource = None                         # type: ignore[assignment]
+
+KERETEK: Dict[str, str] = {
+    "ido": "runtime",
+    "kiertekelesek": "number of evaluations",
+    "visszalepesek": "number of backtracks",
+    "csucsok": "number of solution-tree nodes",
+    "memoria": "resident memory"
+}
+"""
+The budgets by their names, with their descriptions printed when they are exhausted.
+"""
+
+def rezidens_memoria() -> float:
+    """
+    The peak resident memory of the process in MB (0.0, if it cannot be measured on this platform).
+    """
+    if resource is None:
+        return 0.0
+    csucs: float = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    return csucs / (1024.0 * 1024.0) if sys.platform == "darwin" else csucs / 1024.0   # bájt, ill. kB
+
+class Futasi_keret:
+    """
+    This class represents the budget of a search. A limit of 0 means no limit.
+    """
+    def __init__(self, ido: float = 0.0, kiertekelesek: int = 0, visszalepesek: int = 0,
+                 csucsok: int = 0, memoria: float = 0.0, ellenorzesi_koz: int = 64) -> None:
+        self.ido: float = ido                       # másodperc
+        self.kiertekelesek: int = kiertekelesek
+        self.visszalepesek: int = visszalepesek
+        self.csucsok: int = csucsok
+        self.memoria: float = memoria               # MB
+        self.ellenorzesi_koz: int = max(1, ellenorzesi_koz)
+        self.kezdet: float = monotonic()
+        self.hivasok: int = 0
+        self.kimerult: str = ""                     # a kimerült keret neve (lásd KERETEK); "": egyik sem
+    def __repr__(self) -> str:
+        return f"{self.hatarok()} Futasi_keret"
+    def hatarok(self) -> Tuple[int, int, int, float]:
+        """
+        The limits of the counters and of the memory (the time limit comes from the input).
+        """
+        return self.kiertekelesek, self.visszalepesek, self.csucsok, self.memoria
+    def hatarok_beallitasa(self, hatarok: Tuple[int, int, int, float]) -> None:
+        self.kiertekelesek, self.visszalepesek, self.csucsok, self.memoria = hatarok
+    def inditas(self, eltelt: float = 0.0) -> None:
+        """
+        It starts the clock of the budget as if eltelt seconds had passed already.
+        """
+        self.kezdet = monotonic() - eltelt
+        self.hivasok = 0
+        self.kimerult = ""
+    def eltelt_ido(self) -> float:
+        return monotonic() - self.kezdet
+    def ellenorzes(self, kiertekelesek: int, visszalepesek: int, csucsok: int) -> str:
+        """
+        It compares the counters with their limits, and in every ellenorzesi_koz-th call the clock
+        and the memory as well. It serves the name of the budget exhausted ("" if none is).
+        """
+        if self.kimerult:
+            return self.kimerult
+        if 0 < self.kiertekelesek <= kiertekelesek:
+            self.kimerult = "kiertekelesek"
+        elif 0 < self.visszalepesek <= visszalepesek:
+            self.kimerult = "visszalepesek"
+        elif 0 < self.csucsok <= csucsok:
+            self.kimerult = "csucsok"
+        else:
+            self.hivasok += 1
+            if self.hivasok % self.ellenorzesi_koz == 0 or self.hivasok == 1:
+                if 0.0 < self.ido < self.eltelt_ido():
+                    self.kimerult = "ido"
+                elif 0.0 < self.memoria < rezidens_memoria():
+                    self.kimerult = "memoria"
+        return self.kimerult
@@ -0,0 +1,223 @@
+"""
+This module collects the lower-bound strategies of Finomitasok.korlatozas.
+A strategy estimates the length of the critical path from the heads (forrastol1) and
+tails (nyeloig2) left by the path calculations without sequential edges
+(see Diszjunktiv_graf.sorrendisegi_elek_nelkul_uthosszak_odafele and ..._visszafele).
+A run can select and combine them by their names (see KORLATOK), e.g. "utak,egy_gep,jackson",
+in the header of the input or on the command line (see dg_main.py).
+Each strategy counts how often it was asked and how often it pruned the solution tree.
+"""
+from abc import ABC, abstractmethod
+from heapq import heappop, heappush
+from typing import Dict, Iterator, List, Tuple
+
+from dg_exceptions import InputValueError
+from diszjunktiv_graf import Muveletcsucs
+from szabad_elek__korlatozas_egy_gepen import Szabad_elek__korlatozas_egy_gepen
+
+class Korlat(ABC):
+    """
+    This class represents a lower-bound strategy. It is the abstract base of the strategies.
+    The estimates made machine by machine are served by Gepenkenti_korlat.
+    """
+    nev: str = ""
+    gepenkent: bool = False     # True: a becslések gépenként készülnek (lásd Gepenkenti_korlat)
+    simitas: float = 0.2        # a tartalék mozgóátlagának súlya (lásd tanulas)
+    def __init__(self) -> None:
+        self.hivasok_szama: int = 0
+        self.vagasok_szama: int = 0
+        self.gyorstar: Dict[int, Tuple[int, float, float]] = {}    # gép -> (gep_valtozat, alsó, felső)
+        self.gyorstar_talalatok: int = 0
+        self.szuk_keresztmetszet_elore: bool = True     # False: a gépek az indexük sorrendjében jönnek
+        self.tartalek: List[float] = []             # gépenként a viszonyitasi_alap - alsó becslés mozgóátlaga
+        self.gepenkenti_becslesek: List[int] = []
+        self.gepenkenti_vagasok: List[int] = []
+    def __repr__(self) -> str:
+        return f"{self.nev} Korlat"
+    @abstractmethod
+    def becslesek(self, dg: Szabad_elek__korlatozas_egy_gepen) -> Iterator[Tuple[int, float, float]]:
+        """
+        It serves the estimates one after the other as (machine, lower, upper) triplets.
+        The machine is -1 for the estimates not made by one machine. The upper one is 0.0, if there is none.
+        """
+    def gepek_sorrendje(self, dg: Szabad_elek__korlatozas_egy_gepen) -> List[int]:
+        """
+        It serves the machines in the order of their average slack (see tanulas), the bottlenecks first,
+        so a node to be pruned is rejected after one or two machines. Equal slacks keep the index order.
+        """
+        if not self.szuk_keresztmetszet_elore:
+            return list(range(dg.gepszam))
+        return sorted(range(dg.gepszam), key=self.tartalek.__getitem__)
+    def tanulas(self, j: int, also: float, viszonyitasi_alap: float, vagott: bool) -> None:
+        """
+        It updates the moving average of the slack of the machine j after its estimate,
+        and counts the prunes by machine.
+        """
+        if vagott:
+            self.gepenkenti_vagasok[j] += 1
+        if viszonyitasi_alap < 1.0e+299:                # a kezdeti korlátozásnak még nincs viszonyítási alapja
+            self.tartalek[j] += self.simitas * (viszonyitasi_alap - also - self.tartalek[j])
+
+class Gepenkenti_korlat(Korlat):
+    """
+    This class represents a lower-bound strategy made machine by machine (see gepre),
+    on the machines having at least two operations.
+    """
+    gepenkent = True
+    @abstractmethod
+    def gepre(self, dg: Szabad_elek__korlatozas_egy_gepen, j: int) -> Tuple[float, float]:
+        """
+        It serves the lower and the upper estimate (0.0, if there is none) by the machine j alone.
+        """
+    def becslesek(self, dg: Szabad_elek__korlatozas_egy_gepen) -> Iterator[Tuple[int, float, float]]:
+        """
+        The estimate of a machine is taken from gyorstar if none of the heads and tails
+        of its operations has changed since it was made (see dg.gep_valtozat).
+        The machines come in the order of gepek_sorrendje.
+        """
+        if len(self.tartalek) != dg.gepszam:
+            self.tartalek = [0.0] * dg.gepszam
+            self.gepenkenti_becslesek = [0] * dg.gepszam
+            self.gepenkenti_vagasok = [0] * dg.gepszam
+        for j in self.gepek_sorrendje(dg):
+            if dg.gep_muveletszama[j] >= 2:
+                self.gepenkenti_becslesek[j] += 1
+                tarolt: Tuple[int, float, float] | None = self.gyorstar.get(j)
+                if tarolt is not None and tarolt[0] == dg.gep_valtozat[j]:
+                    self.gyorstar_talalatok += 1
+                    yield j, tarolt[1], tarolt[2]
+                else:
+                    also, felso = self.gepre(dg, j)
+                    self.gyorstar[j] = (dg.gep_valtozat[j], also, felso)
+                    yield j, also, felso
+
+class Utak_korlat(Korlat):
+    """
+    The length of the critical path without the sequential edges (but with the fixed ones).
+    """
+    nev = "utak"
+    def becslesek(self, dg: Szabad_elek__korlatozas_egy_gepen) -> Iterator[Tuple[int, float, float]]:
+        assert dg.nyelo
+        yield -1, dg.nyelo.forrastol1, dg.nyelo.forrastol1
+
+class Fej_farok_korlat(Gepenkenti_korlat):
+    """
+    The plain head + tail bound of a machine: the smallest head, the sum of the durations
+    and the smallest tail of its operations.
+    """
+    nev = "fej_farok"
+    def gepre(self, dg: Szabad_elek__korlatozas_egy_gepen, j: int) -> Tuple[float, float]:
+        muveletek: List[Muveletcsucs] = dg.muvelet[dg.gep_elso_muvelete[j]:
+                                                   dg.gep_elso_muvelete[j] + dg.gep_muveletszama[j]]
+        return (min(muv.forrastol1 for muv in muveletek) + sum(muv.idotartam for muv in muveletek)
+                + min(muv.nyeloig2 for muv in muveletek), 0.0)
+
+class Egy_gep_korlat(Gepenkenti_korlat):
+    """
+    The one-machine bounds of the origin program (see Szabad_elek__korlatozas_egy_gepen.gepen_korlatozas).
+    """
+    nev = "egy_gep"
+    def gepre(self, dg: Szabad_elek__korlatozas_egy_gepen, j: int) -> Tuple[float, float]:
+        in_out_attr: List[float] = [0.0, 0.0]
+        dg.gepen_korlatozas(j, in_out_attr)
+        return in_out_attr[0], in_out_attr[1]
+
+class Jackson_korlat(Gepenkenti_korlat):
+    """
+    Jackson's preemptive schedule bound of a machine: the operations are processed
+    in the order of their tails, a released operation with greater tail interrupts the recent one.
+    The result is the greatest completion time plus tail.
+    """
+    nev = "jackson"
+    def gepre(self, dg: Szabad_elek__korlatozas_egy_gepen, j: int) -> Tuple[float, float]:
+        muveletek: List[Muveletcsucs] = dg.muvelet[dg.gep_elso_muvelete[j]:
+                                                   dg.gep_elso_muvelete[j] + dg.gep_muveletszama[j]]
+        kiadas: List[Muveletcsucs] = sorted(muveletek, key=lambda muv: muv.forrastol1)
+        hatra: Dict[int, float] = {muv.azonosito: muv.idotartam for muv in muveletek}
+        elerhetok: List[Tuple[float, int, Muveletcsucs]] = []   # kupac: (-farok, azonosító, művelet)
+        kovetkezo: int = 0
+        ido: float = 0.0
+        also: float = 0.0
+        while kovetkezo < len(kiadas) or elerhetok:
+            if not elerhetok:
+                ido = max(ido, kiadas[kovetkezo].forrastol1)
+            while kovetkezo < len(kiadas) and kiadas[kovetkezo].forrastol1 <= ido:
+                muv: Muveletcsucs = kiadas[kovetkezo]
+                heappush(elerhetok, (-muv.nyeloig2, muv.azonosito, muv))
+                kovetkezo += 1
+            _, azon, muv = elerhetok[0]
+            kovetkezo_kiadas: float = kiadas[kovetkezo].forrastol1 if kovetkezo < len(kiadas) else 1.0e+300
+            if ido + hatra[azon] <= kovetkezo_kiadas:
+                ido += hatra[azon]
+                heappop(elerhetok)
+                also = max(also, ido + muv.nyeloig2)
+            else:                                                   # megszakítás a következő kiadáskor
+                hatra[azon] -= kovetkezo_kiadas - ido
+                ido = kovetkezo_kiadas
+        return also, 0.0
+
+class Johnson_korlat(Korlat):
+    """
+    A two-machine bound in Johnson's style. For a pair of machines (A, B) it takes
+    technological arcs a -> b with a on A and b on B (each operation at most once).
+    These pairs form a two-machine flow shop; its optimal makespan by Johnson's rule,
+    plus the smallest head on A and the smallest tail on B is a lower bound.
+    """
+    nev = "johnson"
+    def __init__(self) -> None:
+        super().__init__()
+        self.parok: Dict[Tuple[int, int], List[Tuple[Muveletcsucs, Muveletcsucs]]] | None = None
+    def parok_felallitasa(self, dg: Szabad_elek__korlatozas_egy_gepen) -> None:
+        """
+        It collects the pairs of operations for each pair of machines once (the technological arcs do not change).
+        """
+        self.parok = {}
+        foglalt: set = set()
+        for a in dg.muvelet:
+            for csatolo in a.rakovetkezok:                         # a fixált élek egy gépen belül vannak
+                b: Muveletcsucs = csatolo.szomszed
+                if b.azonosito > 0 and b.gepje != a.gepje and (a.gepje, b.gepje, a) not in foglalt \
+                        and (a.gepje, b.gepje, b) not in foglalt:
+                    foglalt.add((a.gepje, b.gepje, a)); foglalt.add((a.gepje, b.gepje, b))
+                    self.parok.setdefault((a.gepje, b.gepje), []).append((a, b))
+        self.parok = {gepek: parok for gepek, parok in self.parok.items() if len(parok) >= 2}
+    def becslesek(self, dg: Szabad_elek__korlatozas_egy_gepen) -> Iterator[Tuple[int, float, float]]:
+        if self.parok is None:
+            self.parok_felallitasa(dg)
+        assert self.parok is not None
+        for parok in self.parok.values():
+            elol: List[Tuple[Muveletcsucs, Muveletcsucs]] = sorted(
+                (p for p in parok if p[0].idotartam < p[1].idotartam), key=lambda p: p[0].idotartam)
+            hatul: List[Tuple[Muveletcsucs, Muveletcsucs]] = sorted(
+                (p for p in parok if p[0].idotartam >= p[1].idotartam), key=lambda p: -p[1].idotartam)
+            ido_a: float = 0.0
+            ido_b: float = 0.0
+            for a, b in elol + hatul:
+                ido_a += a.idotartam
+                ido_b = max(ido_b, ido_a) + b.idotartam
+            yield (-1, min(a.forrastol1 for a, _ in parok) + ido_b + min(b.nyeloig2 for _, b in parok), 0.0)
+
+KORLATOK: Dict[str, type[Korlat]] = {k.nev: k for k in (Utak_korlat, Fej_farok_korlat, Egy_gep_korlat,
+                                                       Jackson_korlat, Johnson_korlat)}
+"""
+The registry of the lower-bound strategies by their names.
+"""
+
+ALAPERTELMEZETT_KORLATOK: str = "utak,egy_gep"
+"""
+The strategies of the origin program.
+"""
+
+def korlatok_letrehozasa(leiras: str) -> List[Korlat]:
+    """
+    It creates the strategies listed in leiras (names separated by commas, see KORLATOK)
+    in the same order.
+    """
+    nevek: List[str] = [nev.strip() for nev in leiras.split(",") if nev.strip()]
+    for nev in nevek:
+        if nev not in KORLATOK:
+            raise InputValueError(f"Unknown lower-bound strategy: {nev!r}. "
+                                  f"The known ones: {', '.join(KORLATOK)}")
+    if not nevek:
+        raise InputValueError("At least one lower-bound strategy is needed.")
+    return [KORLATOK[nev]() for nev in nevek]
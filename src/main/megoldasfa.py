@@ -1,21 +1,25 @@
 """
 This module serves the solution tree.
 """
-from typing import List
+from typing import Sequence, Tuple, cast
 
 from finomitasok                    import Finomitasok
-from dg_link                        import DgLink, dg_link_elements, dg_out
+from dg_link                        import DgLink, BaseDgHead, dg_new_head, dg_slots
+from diszjunktiv_graf               import Muveletcsucs
 from diszjunktiv_graf_manipulacioi  import El
+from szabad_el_tar                  import Szabad_el_tar
 
 
 class Megoldascsucs(DgLink):
     """
     This class represents a "leaf" (node) of the solution tree.  
     """
+    __slots__ = dg_slots("szabad_elek", "sorszam", "nyomvonal_jel")
     def __init__(self) -> None:
         super().__init__()
-        self.szabad_elek: List[El] = []
+        self.szabad_elek: Szabad_el_tar = Szabad_el_tar()   # El LIST helyett (lásd szabad_el_tar)
         self.sorszam: int = 0
+        self.nyomvonal_jel: Tuple[int, int] | None = None  # a Tomor_graf nyomvonala, mielőtt ide léptünk
     def __repr__(self) -> str:
         if self.sorszam == 0:
             return super().__repr__()
@@ -37,46 +41,80 @@ class Megoldasfa(Finomitasok):                                      # 900. origi
     def __init__(self, muveletszam: int, gepszam: int) -> None:
         super().__init__(muveletszam, gepszam)
         self.megoldasok_szama: int = 0
-        self.ag: List[Megoldascsucs] = []    # It will be replaced soon
+        self.ag: BaseDgHead = dg_new_head()    # It will be replaced soon        #: Megoldascsucs LIST
 
     def init_megoldascsucs(self, mcs: Megoldascsucs) -> None:
         self.megoldasok_szama += 1
         mcs.sorszam = self.megoldasok_szama
     def aktualis_megoldascsucs(self) -> Megoldascsucs: # feltételezi, hogy van már! Igen, mindig van, a root-nak mondott megoldás.
-        return self.ag[-1]                                          # LAST
-    def aktualis_szabad_elek(self) -> List[El]:
+        return cast(Megoldascsucs, self.ag.last())                  # LAST
+    def aktualis_szabad_elek(self) -> Szabad_el_tar:
         return self.aktualis_megoldascsucs().szabad_elek
+    def elso_szabad_el(self) -> El:
+        """
+        The first free edge of the recent node, the one taken by uj_megoldas_illesztese_megoldasfara.
+        """
+        return self.aktualis_szabad_elek().elso(self.muvelet)
+    def szabad_elek_beallitasa(self, mcs: Megoldascsucs, leiras: Sequence[Tuple[int, int, float]]) -> None:
+        """
+        It appends the free edges described by Szabad_el_tar.leirasa to the ones of the node mcs.
+        """
+        for kezdet, veg, delta in leiras:
+            mcs.szabad_elek.hozzafuzes(self.muvelet[self.muvkod[kezdet - 1]], self.muvelet[self.muvkod[veg - 1]], delta)
     def szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa(self) -> None:
         self.kritikus_ut_odafele()      #  2024.02. ??? utóbb/utólag beszúrva. Lehet, hogy felesleges, mert mikor ideérünk, előtte megfutott már?
         self.kritikus_uthosszak_visszafele()
         self.felsorakoztatas(self.aktualis_szabad_elek())   # nem hiányzik egy clear() az átadott paraméter List-re???
     def gyokeret_megoldasfaba(self) -> None:
-        self.ag = []
+        self.ag = dg_new_head()
         mcs: Megoldascsucs = Megoldascsucs()
         self.init_megoldascsucs(mcs)
-        self.ag.append(mcs)
-        dg_link_elements(self.ag)              # INTO
-        self.fixalt_elek = []
+        mcs.into(self.ag)                                           # INTO
+        self.fixalt_elek = dg_new_head()
+        self.tomor_ervenytelenites()
+        self.hasitas.ujraszamolas(self.muvelet, self.fixalt_elek)
         self.aktualis_opt_atfutasi_ido = 1.0e+300
+    def ag_visszaallitasa(self, elek: Sequence[Tuple[int, int, bool]],
+                          szabad_elek: Sequence[Sequence[Tuple[int, int, float]]],
+                          sorszamok: Sequence[int]) -> None:
+        """
+        It rebuilds the branch (ag) described by rogzitett_elek_leirasa on the beginning order:
+        a reversed edge starts the next node of the branch, as in uj_megoldas_illesztese_megoldasfara.
+        szabad_elek are the (kezdet, veg, delta) of the free edges left at the nodes,
+        sorszamok their serial numbers (see dg_mentes).
+        """
+        self.gyokeret_megoldasfaba()
+        for kezdet, veg, normal in elek:
+            k: Muveletcsucs = self.muvelet[self.muvkod[kezdet - 1]]
+            v: Muveletcsucs = self.muvelet[self.muvkod[veg - 1]]
+            if normal:
+                El(k, v).fixalas(self.fixalt_elek, self.hasitas)
+            else:
+                assert v.gepen_koveto is k, f"The {veg}->{kezdet} edge cannot be flipped."
+                self.el_konjugalasaval_uj_megoldas(El(v, k))
+                Megoldascsucs().into(self.ag)       # INTO  nyomvonal_jel nélkül: a visszalépés teljes újraszámolást kér
+        assert len(self.ag) == len(szabad_elek) == len(sorszamok)
+        for mcs, elek_leirasa, sorszam in zip(cast(Sequence[Megoldascsucs], self.ag), szabad_elek, sorszamok):
+            mcs.sorszam = sorszam
+            self.szabad_elek_beallitasa(mcs, elek_leirasa)
+        self.tomor_ervenytelenites()
     def van_szabad_el(self) -> bool:
         return len(self.aktualis_szabad_elek()) > 0                 # CARDINAL
     def uj_megoldas_illesztese_megoldasfara(self) -> None:
-        if not self.aktualis_szabad_elek()[0].is_linked() and self.aktualis_szabad_elek()[0].head: # 2024-02-27 09:23
-            assert self.aktualis_szabad_elek()[0].is_linked() or not self.aktualis_szabad_elek()[0].head, (
-                'Alert uj_megoldas_illesztese_megoldasfara! Link is wrong.'
-            )
-        self.el_konjugalasaval_uj_megoldas(self.aktualis_szabad_elek()[0])    # FIRST
+        jel: Tuple[int, int] | None = self.tomor_nyomvonal_jel()
+        self.el_konjugalasaval_uj_megoldas(self.aktualis_szabad_elek().elso_kivetele(self.muvelet))    # FIRST, OUT
         mcs: Megoldascsucs = Megoldascsucs()
         self.init_megoldascsucs(mcs)
-        self.ag.append(mcs)
-        dg_link_elements(self.ag)              # INTO
+        mcs.nyomvonal_jel = jel
+        mcs.into(self.ag)                                           # INTO
         if self.info:
             print(f"*** {self.aktualis_megoldascsucs().sorszam:6}. megoldásra lép ***")
     def gyokerben_vagyok(self) -> bool:
         return len(self.ag) == 1                                    # CARDINAL
     def visszalepes(self) -> None:
         self.elek_visszaallitasaval_regi_sorrend()
-        dg_out(self.ag, self.aktualis_megoldascsucs())              # OUT
+        self.tomor_visszagorgetes(self.aktualis_megoldascsucs().nyomvonal_jel)   # a hosszak visszaállítása
+        self.aktualis_megoldascsucs().out()                         # OUT
         if self.info:
             print(f"--> Visszalépés {self.aktualis_megoldascsucs().sorszam:6}. megoldásra ***")
     # def drop_used_free_edge(self) -> None: # 2024.02.        Erre régen (SIMULA) nem volt valóban szükség, mert a fixált élek közé kerülés automatikusan kivette a LINK elemet a szabad élek közül; így viszont most már, az új DbLink osztállyal itt sem lehet rá szükség!
@@ -0,0 +1,184 @@
+"""
+This module collects the dispatch rules of Diszjunktiv_graf_manipulacioi.kezdeti_sorrend_felallitasa.
+The beginning order is built machine by machine: the machine that can finish an operation first
+gets one of its operations that can start before that; a rule decides which one (see Sorrendi_szabaly.elobbre_valo).
+The rule of the origin program prefers the largest tail, then the earliest head, then the shortest duration.
+A run can try several rules (see dg_portfolio) by their names (see SZABALYOK), e.g. "farok,mwkr,veletlen1",
+on the command line (see dg_main.py).
+"""
+from random import Random
+from typing import Dict, List
+
+from dg_exceptions import InputValueError
+from diszjunktiv_graf import Diszjunktiv_graf, Muveletcsucs
+
+def farok_szerint(muv: Muveletcsucs, masik: Muveletcsucs) -> bool:
+    """
+    The cascade of the origin program: muv precedes masik if its tail (nyeloig2) is larger,
+    or its head (forrastol1) is earlier, or its duration is shorter.
+    """
+    if muv.nyeloig2 > masik.nyeloig2 + 1.0e-10:  # 1e-8
+        return True
+    if muv.nyeloig2 < masik.nyeloig2 - 1.0e-10:  # 1e-8
+        return False
+    if muv.forrastol1 != masik.forrastol1:
+        return muv.forrastol1 < masik.forrastol1
+    return muv.idotartam < masik.idotartam
+
+class Sorrendi_szabaly:
+    """
+    This class represents a dispatch rule. It is the base of the rules:
+    the operation of the greater priority (see prioritas) precedes, the ties are decided by farok_szerint.
+    """
+    nev: str = ""
+    def __repr__(self) -> str:
+        return f"{self.nev} Sorrendi_szabaly"
+    def elokeszites(self, dg: Diszjunktiv_graf) -> None:
+        """
+        It prepares the data of the rule on the graph read, before the beginning order is built.
+        """
+    def prioritas(self, _muv: Muveletcsucs) -> float:
+        """
+        The priority of the operation by the rule. It is the same for all operations by default,
+        so the order is decided by farok_szerint alone (as by Farok_szabaly).
+        """
+        return 0.0
+    def elobbre_valo(self, muv: Muveletcsucs, masik: Muveletcsucs) -> bool:
+        """
+        Whether muv is to be put on the machine before masik.
+        """
+        elso: float = self.prioritas(muv)
+        masodik: float = self.prioritas(masik)
+        if elso != masodik:
+            return elso > masodik
+        return farok_szerint(muv, masik)
+
+class Farok_szabaly(Sorrendi_szabaly):
+    """
+    The rule of the origin program (see farok_szerint).
+    """
+    nev = "farok"
+    def elobbre_valo(self, muv: Muveletcsucs, masik: Muveletcsucs) -> bool:
+        return farok_szerint(muv, masik)
+
+class Spt_szabaly(Sorrendi_szabaly):
+    """
+    Shortest processing time first.
+    """
+    nev = "spt"
+    def prioritas(self, muv: Muveletcsucs) -> float:
+        return -muv.idotartam
+
+class Lpt_szabaly(Sorrendi_szabaly):
+    """
+    Longest processing time first.
+    """
+    nev = "lpt"
+    def prioritas(self, muv: Muveletcsucs) -> float:
+        return muv.idotartam
+
+class Utodok_szabaly(Sorrendi_szabaly):
+    """
+    Most successors first: the number of the operations reachable by technological arcs.
+    """
+    nev = "utodok"
+    def __init__(self) -> None:
+        self.utodok: List[int] = []                 # belso_index -> az utódok bitkészlete
+    def elokeszites(self, dg: Diszjunktiv_graf) -> None:
+        """
+        It collects the successors of the operations as bit sets (bit k: belso_index k)
+        in reverse topological order.
+        """
+        self.utodok = [0] * dg.muveletszam
+        beerkezok: List[int] = [0] * dg.muveletszam
+        for muv in dg.muvelet:
+            for csatolo in muv.rakovetkezok:
+                if csatolo.szomszed.belso_index < dg.muveletszam:
+                    beerkezok[csatolo.szomszed.belso_index] += 1
+        sorrend: List[Muveletcsucs] = [muv for muv in dg.muvelet if beerkezok[muv.belso_index] == 0]
+        for muv in sorrend:                         # a lista bővül bejárás közben (Kahn)
+            for csatolo in muv.rakovetkezok:
+                k: int = csatolo.szomszed.belso_index
+                if k < dg.muveletszam:
+                    beerkezok[k] -= 1
+                    if beerkezok[k] == 0:
+                        sorrend.append(csatolo.szomszed)
+        for muv in reversed(sorrend):
+            for csatolo in muv.rakovetkezok:
+                k = csatolo.szomszed.belso_index
+                if k < dg.muveletszam:
+                    self.utodok[muv.belso_index] |= self.utodok[k] | (1 << k)
+    def prioritas(self, muv: Muveletcsucs) -> float:
+        return self.utodok[muv.belso_index].bit_count()
+
+class Mwkr_szabaly(Utodok_szabaly):
+    """
+    Most work remaining first: the duration of the operation and of all its successors.
+    """
+    nev = "mwkr"
+    def __init__(self) -> None:
+        super().__init__()
+        self.hatralevo_munka: List[float] = []
+    def elokeszites(self, dg: Diszjunktiv_graf) -> None:
+        super().elokeszites(dg)
+        self.hatralevo_munka = [muv.idotartam + sum(dg.muvelet[k].idotartam for k in range(dg.muveletszam)
+                                                    if self.utodok[muv.belso_index] >> k & 1)
+                                for muv in dg.muvelet]
+    def prioritas(self, muv: Muveletcsucs) -> float:
+        return self.hatralevo_munka[muv.belso_index]
+
+class Veletlen_szabaly(Sorrendi_szabaly):
+    """
+    The rule of the origin program with the tails perturbed by at most ±10% at random.
+    Its seed is the number after its name (e.g. "veletlen3"), so a run can be repeated.
+    """
+    nev = "veletlen"
+    def __init__(self, mag: int = 0) -> None:
+        self.mag: int = mag
+        self.szorzok: List[float] = []
+    def __repr__(self) -> str:
+        return f"{self.nev}{self.mag} Sorrendi_szabaly"
+    def elokeszites(self, dg: Diszjunktiv_graf) -> None:
+        veletlen: Random = Random(self.mag)
+        self.szorzok = [veletlen.uniform(0.9, 1.1) for _ in range(dg.muveletszam)]
+    def prioritas(self, muv: Muveletcsucs) -> float:
+        return muv.nyeloig2 * self.szorzok[muv.belso_index]
+
+SZABALYOK: Dict[str, type[Sorrendi_szabaly]] = {k.nev: k for k in (Farok_szabaly, Mwkr_szabaly, Spt_szabaly,
+                                                                  Lpt_szabaly, Utodok_szabaly, Veletlen_szabaly)}
+"""
+The registry of the dispatch rules by their names.
+"""
+
+ALAPERTELMEZETT_SZABALY: str = "farok"
+"""
+The rule of the origin program.
+"""
+
+PORTFOLIO: str = "farok,mwkr,spt,lpt,utodok,veletlen1,veletlen2,veletlen3"
+"""
+The rules tried by the portfolio mode by default (see dg_portfolio).
+"""
+
+def szabaly_letrehozasa(nev: str) -> Sorrendi_szabaly:
+    """
+    It creates the rule named nev (see SZABALYOK); "veletlen" may be followed by its seed.
+    """
+    nev = nev.strip()
+    if nev.startswith(Veletlen_szabaly.nev) and nev[len(Veletlen_szabaly.nev):].isdigit():
+        return Veletlen_szabaly(int(nev[len(Veletlen_szabaly.nev):]))
+    if nev not in SZABALYOK:
+        raise InputValueError(f"Unknown dispatch rule: {nev!r}. "
+                              f"The known ones: {', '.join(SZABALYOK)}")
+    return SZABALYOK[nev]()
+
+def szabalyok_felsorolasa(leiras: str) -> List[str]:
+    """
+    It checks and serves the names of the rules listed in leiras (separated by commas).
+    """
+    nevek: List[str] = [nev.strip() for nev in leiras.split(",") if nev.strip()]
+    for nev in nevek:
+        szabaly_letrehozasa(nev)
+    if not nevek:
+        raise InputValueError("At least one dispatch rule is needed.")
+    return nevek
@@ -0,0 +1,97 @@
+"""
+This module serves the compact store of the free edges of a node of the solution tree (see Megoldascsucs).
+The origin program kept them as El objects in a LIST, so a deep branch kept many El objects alive,
+each one a DgLink as well. Here the free edges of a node are kept in arrays: the internal indices
+of their operations (see Muveletcsucs.belso_index) and their deltas, in increasing order of delta.
+An El object is made only of the first edge, when the branch is taken
+(see Megoldasfa.uj_megoldas_illesztese_megoldasfara).
+"""
+from array import array
+from bisect import bisect_left
+from typing import List, Sequence, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+from diszjunktiv_graf_manipulacioi import El
+
+class Szabad_el_tar:
+    """
+    This class represents the free edges of a node of the solution tree.
+    The edges before elso_helye have been taken already.
+    """
+    __slots__ = ("kezdetek", "vegek", "deltak", "elso_helye", "elso_el")
+    def __init__(self) -> None:
+        self.kezdetek: array = array('i')          # belso_index
+        self.vegek: array = array('i')             # belso_index
+        self.deltak: array = array('d')
+        self.elso_helye: int = 0
+        self.elso_el: El | None = None              # az első él, ha már elkészült (lásd elso)
+    def __len__(self) -> int:
+        return len(self.deltak) - self.elso_helye  # CARDINAL
+    def __repr__(self) -> str:
+        return f"{len(self)} szabad él"
+    def berakas(self, kezdet: Muveletcsucs, veg: Muveletcsucs, delta: float) -> None:
+        """
+        It inserts the edge before the first one whose delta is not smaller, as the origin program did
+        (see Szabad_elek__korlatozas_egy_gepen.felsorakoztatas). The deltas are in increasing order,
+        so the place is found by bisection, and the equal ones keep the order of the origin program.
+        """
+        hely: int = bisect_left(self.deltak, delta, self.elso_helye)
+        if hely == self.elso_helye:
+            self.elso_el = None
+        self.kezdetek.insert(hely, kezdet.belso_index)
+        self.vegek.insert(hely, veg.belso_index)
+        self.deltak.insert(hely, delta)
+    def hozzafuzes(self, kezdet: Muveletcsucs, veg: Muveletcsucs, delta: float) -> None:
+        """
+        It appends the edge at the end (the edges given in their order, see leirasa).
+        """
+        if not self:
+            self.elso_el = None
+        self.kezdetek.append(kezdet.belso_index)
+        self.vegek.append(veg.belso_index)
+        self.deltak.append(delta)
+    def elso(self, muvelet: Sequence[Muveletcsucs]) -> El:
+        """
+        The first free edge as an El object. It is made once, so it is the same object until it is taken.
+        """
+        assert self, "Alert elso! There is no free edge."
+        if self.elso_el is None:
+            i: int = self.elso_helye
+            self.elso_el = El(muvelet[self.kezdetek[i]], muvelet[self.vegek[i]])
+            self.elso_el.delta = self.deltak[i]
+        return self.elso_el
+    def elso_kivetele(self, muvelet: Sequence[Muveletcsucs]) -> El:
+        """
+        It takes the first free edge out (OUT FIRST), and serves it as an El object.
+        """
+        el: El = self.elso(muvelet)
+        self.elso_helye += 1
+        self.elso_el = None
+        if not self:
+            self.uritese()
+        return el
+    def uritese(self) -> None:
+        del self.kezdetek[:]
+        del self.vegek[:]
+        del self.deltak[:]
+        self.elso_helye = 0
+        self.elso_el = None
+    def leirasa(self, muvelet: Sequence[Muveletcsucs]) -> List[Tuple[int, int, float]]:
+        """
+        The (kezdet, veg, delta) of the free edges in their order by the external operation identifiers
+        (see Megoldasfa.szabad_elek_beallitasa).
+        """
+        i: int = self.elso_helye
+        return [(muvelet[k].azonosito, muvelet[v].azonosito, delta)
+                for k, v, delta in zip(self.kezdetek[i:], self.vegek[i:], self.deltak[i:])]
+    def elek(self, muvelet: Sequence[Muveletcsucs]) -> List[El]:
+        """
+        The free edges as new El objects (e.g. to be printed).
+        """
+        elek: List[El] = []
+        i: int = self.elso_helye
+        for k, v, delta in zip(self.kezdetek[i:], self.vegek[i:], self.deltak[i:]):
+            el: El = El(muvelet[k], muvelet[v])
+            el.delta = delta
+            elek.append(el)
+        return elek
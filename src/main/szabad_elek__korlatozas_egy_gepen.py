@@ -2,15 +2,61 @@
 This module manages the 'free edges' in the Disjunctive Graph
 and establishes limits using a single machine.
 """
-from typing import List, Sequence, cast
-
-from dg_link import dg_first, dg_link_elements, dg_out # DgLink,
+from heapq import heappop, heappush
+from math import isinf
+from typing import List, Tuple
 
+from dg_link import BaseDgHead
 from diszjunktiv_graf import Muveletcsucs
 from diszjunktiv_graf_manipulacioi import Diszjunktiv_graf_manipulacioi, El
+from szabad_el_tar import Szabad_el_tar
 
 # f r om dg_main i m port print_cp, print_fixed_edges, print_free_edges körkörös betöltési hibára fut
 
+def egy_gepes_becsles(fej: List[float], farok: List[float], idotartam: List[float]) -> Tuple[float, float]:
+    """
+    The one-machine bounds of Szabad_elek__korlatozas_egy_gepen.gepen_korlatozas in one direction.
+    The operations are scheduled one after the other: among the ones available
+    (whose fej is not greater than the recent time, kulcsszam) the one with the greatest farok goes first,
+    and if there is none available, the one with the smallest fej starts a new block.  
+    Ties are resolved as in the former list-based version: that one kept the operations
+    in decreasing order of farok (the later one before the earlier one on equality), and took
+    the first suitable element of this list.
+
+    Returns:
+        (becsles, max_ut): the lower and the upper bound of the critical path length.
+    """
+    m: int = len(fej)
+    lista: List[int] = sorted(range(m), key=lambda i: (-farok[i], -i))  # a régi fej LIST sorrendje
+    helye: List[int] = [0] * m
+    for hely, k in enumerate(lista):
+        helye[k] = hely
+    kiadas: List[int] = sorted(range(m), key=lambda i: (fej[i], helye[i]))  # a legkisebb fej-ű a LIST-ben legelöl levők közül
+    kovetkezo: int = 0                                          # kiadas-ban az első még el nem érhető
+    elerhetok: List[int] = []                                   # kupac: a LIST-beli helyek
+    kulcsszam: float = 0.0; max_ut: float = 0.0; becsles: float = 0.0; min_kieg: float = 0.0; seged: float = 0.0
+    while kovetkezo < m:                                        # (3) comment jelű blokk kezdete
+        i: int = kiadas[kovetkezo]
+        kovetkezo += 1
+        kulcsszam = fej[i] + idotartam[i]
+        min_kieg = farok[i]
+        seged = kulcsszam + farok[i]
+        if max_ut < seged:
+            max_ut = becsles = seged
+        elif becsles < seged: becsles = seged
+        while True:
+            while kovetkezo < m and fej[kiadas[kovetkezo]] <= kulcsszam:
+                heappush(elerhetok, helye[kiadas[kovetkezo]])
+                kovetkezo += 1
+            if not elerhetok:
+                break
+            i = lista[heappop(elerhetok)]
+            kulcsszam += idotartam[i]
+            max_ut = max(max_ut, kulcsszam + farok[i])
+            min_kieg = min(min_kieg, farok[i])
+            becsles = max(becsles, kulcsszam + min_kieg)
+    return becsles, max_ut                                      # (3) comment jelű blokk vége
+
 class Szabad_elek__korlatozas_egy_gepen(Diszjunktiv_graf_manipulacioi): # 600. origin sor
     """
     This class represents the third level of sub-classes, often referred to
@@ -28,11 +74,31 @@ class Szabad_elek__korlatozas_egy_gepen(Diszjunktiv_graf_manipulacioi): # 600. o
     def __init__(self, muveletszam: int, gepszam: int) -> None:
         super().__init__(muveletszam, gepszam)
         self.info = False
-    def felsorakoztatas(self, fej: Sequence[El]):  # nem hiányzik egy clear() a fej List-re?  # List[DgLink]
+        self.gep_valtozat: List[int] = [0] * gepszam    # nő, ha a gép valamely műveletének feje vagy farka változik
+        self.korlatozott_fej: List[float] = [-2.0] * muveletszam     # a legutóbbi valtozott_gepek_megjelolese() értékei
+        self.korlatozott_farok: List[float] = [-2.0] * muveletszam
+        self.tenyleges_szabad_el_ertekek: bool = False  # True: delta a megfordítás utáni kritikus úthossz (cserek_kiertekelese)
+    def valtozott_gepek_megjelolese(self) -> None:
+        """
+        It increments gep_valtozat of the machines which have an operation whose head (forrastol1)
+        or tail (nyeloig2) has changed since the previous call. The one-machine estimates
+        can be reused while gep_valtozat of their machine is the same (see korlatok.Korlat.gyorstar).
+        """
+        fej: List[float] = self.korlatozott_fej
+        farok: List[float] = self.korlatozott_farok
+        for j in range(self.gepszam):
+            valtozott: bool = False
+            for k in range(self.gep_elso_muvelete[j], self.gep_elso_muvelete[j] + self.gep_muveletszama[j]):
+                muv: Muveletcsucs = self.muvelet[k]
+                if muv.forrastol1 != fej[k] or muv.nyeloig2 != farok[k]:
+                    fej[k] = muv.forrastol1; farok[k] = muv.nyeloig2
+                    valtozott = True
+            if valtozott:
+                self.gep_valtozat[j] += 1
+    def felsorakoztatas(self, fej: Szabad_el_tar):  # nem hiányzik egy clear() a fej List-re?  # List[DgLink]
         kritikus_muvelet: Muveletcsucs
         megelozo_muvelet: Muveletcsucs
         a: float = 0.0; b: float = 0.0; c: float = 0.0
-        szabad_el: El
 
         if self.info:  # 2024.02.
             print("---------- Szabad_elek__korlatozas_egy_gepen.felsorakoztatas() előtt -----------------")     #  These four rows are just for test purpose
@@ -42,128 +108,56 @@ class Szabad_elek__korlatozas_egy_gepen(Diszjunktiv_graf_manipulacioi): # 600. o
 
         assert self.nyelo
         assert self.nyelo.kritikus_elozo
+        jeloltek: List[Tuple[Muveletcsucs, Muveletcsucs, float]] = []
         kritikus_muvelet = self.nyelo.kritikus_elozo
         while kritikus_muvelet != self.forras:                      # ???!!! Diszjunktiv_graf.kritikus_ut_odafele()-re vonatkozik az alábbi:
             if kritikus_muvelet.kritikus_elozo_sorrendi:            # ITT KULCSMOZZANAT VAN! Ne mondjam, hogy a kritikus_elozo sorrendi, ha nem csak a sorrendről szól a dolog, hanem a szimpla technológiai gráf már maga megköveteli az adott egymásra következést. Kritikus útban vagyunk, tehát, a két művelet között más út nem lehet. Következésképpen nem sorrendi, ha megelőzók/rákövetkező viszonylatban egyik a másikra hivatkozik!
                 assert kritikus_muvelet.kritikus_elozo
                 megelozo_muvelet = kritikus_muvelet.kritikus_elozo
-                a = self.masodik_ut_forrastol(kritikus_muvelet) - kritikus_muvelet.forrastol1
-                b = self.masodik_ut_nyeloig(megelozo_muvelet) - megelozo_muvelet.nyeloig2
-                c = kritikus_muvelet.idotartam + megelozo_muvelet.idotartam + a + b
-                a = max(a, b) # if a < b: a = b
-                a = max(a, c) # if a < c: a = c
-                szabad_el = El(megelozo_muvelet, kritikus_muvelet)
-                szabad_el.delta = a
-                szabad_el.behelyezes(fej)
+                if not self.technologiailag_megelozi(megelozo_muvelet, kritikus_muvelet):  # a technológiai élek által kikényszerített él nem szabad
+                    a = self.masodik_ut_forrastol(kritikus_muvelet) - kritikus_muvelet.forrastol1
+                    b = self.masodik_ut_nyeloig(megelozo_muvelet) - megelozo_muvelet.nyeloig2
+                    c = kritikus_muvelet.idotartam + megelozo_muvelet.idotartam + a + b
+                    a = max(a, b) # if a < b: a = b
+                    a = max(a, c) # if a < c: a = c
+                    jeloltek.append((megelozo_muvelet, kritikus_muvelet, a))
                 kritikus_muvelet = megelozo_muvelet
             else:
                 assert kritikus_muvelet.kritikus_elozo
                 kritikus_muvelet = kritikus_muvelet.kritikus_elozo
+        if self.tenyleges_szabad_el_ertekek and jeloltek:          # a becslés helyett a megfordítás tényleges hatása
+            atfutasi_idok: List[float] = self.cserek_kiertekelese([(m, k) for m, k, _ in jeloltek])
+            jeloltek = [(m, k, ertek) for (m, k, _), ertek in zip(jeloltek, atfutasi_idok)
+                        if not isinf(ertek)]                # a kört záró megfordítás nem megoldás
+        for megelozo_muvelet, kritikus_muvelet, a in jeloltek:
+            fej.berakas(megelozo_muvelet, kritikus_muvelet, a)      # El(megelozo_muvelet, kritikus_muvelet).behelyezes(fej) helyett
 
         if self.info:  # 2024.02. (bővítve)
             # print("---------- Után")     #  These four rows are just for test purpose
             # self.print_cp()               It does not changed
-            self.print_free_edges(cast(List[El], fej))
+            self.print_free_edges(fej.elek(self.muvelet))
             # self.print_fixed_edges(self.fixalt_elek)  It does not changed
         # if self.info: print("Szabad él felsorakoztatás megtörtént. Új darabszámuk: {}".format(len(fej)))
                                                                     # CARDINAL  634. origin sor
     def gepen_korlatozas(self, j: int, in_out_attr: List[float]):   # j a kérdéses gép belső azonosítója
-        also: float = in_out_attr[0]
-        felso: float = in_out_attr[1]
-                                                                    # 639. origin sor: (1) comment jelű blokk kezdete
-        fej: List[Muveletcsucs] = [] # Ez legyen diszjunkt lista más listákhoz képest!     #: Muveletcsucs LIST
-        tag: Muveletcsucs | None = None; tag1: Muveletcsucs = Muveletcsucs() # tag1 will be replaced soon
-        kulcsszam: float = 0.0; max_ut: float = 0.0; becsles: float = 0.0; min_kieg: float = 0.0; seged: float = 0.0
-        k: int = 0                                                  # 646. origin sor: (2) comment jelű blokk kezdete
-        link_index: int = 0
-        for k in range(self.gep_elso_muvelete[j], self.gep_elso_muvelete[j] + self.gep_muveletszama[j]): #  - 1 hozzáadása nem kell a range felső határához, mert az maga nyiott felső határú
-            tag = cast(Muveletcsucs, dg_first(fej))                 # FIRST
-            link_index = 0
-            while False if tag is None else tag.nyeloig2 > self.muvelet[k].nyeloig2:
-                link_index += 1
-                assert tag
-                tag = cast(Muveletcsucs, tag.suc)
-            if tag is None:
-                fej.append(self.muvelet[k])                         # INTO
-            else: fej.insert(link_index, self.muvelet[k])           # PRECEDE(tag)
-            dg_link_elements(fej)
-        while len(fej) > 0:                                         # EMPTY (NOT EMPTY)
-            tag = fej[0]                                            # 662. origin sor: (3) comment jelű blokk kezdete; FIRST
-            seged = tag.forrastol1
-            tag1 =tag
-            tag = cast(Muveletcsucs, tag.suc)
-            while tag is not None:
-                if seged > tag.forrastol1:
-                    seged = tag.forrastol1
-                    tag1 = tag
-                tag = cast(Muveletcsucs, tag.suc)
-            dg_out(fej, tag1)                                       # OUT
-            kulcsszam = tag1.forrastol1 + tag1.idotartam
-            min_kieg = tag1.nyeloig2
-            seged = kulcsszam +tag1.nyeloig2
-            if max_ut < seged:
-                max_ut = becsles = seged
-            elif becsles < seged: becsles = seged
-            tag = dg_first(fej)                                     # 686. origin sor; FIRST
-            while False if tag is None else tag.forrastol1 > kulcsszam:
-                tag = tag.suc
-            while tag is not None:
-                dg_out(fej, tag)                                    # OUT
-                kulcsszam += tag.idotartam
-                max_ut = max(max_ut, kulcsszam + tag.nyeloig2)
-                min_kieg = min(min_kieg, tag.nyeloig2)
-                becsles = max(becsles, kulcsszam + min_kieg)
-                tag = dg_first(fej)                                 # 704. origin sor; FIRST
-                while False if tag is None else tag.forrastol1 > kulcsszam:
-                    tag = tag.suc
-                                                                    # 710. origin sor: (3) comment jelű blokk vége
-        also = becsles
-        felso = max_ut
+        """
+        It estimates the length of the critical path by the operations of the machine j alone
+        (one-machine bounds, see egy_gepes_becsles), forward and - if it is not sharp yet - backward.
+        in_out_attr[0] gets the lower, in_out_attr[1] the upper bound.  
+        The former SIMULA-like version kept the operations in a list sorted by insertion
+        and looked for the minimum with full scans; now heaps serve these.
+        """
+        muveletek: List[Muveletcsucs] = self.muvelet[self.gep_elso_muvelete[j]:
+                                                     self.gep_elso_muvelete[j] + self.gep_muveletszama[j]]
+        forrastol: List[float] = [muv.forrastol1 for muv in muveletek]
+        nyeloig: List[float] = [muv.nyeloig2 for muv in muveletek]
+        idotartam: List[float] = [muv.idotartam for muv in muveletek]
+        also, felso = egy_gepes_becsles(forrastol, nyeloig, idotartam)            # 639. origin sor
         if also < felso - 1.0e-10:
-            becsles = max_ut = 0.0                                  # 714. origin sor: (4) comment jelű blokk kezdete
-            for k in range(self.gep_elso_muvelete[j], self.gep_elso_muvelete[j] + self.gep_muveletszama[j]): #  - 1 hozzáadása nem kell a range felső határához, mert az maga nyiott felső határú
-                tag = cast(Muveletcsucs, dg_first(fej))             # 719. origin sor: (5) comment jelű blokk kezdete; FIRST
-                link_index = 0
-                while False if tag is None else tag.forrastol1 > self.muvelet[k].forrastol1:
-                    assert tag
-                    link_index += 1; tag = cast(Muveletcsucs, tag.suc)
-                if tag is None:
-                    fej.append(self.muvelet[k])                     # INTO
-                else: fej.insert(link_index, self.muvelet[k])       # PRECEDE(tag)
-                dg_link_elements(fej)                               # (5) comment jelű blokk vége
-            while len(fej) > 0:                                     # EMPTY (NOT EMPTY)
-                tag = fej[0]                                        # 731. origin sor: (6) comment jelű blokk kezdete; FIRST
-                seged = tag.nyeloig2
-                tag1 =tag
-                tag = cast(Muveletcsucs, tag.suc)
-                while tag is not None:
-                    if seged > tag.nyeloig2:
-                        seged = tag.nyeloig2
-                        tag1 = tag
-                    tag = cast(Muveletcsucs, tag.suc)
-                dg_out(fej, tag1)                                   # 746. origin sor: OUT
-                kulcsszam = tag1.nyeloig2 + tag1.idotartam
-                min_kieg = tag1.forrastol1
-                seged = kulcsszam +tag1.forrastol1
-                if max_ut < seged:
-                    max_ut = becsles = seged
-                elif becsles < seged: becsles = seged
-                tag = dg_first(fej)                                 # 755. origin sor; FIRST
-                while False if tag is None else tag.nyeloig2 > kulcsszam:
-                    tag = tag.suc
-                while tag is not None:
-                    dg_out(fej, tag)                                # 764. origin sor: OUT
-                    kulcsszam += tag.idotartam
-                    max_ut = max(max_ut, kulcsszam + tag.forrastol1)
-                    min_kieg = min(min_kieg, tag.forrastol1)
-                    becsles = max(becsles, kulcsszam + min_kieg)
-                    tag = dg_first(fej)                             # 774. origin sor; FIRST
-                    while False if tag is None else tag.nyeloig2 > kulcsszam:
-                        tag = tag.suc
-                                                                    # 780. origin sor: (6) comment jelű blokk vége
+            becsles, max_ut = egy_gepes_becsles(nyeloig, forrastol, idotartam)    # 714. origin sor
             also = max(also, becsles)
             felso = min(felso, max_ut)
-        in_out_attr[0] = also; in_out_attr[1] = felso           # 785. origin sor: (4), (2) és (1) comment jelű blokkok vége
+        in_out_attr[0] = also; in_out_attr[1] = felso           # 785. origin sor
 
     # # Functions for test (treadmill)  2024.02.
     # f r om diszjunktiv_graf i m port Diszjunktiv_graf, Muveletcsucs
@@ -187,7 +181,7 @@ class Szabad_elek__korlatozas_egy_gepen(Diszjunktiv_graf_manipulacioi): # 600. o
         for e in szabad_elek:
             l.append(repr(e))
         print(f"Szabad élek száma: {len(l)}, listája: {str(l)}")
-    def print_fixed_edges(self, fixalt_elek: List[El]) -> None:
+    def print_fixed_edges(self, fixalt_elek: BaseDgHead) -> None:
         l: List[str] = []
         for e in fixalt_elek:
             l.append(repr(e))
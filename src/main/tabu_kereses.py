@@ -0,0 +1,125 @@
+"""
+This module serves the tabu search run on the beginning order before the search of the solution tree.
+Its best order becomes the first incumbent (aktualis_opt_atfutasi_ido and the opt_elozo, opt_koveto
+pointers, see Diszjunktiv_graf.aktualis_optimalis_megoldas_atirasa), so Finomitasok.korlatozas
+prunes from the beginning against a tighter upper bound.
+A step swaps two neighbouring operations of a critical block, i.e. of a run of operations
+of one machine on the critical path (see Tabu_kereses.lepesek).
+The swap reversed last is tabu for some steps, unless it gives a better order than the best one.
+The search is limited in time and by the number of the steps without improvement.
+"""
+from collections import deque
+from math import isinf
+from time import monotonic
+from typing import Deque, List, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+from diszjunktiv_graf_manipulacioi import Diszjunktiv_graf_manipulacioi, El
+
+class Tabu_kereses:
+    """
+    This class represents the tabu search on the order of the operations of a Disjunctive Graph.
+    The graph keeps its order (the beginning order) at the end; only the best order is recorded.
+    """
+    def __init__(self, dg: Diszjunktiv_graf_manipulacioi, ido: float,
+                 tabu_hossz: int = 8, javitas_nelkuli_lepesek: int = 200) -> None:
+        self.dg: Diszjunktiv_graf_manipulacioi = dg
+        self.ido: float = ido                               # legfeljebb ennyi másodperc
+        self.tabu: Deque[Tuple[int, int]] = deque(maxlen=tabu_hossz)   # (a, b): a ne kerüljön újra közvetlenül b elé
+        self.javitas_nelkuli_lepesek: int = javitas_nelkuli_lepesek
+        self.lepesek_szama: int = 0
+        self.kiertekelesek_szama: int = 0
+        self.legjobb: float = 1.0e+300
+    def kritikus_blokkok(self) -> List[List[Muveletcsucs]]:
+        """
+        It serves the critical blocks along the critical path (see Diszjunktiv_graf.kritikus_ut_odafele)
+        from the source to the sink. A block of one operation is not served.
+        """
+        dg: Diszjunktiv_graf_manipulacioi = self.dg
+        assert dg.nyelo
+        blokkok: List[List[Muveletcsucs]] = []
+        blokk: List[Muveletcsucs] = []
+        muv: Muveletcsucs | None = dg.nyelo.kritikus_elozo
+        while muv is not None and muv != dg.forras:
+            blokk.append(muv)
+            if not muv.kritikus_elozo_sorrendi:             # a blokk eleje (technológiai él vagy a forrás előzi)
+                if len(blokk) >= 2:
+                    blokk.reverse()
+                    blokkok.append(blokk)
+                blokk = []
+            muv = muv.kritikus_elozo
+        blokkok.reverse()
+        return blokkok
+    def lepesek(self) -> List[Tuple[Muveletcsucs, Muveletcsucs]]:
+        """
+        It serves the neighbouring pairs of the critical blocks to be swapped.
+        The N5 neighbourhood would keep only the first and the last pair of the blocks:
+        the others cannot shorten the critical path in a job shop, but they can here,
+        where the technological arcs form an arbitrary acyclic graph.
+        """
+        return [(blokk[i], blokk[i + 1]) for blokk in self.kritikus_blokkok() for i in range(len(blokk) - 1)]
+    def atfutasi_ido(self) -> float:
+        """
+        The length of the critical path of the recent order (0.0 if the order has a cycle).
+        """
+        self.dg.kritikus_ut_odafele()
+        self.kiertekelesek_szama += 1
+        assert self.dg.nyelo
+        return self.dg.nyelo.forrastol1
+    def csere(self, kezdet: Muveletcsucs, veg: Muveletcsucs) -> None:
+        El(kezdet, veg).konjugalasaval_sorrend_modositas(self.dg.hasitas)
+        if self.dg.tomor is not None:                       # a Tomor_graf is kövesse (cserek_kiertekelese)
+            self.dg.tomor.szomszedcsere(kezdet.belso_index, veg.belso_index)
+    def lepesek_kiertekelese(self, lepesek: List[Tuple[Muveletcsucs, Muveletcsucs]]) -> List[float]:
+        """
+        The lengths of the critical path after each step of lepesek (math.inf if the step closes a cycle),
+        in one batch (see Diszjunktiv_graf.cserek_kiertekelese). The recent order is kept.
+        """
+        self.kiertekelesek_szama += len(lepesek)
+        return self.dg.cserek_kiertekelese(lepesek)
+    def kereses(self) -> bool:
+        """
+        It runs the search and serves whether the best order found is better than the beginning one.
+        The best order is recorded only if it is better than aktualis_opt_atfutasi_ido.
+        """
+        dg: Diszjunktiv_graf_manipulacioi = self.dg
+        hatarido: float = monotonic() + self.ido
+        kezdeti_sorrend: List[Tuple[Muveletcsucs | None, Muveletcsucs | None]] = [
+            (muv.gepen_elozo, muv.gepen_koveto) for muv in dg.muvelet]
+        self.legjobb = self.atfutasi_ido()
+        kezdeti: float = self.legjobb
+        javitas_nelkul: int = 0
+        while javitas_nelkul < self.javitas_nelkuli_lepesek and monotonic() < hatarido:
+            legjobb_lepes: Tuple[Muveletcsucs, Muveletcsucs] | None = None
+            legjobb_ertek: float = 1.0e+300
+            lepesek: List[Tuple[Muveletcsucs, Muveletcsucs]] = self.lepesek()
+            for (kezdet, veg), ertek in zip(lepesek, self.lepesek_kiertekelese(lepesek)):
+                if isinf(ertek):                            # kör keletkezett (pozitív időtartamoknál nem lehet)
+                    continue
+                tiltott: bool = (veg.belso_index, kezdet.belso_index) in self.tabu
+                if ertek < legjobb_ertek and (not tiltott or ertek < self.legjobb - 1.0e-10):
+                    legjobb_lepes, legjobb_ertek = (kezdet, veg), ertek
+            if legjobb_lepes is None:                       # minden lépés tiltott: a legrégebbi tiltás feloldása
+                if not self.tabu:
+                    break
+                self.tabu.popleft()
+                self.atfutasi_ido()                         # a kritikus út ismét a jelenlegi sorrendé
+                javitas_nelkul += 1
+                continue
+            kezdet, veg = legjobb_lepes
+            self.csere(kezdet, veg)
+            self.tabu.append((kezdet.belso_index, veg.belso_index))
+            self.lepesek_szama += 1
+            if self.atfutasi_ido() < self.legjobb - 1.0e-10:
+                assert dg.nyelo
+                self.legjobb = dg.nyelo.forrastol1
+                javitas_nelkul = 0
+                if self.legjobb < dg.aktualis_opt_atfutasi_ido:
+                    dg.aktualis_optimalis_megoldas_atirasa()
+            else:
+                javitas_nelkul += 1
+        for muv, (elozo, koveto) in zip(dg.muvelet, kezdeti_sorrend):
+            muv.gepen_elozo, muv.gepen_koveto = elozo, koveto
+        dg.tomor_ervenytelenites()
+        dg.hasitas.ujraszamolas(dg.muvelet, dg.fixalt_elek)
+        return self.legjobb < kezdeti - 1.0e-10
@@ -0,0 +1,190 @@
+"""
+This module serves the transposition table of the solution tree.
+A state of the search is the order of the operations on the machines (gepen_elozo, gepen_koveto)
+together with the fixed sequential edges (see Diszjunktiv_graf_manipulacioi.fixalt_elek).
+The order is identified by a Zobrist-style hash (see Zobrist_hasitas), updated step by step when two
+neighbouring operations are swapped (see El.konjugalasaval_sorrend_modositas). The fixed edges are
+followed step by step as well when an edge is fixed or removed (see El.fixalas, El.eltavolitas).
+
+The table is keyed on the hash of the order (Zobrist_hasitas.sorrend). Each of its entries keeps
+a lower bound proven for the order (see Finomitasok.korlatozas) together with the fixed edges it was proven with.
+More fixed edges leave fewer schedules below a node, so the bound holds whenever the fixed edges
+of the recent state include the stored ones. This way the depth-first search finds the order again
+after a backtrack (the flipped edge is fixed as "normal" then), and prunes it without estimating.
+"""
+from collections import OrderedDict
+from typing import Dict, List, Sequence, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+
+_MASZK: int = (1 << 64) - 1
+
+Lanc = Tuple | None
+"""
+The fixed edges as a persistent stack: (the code of the last edge, the chain of the former ones), None if empty.
+A state keeps its chain without copying it, as the later edges only put new links in front of it.
+"""
+
+def _keveres(x: int) -> int:
+    """
+    The finalizer of SplitMix64: it maps x to a 64-bit pseudo-random value.
+    """
+    x = (x + 0x9E3779B97F4A7C15) & _MASZK
+    x = ((x ^ (x >> 30)) * 0xBF58476D1CE4E5B9) & _MASZK
+    x = ((x ^ (x >> 27)) * 0x94D049BB133111EB) & _MASZK
+    return x ^ (x >> 31)
+
+def lanc_vege(lanc: Lanc, lepes: int) -> Lanc:
+    """
+    The chain lanc without its first lepes links (the state lepes fixed edges before).
+    """
+    for _ in range(lepes):
+        assert lanc is not None
+        lanc = lanc[1]
+    return lanc
+
+class Zobrist_hasitas:
+    """
+    This class represents a state: the hash of the order on the machines (sorrend), that is the XOR
+    of the values of the neighbouring pairs, and the fixed edges (fixalt_elek, fixalt_lanc).
+    An operation is identified by its belso_index, the missing neighbour by muveletszam (the index of the source).
+    The value of a pair is computed, not stored, so the hash needs no table of muveletszam² items.
+    """
+    def __init__(self, muveletszam: int) -> None:
+        self.muveletszam: int = muveletszam
+        self.sorrend: int = 0
+        self.fixalt_elek: Dict[int, int] = {}       # él kódja -> hányszor van fixálva
+        self.fixalt_lanc: Lanc = None
+        self.fixalt_szam: int = 0                   # a fixalt_lanc hossza
+    def _index(self, muv: Muveletcsucs | None) -> int:
+        return self.muveletszam if muv is None else muv.belso_index
+    def szomszedok(self, elozo: Muveletcsucs | None, koveto: Muveletcsucs | None) -> int:
+        """
+        The value of elozo being followed directly by koveto on their machine.
+        """
+        return _keveres(self._index(elozo) * (self.muveletszam + 1) + self._index(koveto))
+    def el_kodja(self, kezdet: Muveletcsucs, veg: Muveletcsucs) -> int:
+        """
+        The code of the fixed edge kezdet -> veg.
+        """
+        return kezdet.belso_index * (self.muveletszam + 1) + veg.belso_index
+    def ujraszamolas(self, muveletek: Sequence[Muveletcsucs], fixalt_elek: Sequence) -> None:
+        """
+        It computes the state from scratch, e.g. after the beginning order is set up
+        or restored without the incremental steps (see Megoldasfa.gyokeret_megoldasfaba).
+        """
+        self.sorrend = 0
+        for muv in muveletek:
+            if muv.gepen_koveto is not None:
+                self.sorrend ^= self.szomszedok(muv, muv.gepen_koveto)
+        self.fixalt_elek = {}
+        self.fixalt_lanc = None
+        self.fixalt_szam = 0
+        for el in fixalt_elek:
+            self.el_fixalasa(el.kezdet, el.veg)
+    def szomszedcsere(self, elso: Muveletcsucs | None, kezdet: Muveletcsucs,
+                      veg: Muveletcsucs, utolso: Muveletcsucs | None) -> None:
+        """
+        It follows the swap of the neighbours kezdet, veg: elso, kezdet, veg, utolso
+        becomes elso, veg, kezdet, utolso on their machine.
+        """
+        if elso is not None:
+            self.sorrend ^= self.szomszedok(elso, kezdet) ^ self.szomszedok(elso, veg)
+        if utolso is not None:
+            self.sorrend ^= self.szomszedok(veg, utolso) ^ self.szomszedok(kezdet, utolso)
+        self.sorrend ^= self.szomszedok(kezdet, veg) ^ self.szomszedok(veg, kezdet)
+    def el_fixalasa(self, kezdet: Muveletcsucs, veg: Muveletcsucs) -> None:
+        """
+        It follows fixing the edge kezdet -> veg as the last one.
+        """
+        kod: int = self.el_kodja(kezdet, veg)
+        self.fixalt_elek[kod] = self.fixalt_elek.get(kod, 0) + 1
+        self.fixalt_lanc = (kod, self.fixalt_lanc)
+        self.fixalt_szam += 1
+    def el_eltavolitasa(self, kezdet: Muveletcsucs, veg: Muveletcsucs) -> None:
+        """
+        It follows removing the last fixed edge kezdet -> veg.
+        """
+        kod: int = self.el_kodja(kezdet, veg)
+        assert self.fixalt_lanc is not None and self.fixalt_lanc[0] == kod, \
+            "Alert el_eltavolitasa! Only the last fixed edge can be removed."
+        if self.fixalt_elek[kod] == 1:
+            del self.fixalt_elek[kod]
+        else:
+            self.fixalt_elek[kod] -= 1
+        self.fixalt_lanc = self.fixalt_lanc[1]
+        self.fixalt_szam -= 1
+    def tartalmazza(self, lanc: Lanc, szam: int) -> bool:
+        """
+        True, if the recent fixed edges include the ones of the chain lanc of szam edges.
+        The two chains are walked from the same distance of their end, so a shared tail is not scanned.
+        """
+        if szam > self.fixalt_szam:
+            return False
+        fixalt_elek: Dict[int, int] = self.fixalt_elek
+        sajat: Lanc = lanc_vege(self.fixalt_lanc, self.fixalt_szam - szam)     # a közös vég azonos láncszemekből áll
+        while lanc is not None:
+            if lanc is sajat:
+                return True
+            if lanc[0] not in fixalt_elek:
+                return False
+            lanc = lanc[1]
+            sajat = None if sajat is None else sajat[1]
+        return True
+
+class Transzpozicios_tabla:
+    """
+    This class represents a bounded table of the lower bounds proven for the orders on the machines
+    (keyed on Zobrist_hasitas.sorrend), each with the chain of the fixed edges it was proven with.
+    When it is full, the least recently used order is dropped. meret == 0 switches it off.
+    """
+    def __init__(self, meret: int = 1 << 16) -> None:
+        self.meret: int = meret
+        self.tarolt: OrderedDict[int, List[Tuple[Lanc, int, float]]] = OrderedDict()   # (lánc, hossza, alsó)
+        self.talalatok: int = 0
+        self.hianyok: int = 0
+        self.kiszoritasok: int = 0
+    def __len__(self) -> int:
+        return len(self.tarolt)
+    def kereses(self, kulcs: int, allapot: Zobrist_hasitas) -> float | None:
+        """
+        It serves the greatest lower bound proven for the order kulcs with fixed edges included
+        in the ones of allapot, or None if there is no such one.
+        """
+        if self.meret == 0:
+            return None
+        also: float | None = None
+        for lanc, szam, tarolt_also in self.tarolt.get(kulcs, ()):
+            if (also is None or also < tarolt_also) and allapot.tartalmazza(lanc, szam):
+                also = tarolt_also
+        if also is None:
+            self.hianyok += 1
+        else:
+            self.talalatok += 1
+            self.tarolt.move_to_end(kulcs)
+        return also
+    def rogzites(self, kulcs: int, allapot: Zobrist_hasitas, also: float) -> None:
+        """
+        It records the lower bound proven for the order kulcs with the fixed edges of allapot.
+        An entry with fewer (or the same) fixed edges and a bound not smaller makes it superfluous,
+        and it makes superfluous the entries with a bound not greater whose chain continues the one of allapot
+        (the chain is kept as it is, in constant time).
+        """
+        if self.meret == 0:
+            return
+        uj: Tuple[Lanc, int, float] = (allapot.fixalt_lanc, allapot.fixalt_szam, also)
+        bejegyzesek: List[Tuple[Lanc, int, float]] | None = self.tarolt.get(kulcs)
+        if bejegyzesek is None:
+            self.tarolt[kulcs] = [uj]
+            if len(self.tarolt) > self.meret:
+                self.tarolt.popitem(last=False)
+                self.kiszoritasok += 1
+            return
+        self.tarolt.move_to_end(kulcs)
+        if any(a >= also and allapot.tartalmazza(l, sz) for l, sz, a in bejegyzesek):
+            return
+        bejegyzesek[:] = [(l, sz, a) for l, sz, a in bejegyzesek            # a mostani élekre épülő láncok fölöslegesek
+                          if not (also >= a and sz >= uj[1] and lanc_vege(l, sz - uj[1]) is uj[0])]
+        bejegyzesek.append(uj)
+    def uritese(self) -> None:
+        self.tarolt.clear()
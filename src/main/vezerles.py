@@ -4,8 +4,9 @@ This module is responsible for controlling the traversal of solution tree.
 
 from datetime import datetime, timedelta
 
+from futasi_keret      import KERETEK, Futasi_keret
 from megoldasfa        import Megoldasfa
-from dg_standard_input import dg_inreal, dg_inint
+from tabu_kereses      import Tabu_kereses
 
 
 class Vezerles(Megoldasfa):                                         # 960. origin sor
@@ -25,6 +26,7 @@ class Vezerles(Megoldasfa):                                         # 960. origi
 
     def __init__(self, muveletszam: int, gepszam: int) -> None:
         super().__init__(muveletszam, gepszam)
+        self.futasi_keret: Futasi_keret = Futasi_keret()
         self.also_felso_korlat_megegyezik: bool = False
         self.idohiany: bool = False
         self.keresesi_stadiumban_tartunk = False
@@ -36,10 +38,26 @@ class Vezerles(Megoldasfa):                                         # 960. origi
         self.ismetelt_korlatozasok_szama: int = 0
         self.sikeres_ismetelt_korlatozasok_szama: int = 0
         self.kezdesi_ido = datetime.now() # Record the start time
-        self.futas_maximalis_ideje: float = 0.0
         self.feladat_also_korlatja: float = 0.0
         self.remenybeli_felso_korlat: float = 0.0
+        self.tabu_kereses_ideje: float = 0.0    # másodperc; 0: nincs tabukeresés a megoldásfa bejárása előtt
 
+    @property
+    def futas_maximalis_ideje(self) -> float:
+        """
+        The wall-clock limit of the search in seconds (0: unlimited), kept by futasi_keret.
+        """
+        return self.futasi_keret.ido
+    @futas_maximalis_ideje.setter
+    def futas_maximalis_ideje(self, ido: float) -> None:
+        self.futasi_keret.ido = ido
+    def kezdesi_ido_beallitasa(self, kezdesi_ido: datetime) -> None:
+        """
+        It sets the start of the search (e.g. the one of the main process in a worker),
+        and restarts the clock of the budget accordingly.
+        """
+        self.kezdesi_ido = kezdesi_ido
+        self.futasi_keret.inditas(self.duration_in_seconds())
     def duration_in_seconds(self) -> float:
         duration: timedelta = datetime.now() - self.kezdesi_ido
         return duration.total_seconds()
@@ -56,16 +74,21 @@ class Vezerles(Megoldasfa):                                         # 960. origi
         return False
     def vezerles_inicializalasa(self) -> None:
         self.kezdesi_ido = datetime.now() # Record the start time
-        self.futas_maximalis_ideje = dg_inreal()
-        self.maximalis_melysegszint = dg_inint()
-        if dg_inint() > 0:
+        self.futas_maximalis_ideje = self.bemenet_inreal()
+        self.futasi_keret.inditas()
+        self.maximalis_melysegszint = self.bemenet_inint()
+        if self.bemenet_inint() > 0:
             self.info = True
+        korlatok_leirasa: str = self.bemenet_intext_if_any()   # opcionális, pl. "utak,egy_gep,jackson" (lásd korlatok.KORLATOK)
+        if korlatok_leirasa:
+            self.korlatok_beallitasa(korlatok_leirasa)
         self.keresesi_stadiumban_tartunk = True
         # print("** Futás maximális ideje (sec), maximális mélységszint, lépésenkénti információ kérése **")
         # print((f"[{self.futas_maximalis_ideje}, {self.maximalis_melysegszint}, {self.info}]"))
     def vezerles_aktualizalasa(self) -> None:
         # if (datetime.datetime.now() - self.kezdesi_ido).total_seconds() > self.futas_maximalis_ideje and self.futas_maximalis_ideje > 0: # 2. tag: 2024.02.
-        if  self.duration_in_seconds() > self.futas_maximalis_ideje and self.futas_maximalis_ideje > 0:
+        if self.futasi_keret.ellenorzes(self.kiertekelesek_szama, self.visszalepesek_szama,
+                                        self.megoldasok_szama) == "ido":    # lásd futasi_keret
             self.idohiany = True
         if self.aktualis_optimalis_megvaltozott:
             self.viszonyitasi_alap_ujraallitasa()
@@ -73,11 +96,25 @@ class Vezerles(Megoldasfa):                                         # 960. origi
                 self.keresesi_stadiumban_tartunk = False
             if self.viszonyitasi_alap <= self.feladat_also_korlatja + 1.0e-10:
                 self.also_felso_korlat_megegyezik = True
+    def tabu_kereses(self) -> None:
+        """
+        It runs the tabu search on the order of the root (see tabu_kereses.Tabu_kereses)
+        if tabu_kereses_ideje > 0. A better order found becomes the incumbent.
+        The root is evaluated again on its own order afterwards.
+        """
+        if self.tabu_kereses_ideje <= 0.0:
+            return
+        kereses: Tabu_kereses = Tabu_kereses(self, self.tabu_kereses_ideje)
+        kereses.kereses()
+        self.kiertekeles()
+        self.aktualis_optimalis_megvaltozott = True     # a gyökér kiértékelése óta az első felső korlát
+        print(f"* A tabukeresés legjobb sorrendjének kritikus úthossza: {self.aktualis_opt_atfutasi_ido:8.2f} "
+              f"({kereses.lepesek_szama} lépés, {kereses.kiertekelesek_szama} kiértékelés) *\n")
     def egyeb_ok_van_leallasra(self) -> bool:
-        return self.idohiany or self.also_felso_korlat_megegyezik
+        return self.idohiany or self.also_felso_korlat_megegyezik or bool(self.futasi_keret.kimerult)
     def megoldasfa_melyitheto(self) -> bool:
         self.reached_max_solution_tree_depth = max(self.reached_max_solution_tree_depth, len(self.ag)) # 2024.02.
-        if len(self.ag) >= self.maximalis_melysegszint and self.maximalis_melysegszint > 0:  # 2. tag: 2024.02.
+        if 0 < self.maximalis_melysegszint <= len(self.ag):          # a "0 <" rész: 2024.02.
             self.melyseghatar_eleresenek_szama += 1
             return False
         return True
@@ -92,6 +129,9 @@ class Vezerles(Megoldasfa):                                         # 960. origi
         if self.idohiany:
             print("**************  TIMEOUT! We halted the search as the runtime reached the configured maximum.  **************")
             # print("* Időhiány lépett föl. *")
+        elif self.futasi_keret.kimerult:
+            print("**************  BUDGET EXHAUSTED! We halted the search as the "
+                  f"{KERETEK[self.futasi_keret.kimerult]} reached the configured maximum.  **************")
         elif not self.also_felso_korlat_megegyezik:  # and self.maximalis_melysegszint: nem tűzhető ki, lásd az alábbi kommentblokkot!
             # print("* Normál befejeződés. *") # de nem biztos, hogy a legoptimálisabbhoz eljutottunk, mivel a megoldásfa elérhető maximális mélységszintje korlátozva volt
             print("******************* Normal termination. We traversed the entire solution tree we established.  *******************")
@@ -112,6 +152,15 @@ class Vezerles(Megoldasfa):                                         # 960. origi
         if self.ismetelt_korlatozasok_szama > 0:
             print(f"   Ismételt korlátozás: {self.ismetelt_korlatozasok_szama:6}")
             print(f"   Sikeres ism. korlát: {self.sikeres_ismetelt_korlatozasok_szama:6}")
+        for korlat in self.korlatok:
+            print(f"   Korlát ({korlat.nev:9}): {korlat.hivasok_szama:6} becslés, {korlat.vagasok_szama:6} vágás, "
+                  f"{korlat.gyorstar_talalatok:6} a gyorstárból")
+            if korlat.gepenkent and korlat.gepenkenti_becslesek:
+                print(f"   Korlát ({korlat.nev:9}) gépenként (becslés/vágás): "
+                      + ", ".join(f"{j + 1}: {b}/{v}" for j, (b, v)
+                                  in enumerate(zip(korlat.gepenkenti_becslesek, korlat.gepenkenti_vagasok)) if b))
+        print(f"   Transzpozíciós tábla: {self.transzpozicios_tabla.talalatok:6} találat, "
+              f"{self.transzpozicios_tabla.hianyok:6} hiány, {self.transzpozicios_tabla.kiszoritasok:6} kiszorítás")
         if self.maximalis_melysegszint > 0 and self.melyseghatar_eleresenek_szama > 0:
             print(f"   Mélységhatár elérésének száma: {self.melyseghatar_eleresenek_szama:6}")
         else:   # 2024.02.
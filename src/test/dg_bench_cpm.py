@@ -0,0 +1,140 @@
+"""
+Micro-benchmark of the critical path passes (kritikus_ut_odafele, kritikus_uthosszak_visszafele,
+sorrendisegi_elek_nelkul_uthosszak_odafele, ..._visszafele) on random Disjunctive Graphs
+of 100, 1,000 and 10,000 operations (or of the sizes given as arguments).
+
+The former passes popped the list of the handled nodes with `elintezettek = elintezettek[1:]`,
+so each of them was quadratic in the number of operations. Their copies are kept here
+(regi_* functions) as the reference of the measurement.
+
+You will probably try this command if you have the required Python tools installed:
+
+    python src/test/dg_bench_cpm.py [<number of operations> ...]
+
+Note: Ensure that your PYTHONPATH contains src/main and src/test.
+"""
+
+import sys
+import os
+import random
+import tempfile
+from time import perf_counter
+from typing import Callable, List, cast
+
+from diszjunktiv_graf import Csatlakozas, Muveletcsucs
+from vezerles import Vezerles
+from test_dg_cpm_engines import beolvasas
+
+def veletlen_input(muvszam: int, gepszam: int, fn: str, seed: int = 20240220) -> None:
+    """
+    It writes a random, acyclic Disjunctive Graph into the fn text file.
+    The technological predecessors of an operation have smaller identifiers.
+    """
+    rnd: random.Random = random.Random(seed)
+    gepje: List[int] = [k % gepszam + 1 for k in range(muvszam)]
+    with open(fn, "wt", encoding= 'utf-8') as f:
+        f.write(f"[{muvszam}, {gepszam}]\n[0.0, 0, False]\n")
+        f.write(str([gepje.count(g + 1) for g in range(gepszam)]) + "\n")
+        f.write(str([k + 1 for g in range(gepszam) for k in range(muvszam) if gepje[k] == g + 1]) + "\n")
+        for k in range(muvszam):
+            megelozok: List[int] = sorted({rnd.randint(max(1, k - 50), k)
+                                           for _ in range(rnd.randint(0, 3))} if k else set())
+            f.write(f"[{k + 1}, {gepje[k]}, {round(rnd.uniform(17.0, 50.0), 2)}, {megelozok}]\n")
+
+def regi_kritikus_ut_odafele(dg_o: Vezerles) -> None:
+    """
+    The former kritikus_ut_odafele() (a copy for comparison).
+    """
+    elintezettek: List[Muveletcsucs] = []
+    elintezett_csucs: Muveletcsucs | None = None
+    csatolo: Csatlakozas | None = None
+    hossz: float = 0.0
+    dg_o.torles()
+    assert dg_o.forras
+    elintezettek.append(dg_o.forras)
+    def figyelembevetel(muvelet: Muveletcsucs, sorrendi: bool):
+        muvelet.beerkezettek += 1
+        if muvelet.forrastol1 < hossz - 1.0e-10:
+            muvelet.forrastol1 = hossz
+            muvelet.kritikus_elozo = elintezett_csucs
+            muvelet.kritikus_elozo_sorrendi = sorrendi
+        if muvelet.beerkezettek < muvelet.beerkezok:
+            pass
+        else:
+            if True if muvelet.gepen_elozo is None else muvelet.beerkezettek > muvelet.beerkezok:
+                muvelet.beerkezettek = 0
+                elintezettek.append(muvelet)
+                muvelet.forrastol2 = muvelet.forrastol1 + muvelet.idotartam
+    while len(elintezettek) > 0:
+        elintezett_csucs = elintezettek[0]
+        elintezettek = elintezettek[1:]
+        csatolo = elintezett_csucs.rakovetkezok[0] if elintezett_csucs.rakovetkezok else None
+        hossz = elintezett_csucs.forrastol2
+        while csatolo is not None:
+            figyelembevetel(csatolo.szomszed, False)
+            csatolo = cast(Csatlakozas, csatolo.suc)
+        if elintezett_csucs.gepen_koveto is not None:
+            figyelembevetel(elintezett_csucs.gepen_koveto, True)
+
+def regi_sorrendisegi_elek_nelkul_uthosszak_odafele(dg_o: Vezerles) -> None:
+    """
+    The former sorrendisegi_elek_nelkul_uthosszak_odafele() (a copy for comparison).
+    """
+    elintezettek: List[Muveletcsucs] = []
+    elintezett_csucs: Muveletcsucs | None = None
+    csatolo: Csatlakozas | None = None
+    hossz: float = 0.0
+    dg_o.torles()
+    assert dg_o.forras
+    elintezettek.append(dg_o.forras)
+    while len(elintezettek) > 0:
+        elintezett_csucs = elintezettek[0]
+        elintezettek = elintezettek[1:]
+        csatolo = elintezett_csucs.rakovetkezok[0] if elintezett_csucs.rakovetkezok else None
+        hossz = elintezett_csucs.forrastol2
+        while csatolo is not None:
+            csatolo.szomszed.beerkezettek += 1
+            csatolo.szomszed.forrastol1 = max(csatolo.szomszed.forrastol1, hossz)
+            if csatolo.szomszed.beerkezettek == csatolo.szomszed.beerkezok:
+                csatolo.szomszed.beerkezettek = 0
+                elintezettek.append(csatolo.szomszed)
+                csatolo.szomszed.forrastol2 = csatolo.szomszed.forrastol1 + csatolo.szomszed.idotartam
+            csatolo = cast(Csatlakozas, csatolo.suc)
+
+def meres(fv: Callable[[], object], ismetles: int) -> float:
+    """
+    It serves the best runtime of fv in milliseconds.
+    """
+    legjobb: float = 1.0e+300
+    for _ in range(ismetles):
+        kezdet: float = perf_counter()
+        fv()
+        legjobb = min(legjobb, perf_counter() - kezdet)
+    return 1000 * legjobb
+
+def benchmark(muvszam: int) -> None:
+    """
+    It measures the passes on a random graph of muvszam operations.
+    """
+    with tempfile.TemporaryDirectory() as tmp:
+        fn: str = os.path.join(tmp, f"dg_bench_{muvszam}.txt")
+        veletlen_input(muvszam, max(2, muvszam // 25), fn)
+        dg_o: Vezerles = beolvasas(fn)
+    ismetles: int = 5 if muvszam <= 1000 else 2
+    regi_o: float = meres(lambda: regi_kritikus_ut_odafele(dg_o), ismetles)
+    uj_o: float = meres(dg_o.kritikus_ut_odafele, ismetles)
+    uj_v: float = meres(dg_o.kritikus_uthosszak_visszafele, ismetles)
+    regi_s: float = meres(lambda: regi_sorrendisegi_elek_nelkul_uthosszak_odafele(dg_o), ismetles)
+    uj_s: float = meres(dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele, ismetles)
+    dg_o.tomor_motor = True
+    tomor_o: float = meres(dg_o.kritikus_ut_odafele, ismetles)
+    dg_o.tomor_motor = False
+    print(f"{muvszam:8} {regi_o:12.2f} {uj_o:12.2f} {regi_o / uj_o:8.1f}x "
+          f"{regi_s:12.2f} {uj_s:12.2f} {regi_s / uj_s:8.1f}x {uj_v:12.2f} {tomor_o:12.2f}")
+
+if __name__ == '__main__':
+    meretek: List[int] = [int(a) for a in sys.argv[1:]] or [100, 1000, 10000]
+    print("     ops  former fwd  queue fwd   gain      former nos  queue nos   gain"
+          "     queue bwd  compact fwd   (ms)")
+    for m in meretek:
+        benchmark(m)
@@ -0,0 +1,78 @@
+"""
+Memory and speed benchmark of the engine classes with __slots__ (Muveletcsucs, Csatlakozas, El,
+Megoldascsucs and their base DgLink) against the former ones with __dict__ (see dg_link.SLOTS).
+The class kind is chosen when the classes are made, so each kind is measured in its own process
+(the DG_NO_SLOTS environment variable), on random Disjunctive Graphs of 1,000 and 10,000 operations
+(or of the sizes given as arguments).
+
+The memory is the one allocated by reading the graph and by making as many El and Megoldascsucs
+objects as operations (tracemalloc). The speed is the one of the passes of the object engine
+(kritikus_ut_odafele, sorrendisegi_elek_nelkul_uthosszak_odafele) and of the one-machine bounds
+of all machines (gepen_korlatozas).
+
+You will probably try this command if you have the required Python tools installed:
+
+    python src/test/dg_bench_slots.py [<number of operations> ...]
+
+Note: Ensure that your PYTHONPATH contains src/main and src/test.
+"""
+
+import os
+import subprocess
+import sys
+import tempfile
+import tracemalloc
+from typing import Dict, List
+
+def meresek(muvszam: int) -> Dict[str, float]:
+    """
+    It measures the classes of this process on a random graph of muvszam operations.
+    """
+    from dg_bench_cpm import meres, veletlen_input     # pylint: disable=import-outside-toplevel
+    from diszjunktiv_graf_manipulacioi import El        # pylint: disable=import-outside-toplevel
+    from megoldasfa import Megoldascsucs                # pylint: disable=import-outside-toplevel
+    from test_dg_cpm_engines import beolvasas           # pylint: disable=import-outside-toplevel
+    with tempfile.TemporaryDirectory() as tmp:
+        fn: str = os.path.join(tmp, f"dg_bench_{muvszam}.txt")
+        veletlen_input(muvszam, max(2, muvszam // 25), fn)
+        tracemalloc.start()
+        dg_o = beolvasas(fn)
+        graf: float = tracemalloc.get_traced_memory()[0] / 1024
+        tracemalloc.stop()
+    tracemalloc.start()
+    elek: List[El] = [El(muv, muv) for muv in dg_o.muvelet]
+    csucsok: List[Megoldascsucs] = [Megoldascsucs() for _ in dg_o.muvelet]
+    objektumok: float = tracemalloc.get_traced_memory()[0] / 1024
+    tracemalloc.stop()
+    del elek, csucsok
+    ismetles: int = 5 if muvszam <= 1000 else 2
+    korlat: List[float] = [0.0, 0.0]
+    return {"graf": graf, "objektumok": objektumok,
+            "odafele": meres(dg_o.kritikus_ut_odafele, ismetles),
+            "nos": meres(dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele, ismetles),
+            "gepen": meres(lambda: [dg_o.gepen_korlatozas(j, korlat) for j in range(dg_o.gepszam)], ismetles)}
+
+def folyamatban(muvszam: int, slots: bool) -> Dict[str, float]:
+    """
+    It runs meresek in a new process with (slots True) or without __slots__.
+    """
+    kornyezet: Dict[str, str] = dict(os.environ, DG_NO_SLOTS="0" if slots else "1")
+    kimenet: str = subprocess.run([sys.executable, __file__, "--meres", str(muvszam)], env=kornyezet,
+                                  check=True, capture_output=True, text=True).stdout
+    return dict((nev, float(ertek)) for nev, ertek in (sor.split("=") for sor in kimenet.split()))
+
+if __name__ == '__main__':
+    if sys.argv[1:2] == ["--meres"]:
+        for nev, ertek in meresek(int(sys.argv[2])).items():
+            print(f"{nev}={ertek}")
+        sys.exit(0)
+    meretek: List[int] = [int(a) for a in sys.argv[1:]] or [1000, 10000]
+    print("     ops            graph KiB   objects KiB   fwd ms     nos ms  machines ms")
+    for m in meretek:
+        regi: Dict[str, float] = folyamatban(m, False)
+        uj: Dict[str, float] = folyamatban(m, True)
+        for nev, e in (("__dict__", regi), ("__slots__", uj)):
+            print(f"{m:8} {nev:>10} {e['graf']:11.0f} {e['objektumok']:12.0f} {e['odafele']:9.2f} "
+                  f"{e['nos']:9.2f} {e['gepen']:11.2f}")
+        print(f"{'':8} {'gain':>10} {regi['graf'] / uj['graf']:10.2f}x {regi['objektumok'] / uj['objektumok']:11.2f}x "
+              f"{regi['odafele'] / uj['odafele']:8.2f}x {regi['nos'] / uj['nos']:8.2f}x {regi['gepen'] / uj['gepen']:10.2f}x")
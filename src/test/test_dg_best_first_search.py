@@ -0,0 +1,44 @@
+"""
+    This module is unit test.
+    It compares the best-first and the hybrid node selection of dg_best_first_search
+    with the depth-first search (see Solver.iteraciok): all of them are exact,
+    so they must find the same critical path length.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first difference.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List
+
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_best_first_search import CSUCSVALASZTASOK, csucsvalasztassal_iteraciok
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def kereses(fn: str, csucsvalasztas: str, nyitott_csucsok_hatara: int = 4) -> float:
+    """
+    It searches the first Disjunctive Graph of the input file by the node-selection policy,
+    and serves the best critical path length found.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    assert solver.dg_o
+    with redirect_stdout(StringIO()):
+        csucsvalasztassal_iteraciok(solver, csucsvalasztas, nyitott_csucsok_hatara)
+    return solver.dg_o.aktualis_opt_atfutasi_ido
+
+def test_csucsvalasztasok() -> None:
+    """
+    The hybrid search gets a small queue (nyitott_csucsok_hatara == 4).
+    """
+    for fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES[:2]]:
+        eredmenyek: List[float] = [kereses(fn, csucsvalasztas) for csucsvalasztas in CSUCSVALASZTASOK]
+        assert max(eredmenyek) - min(eredmenyek) < 1.0e-6, f"{fn}: {eredmenyek}"
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {[kereses(arg_str_fn, cs) for cs in CSUCSVALASZTASOK]}")
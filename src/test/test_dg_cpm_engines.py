@@ -0,0 +1,314 @@
+"""
+    This module is unit test.
+    It compares the different engines of the critical path calculation
+    (see Diszjunktiv_graf.kritikus_ut_odafele, Diszjunktiv_graf.kritikus_uthosszak_visszafele)
+    on the Disjunctive Graphs of the input files. The results must be the same bit-for-bit.
+    The compact store must follow the changes of the graph by itself.
+    The incremental engine (see Diszjunktiv_graf.inkrementalis_kritikus_ut_odafele) must give
+    the same path lengths, and its trail must restore them on backtrack.
+    The batched evaluation of swaps (see Diszjunktiv_graf.cserek_kiertekelese) must give
+    the same critical path lengths as the swaps evaluated one by one.
+
+Args:
+    <input file>: the input text file to be read (optional, the files of the inputs folder by default)
+
+Result:
+    It writes the number of the compared states to the TERMINAL/Command screen.
+    It stops with AssertionError at the first difference.
+"""
+
+import sys
+from math import isinf
+from os import path
+
+from typing import List, Tuple
+
+from dg_standard_input import DgStandardInput, my_dict_for_input
+from dg_standard_input import dg_inint
+from dg_main import InputTextFile
+from diszjunktiv_graf import Muveletcsucs
+from diszjunktiv_graf_manipulacioi import El
+from vezerles import Vezerles
+
+INPUTS_DIR: str = path.join(path.dirname(path.abspath(__file__)), "..", "..", "inputs")
+INPUT_FILES: List[str] = ["dg_input.txt",
+                          "dg_gen_input_38m_11g_20240223121500.txt",
+                          "dg_gen_input_100m_4g_20240220111417.txt"]
+
+def beolvasas(fn: str) -> Vezerles:
+    """
+    It reads the first Disjunctive Graph of the input file,
+    and sets up the beginning order of the operations on it.
+    """
+    itf: InputTextFile = InputTextFile(fn)
+    with open(fn, "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        my_dict_for_input["dg_input_object"] = DgStandardInput(itf)
+        dg_o: Vezerles = Vezerles(dg_inint(), dg_inint())
+        dg_o.vezerles_inicializalasa()
+        dg_o.graf_beolvasasa()
+        itf.close_input()
+    dg_o.info = False
+    dg_o.kezdeti_sorrend_felallitasa()
+    dg_o.gyokeret_megoldasfaba()
+    return dg_o
+
+def allapot(dg_o: Vezerles) -> List[Tuple]:
+    """
+    It serves the path lengths and the critical predecessors of all nodes.
+    """
+    assert dg_o.forras and dg_o.nyelo
+    csucsok: List[Muveletcsucs] = dg_o.muvelet + [dg_o.forras, dg_o.nyelo]
+    return [(m.azonosito, m.forrastol1, m.forrastol2, m.nyeloig1, m.nyeloig2,
+             None if m.kritikus_elozo is None else m.kritikus_elozo.azonosito,
+             m.kritikus_elozo_sorrendi) for m in csucsok]
+
+def motorok_osszevetese(dg_o: Vezerles) -> None:
+    """
+    It runs both passes with the object engine and with the compact one, and compares them.
+    """
+    dg_o.tomor_motor = False
+    dg_o.kritikus_ut_odafele()
+    dg_o.kritikus_uthosszak_visszafele()
+    regi: List[Tuple] = allapot(dg_o)
+    dg_o.tomor_motor = True
+    dg_o.kritikus_ut_odafele()
+    dg_o.kritikus_uthosszak_visszafele()
+    dg_o.tomor_motor = False
+    assert regi == allapot(dg_o), "The compact engine differs from the object engine."
+
+def lepesek_osszevetese(fn: str, lepesszam: int = 30) -> int:
+    """
+    It goes down in the solution tree along the first free edges,
+    and compares the engines at each step. It serves the number of compared states.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    osszevetesek: int = 0
+    for _ in range(lepesszam):
+        motorok_osszevetese(dg_o)
+        osszevetesek += 1
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        jelolt: El = dg_o.elso_szabad_el()
+        dg_o.uj_megoldas_illesztese_megoldasfara()
+        if len(dg_o.ag) % 3 == 0:   # fixált "normál" éleket is próbára teszünk
+            dg_o.visszalepes()
+            assert jelolt.normal and jelolt in dg_o.fixalt_elek
+    return osszevetesek
+
+def inkrementalis_osszevetese(fn: str, lepesszam: int = 60) -> int:
+    """
+    It goes down (and sometimes back) in the solution tree, and compares the path lengths
+    of the incremental engine with the ones of the object engine at each step.
+    It serves the number of compared states.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    assert dg_o.tomor
+    t = dg_o.tomor
+    osszevetesek: int = 0
+    for lepes in range(lepesszam):
+        dg_o.inkrementalis_kritikus_ut_odafele()
+        dg_o.inkrementalis_uthosszak_visszafele()
+        inkrementalis: List[Tuple[float, float]] = list(zip(t.forrastol1, t.nyeloig1))
+        for u in range(t.csucsszam):                            # a topologikus sorrend is rendben van-e
+            assert all(t.pozicio[u] < t.pozicio[v] for v in t.rakovetkezo_csucsok(u))
+        dg_o.kritikus_ut_odafele()
+        dg_o.kritikus_uthosszak_visszafele()
+        for muv in dg_o.muvelet + [dg_o.nyelo]:
+            assert muv
+            ertek: Tuple[float, float] = inkrementalis[muv.belso_index]
+            assert abs(muv.forrastol1 - ertek[0]) < 1.0e-9, "The incremental heads differ."
+            assert muv is dg_o.nyelo or abs(muv.nyeloig1 - ertek[1]) < 1.0e-9, "The incremental tails differ."
+        osszevetesek += 1
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        if lepes % 4 == 3 and not dg_o.gyokerben_vagyok():
+            dg_o.visszalepes()
+        else:
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+    return osszevetesek
+
+def test_inkrementalis_motor() -> None:
+    """
+    The incremental engine must follow the flips and the backtracks of the solution tree.
+    """
+    for fn in INPUT_FILES:
+        assert inkrementalis_osszevetese(path.join(INPUTS_DIR, fn)) > 1
+
+def tomor_graf_kovetese(fn: str, lepesszam: int = 60) -> int:
+    """
+    It goes down (and sometimes back) in the solution tree, and checks at each step that the compact store
+    holds the recent order on the machines and the fixed edges without loading them (see Tomor_graf).
+    It serves the number of the checked steps.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    assert dg_o.tomor
+    t = dg_o.tomor
+    lepes: int = 0
+    for lepes in range(lepesszam):
+        dg_o.inkrementalis_kritikus_ut_odafele()
+        for k, muv in enumerate(dg_o.tomor_csucsok):
+            assert t.gepen_elozo[k] == (-1 if muv.gepen_elozo is None else muv.gepen_elozo.belso_index)
+            assert t.gepen_koveto[k] == (-1 if muv.gepen_koveto is None else muv.gepen_koveto.belso_index)
+            db: int = t.megelozo_kezdet[k + 1] - t.megelozo_kezdet[k]
+            assert t.tobblet_megelozok[k] == [cs.szomszed.belso_index for cs in muv.megelozok[db:]]
+            db = t.rakovetkezo_kezdet[k + 1] - t.rakovetkezo_kezdet[k]
+            assert t.tobblet_rakovetkezok[k] == [cs.szomszed.belso_index for cs in muv.rakovetkezok[db:]]
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        if lepes % 4 == 3 and not dg_o.gyokerben_vagyok():
+            dg_o.visszalepes()
+        else:
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+    return lepes
+
+def test_tomor_graf_kovetese() -> None:
+    """
+    The compact store must follow the flips and the backtracks of the solution tree by itself.
+    """
+    for fn in INPUT_FILES:
+        assert tomor_graf_kovetese(path.join(INPUTS_DIR, fn)) > 1
+
+def nyomvonal_osszevetese(fn: str, melyseg: int = 8, teljes_szamolasok: bool = False) -> int:
+    """
+    It goes down along the first free edges, then back to the root, and checks
+    that each backtrack restores the values of the compact store bit-for-bit (see Megoldasfa.visszalepes).
+    If teljes_szamolasok is True, full passes run on the compact store between the marks:
+    the ones of felsorakoztatas (tomor_motor) and the one of the tails in nyomvonal_jel.
+    The backtracks must take the trail even across them.
+    It serves the number of the restored levels.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    assert dg_o.tomor
+    t = dg_o.tomor
+    dg_o.tomor_motor = teljes_szamolasok
+    szintek: List[Tuple] = []
+    for _ in range(melyseg):
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        dg_o.inkrementalis_kritikus_ut_odafele()
+        dg_o.inkrementalis_uthosszak_visszafele()
+        if teljes_szamolasok:
+            t.farkak_ervenyesek = False     # a nyomvonal_jel() teljes visszafelé számolást végez
+        szintek.append(tuple(arr.tolist() for arr in (t.forrastol1, t.forrastol2, t.nyeloig1, t.nyeloig2,
+                                                      t.kritikus_elozo, t.pozicio)))
+        dg_o.uj_megoldas_illesztese_megoldasfara()
+        assert dg_o.aktualis_megoldascsucs().nyomvonal_jel is not None
+        dg_o.inkrementalis_kritikus_ut_odafele()
+    nemzedek: int = t.nemzedek
+    for szint in reversed(szintek):
+        dg_o.visszalepes()
+        assert t.fejek_ervenyesek and t.farkak_ervenyesek, "The backtrack asks for a full evaluation."
+        assert szint == tuple(arr.tolist() for arr in (t.forrastol1, t.forrastol2, t.nyeloig1, t.nyeloig2,
+                                                       t.kritikus_elozo, t.pozicio)), "The trail is wrong."
+    assert t.nemzedek == nemzedek, "The trail has been given up."
+    return len(szintek)
+
+def test_nyomvonal() -> None:
+    """
+    A backtrack must restore the values of the compact store from the trail.
+    """
+    for fn in INPUT_FILES:
+        assert nyomvonal_osszevetese(path.join(INPUTS_DIR, fn)) > 1
+
+def test_nyomvonal_teljes_szamolasokon_at() -> None:
+    """
+    A backtrack must restore the values of the compact store from the trail
+    across the full passes run since the mark.
+    """
+    for fn in INPUT_FILES:
+        assert nyomvonal_osszevetese(path.join(INPUTS_DIR, fn), teljes_szamolasok=True) > 1
+
+def kor_van(dg_o: Vezerles) -> bool:
+    """
+    True, if the recent order closes a cycle (Kahn's algorithm along the predecessors,
+    the fixed edges and the machines).
+    """
+    elozok: List[List[Muveletcsucs]] = [[cs.szomszed for cs in muv.megelozok if cs.szomszed.azonosito > 0]
+                                        + ([] if muv.gepen_elozo is None else [muv.gepen_elozo])
+                                        for muv in dg_o.muvelet]
+    hatra: List[int] = [len(l) for l in elozok]
+    utodok: List[List[int]] = [[] for _ in dg_o.muvelet]
+    for k, l in enumerate(elozok):
+        for muv in l:
+            utodok[muv.belso_index].append(k)
+    kesz: List[int] = [k for k, db in enumerate(hatra) if db == 0]
+    for k in kesz:
+        for j in utodok[k]:
+            hatra[j] -= 1
+            if hatra[j] == 0:
+                kesz.append(j)
+    return len(kesz) < len(dg_o.muvelet)
+
+def kotegelt_osszevetese(fn: str, lepesszam: int = 12) -> int:
+    """
+    It goes down along the first free edges, and at each step evaluates the swaps of all neighbours
+    on the machines in one batch, and one by one with the object engine. The critical paths served
+    must be as long as the critical path lengths. It serves the number of compared swaps.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    assert dg_o.tomor
+    t = dg_o.tomor
+    osszevetesek: int = 0
+    for _ in range(lepesszam):
+        dg_o.inkrementalis_kritikus_ut_odafele()
+        elotte: Tuple = tuple(arr.tolist() for arr in (t.forrastol1, t.kritikus_elozo, t.pozicio,
+                                                      t.gepen_elozo, t.gepen_koveto))
+        parok: List[Tuple[Muveletcsucs, Muveletcsucs]] = [(muv, muv.gepen_koveto) for muv in dg_o.muvelet
+                                                          if muv.gepen_koveto is not None]
+        utak: List[List[Muveletcsucs]] = []
+        kotegelt: List[float] = dg_o.cserek_kiertekelese(parok, utak)
+        assert elotte == tuple(arr.tolist() for arr in (t.forrastol1, t.kritikus_elozo, t.pozicio,
+                                                        t.gepen_elozo, t.gepen_koveto)), "The batch has changed the store."
+        for (kezdet, veg), ertek, ut in zip(parok, kotegelt, utak):
+            El(kezdet, veg).konjugalasaval_sorrend_modositas()
+            kor: bool = kor_van(dg_o)
+            if not kor:
+                dg_o.kritikus_ut_odafele()
+            El(veg, kezdet).konjugalasaval_sorrend_modositas()
+            assert dg_o.nyelo
+            assert kor == isinf(ertek), "The batched evaluation does not see the cycle."
+            if not kor:
+                assert abs(dg_o.nyelo.forrastol1 - ertek) < 1.0e-9, "The batched evaluation differs."
+                assert abs(sum(muv.idotartam for muv in ut) - ertek) < 1.0e-9, "The critical path is wrong."
+            osszevetesek += 1
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        dg_o.uj_megoldas_illesztese_megoldasfara()
+    return osszevetesek
+
+def test_kotegelt_kiertekeles() -> None:
+    """
+    The batched evaluation of swaps must give the same lengths as the swaps one by one.
+    """
+    for fn in INPUT_FILES:
+        assert kotegelt_osszevetese(path.join(INPUTS_DIR, fn)) > 1
+
+def test_tomor_motor() -> None:
+    """
+    The compact (Tomor_graf) engine must give the same results as the object engine.
+    """
+    for fn in INPUT_FILES:
+        assert lepesek_osszevetese(path.join(INPUTS_DIR, fn)) > 1
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        print("Usage: python test_dg_cpm_engines.py [<input file name and/or full path>]")
+        sys.exit(1)
+
+    for arg_str_fn in (sys.argv[1:] if len(sys.argv) == 2 else
+                       [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]):
+        print(f"{arg_str_fn}: {lepesek_osszevetese(arg_str_fn)} states compared, no difference")
+        print(f"{arg_str_fn}: {inkrementalis_osszevetese(arg_str_fn)} incremental states compared, no difference")
+        print(f"{arg_str_fn}: {nyomvonal_osszevetese(arg_str_fn)} levels restored from the trail, no difference")
+        print(f"{arg_str_fn}: {kotegelt_osszevetese(arg_str_fn)} batched swaps compared, no difference")
@@ -0,0 +1,65 @@
+"""
+    This module is unit test.
+    It checks the budgets of futasi_keret: a search limited by the number of the evaluations
+    stops exactly there, and gives the same incumbent in every run; the clock is read
+    only in every ellenorzesi_koz-th iteration.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first failure.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from time import sleep
+
+from typing import List, Tuple
+
+from dg_high_level_pseudo_black_boxes import Solver
+from futasi_keret import Futasi_keret
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def keretezett_kereses(fn: str, kiertekelesek: int) -> Tuple[float, int, List[int]]:
+    """
+    It searches the first Disjunctive Graph of the input file with at most kiertekelesek evaluations.
+    It serves the critical path length, the number of the evaluations and the incumbent order.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    dg_o = solver.dg_o
+    assert dg_o
+    dg_o.futasi_keret.hatarok_beallitasa((kiertekelesek, 0, 0, 0.0))
+    with redirect_stdout(StringIO()):
+        solver.iteraciok()
+    assert dg_o.futasi_keret.kimerult == "kiertekelesek" and dg_o.egyeb_ok_van_leallasra()
+    return (dg_o.aktualis_opt_atfutasi_ido, dg_o.kiertekelesek_szama,
+            [0 if muv.opt_koveto is None else muv.opt_koveto.azonosito for muv in dg_o.muvelet])
+
+def test_kiertekelesek_kerete() -> None:
+    """
+    The evaluation budget stops the search at the same point in every run.
+    """
+    fn: str = path.join(INPUTS_DIR, INPUT_FILES[2])
+    for kiertekelesek in (50, 300):
+        elso = keretezett_kereses(fn, kiertekelesek)
+        assert elso[1] == kiertekelesek
+        assert keretezett_kereses(fn, kiertekelesek) == elso
+
+def test_ora_ellenorzese() -> None:
+    """
+    The clock is read in the first and in every ellenorzesi_koz-th call only.
+    """
+    keret: Futasi_keret = Futasi_keret(ido= 0.001, ellenorzesi_koz= 4)
+    sleep(0.01)
+    assert keret.ellenorzes(0, 0, 0) == "ido"
+    keret.inditas()
+    assert keret.ellenorzes(0, 0, 0) == ""
+    sleep(0.01)
+    assert [keret.ellenorzes(0, 0, 0) for _ in range(3)] == ["", "", "ido"]
+    keret = Futasi_keret(visszalepesek= 10, csucsok= 5)
+    assert keret.ellenorzes(100, 9, 4) == "" and keret.ellenorzes(100, 10, 4) == "visszalepesek"
+
+if __name__ == '__main__':
+    for kiertekelesek_szama in (50, 300, 1000):
+        print(f"{kiertekelesek_szama}: {keretezett_kereses(path.join(INPUTS_DIR, INPUT_FILES[2]), kiertekelesek_szama)[0]}")
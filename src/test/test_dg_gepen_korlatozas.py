@@ -0,0 +1,192 @@
+"""
+    This module is unit test.
+    It compares Szabad_elek__korlatozas_egy_gepen.gepen_korlatozas with its former,
+    list-based version (regi_gepen_korlatozas, a copy) on all machines
+    at the nodes of the solution tree, and on random heads and tails with many ties.
+    The bounds must be the same bit-for-bit.
+
+Args:
+    <input file>: the input text file to be read (optional, the files of the inputs folder by default)
+
+Result:
+    It writes the number of the compared bounds to the TERMINAL/Command screen.
+    It stops with AssertionError at the first difference.
+"""
+
+import sys
+import random
+from os import path
+
+from typing import List, cast
+
+from dg_link import dg_link_list
+from diszjunktiv_graf import Muveletcsucs
+from vezerles import Vezerles
+from test_dg_cpm_engines import beolvasas, INPUTS_DIR, INPUT_FILES
+
+def regi_gepen_korlatozas(dg_o: Vezerles, j: int, in_out_attr: List[float]) -> None:
+    """
+    The former gepen_korlatozas() (a copy for comparison).
+    """
+    also: float = in_out_attr[0]
+    felso: float = in_out_attr[1]
+                                                                # 639. origin sor: (1) comment jelű blokk kezdete
+    fej: List[Muveletcsucs] = [] # Ez legyen diszjunkt lista más listákhoz képest!     #: Muveletcsucs LIST
+    tag: Muveletcsucs | None = None; tag1: Muveletcsucs = Muveletcsucs() # tag1 will be replaced soon
+    kulcsszam: float = 0.0; max_ut: float = 0.0; becsles: float = 0.0; min_kieg: float = 0.0; seged: float = 0.0
+    k: int = 0                                                  # 646. origin sor: (2) comment jelű blokk kezdete
+    link_index: int = 0
+    for k in range(dg_o.gep_elso_muvelete[j], dg_o.gep_elso_muvelete[j] + dg_o.gep_muveletszama[j]): #  - 1 hozzáadása nem kell a range felső határához, mert az maga nyiott felső határú
+        tag = fej[0] if fej else None                           # FIRST
+        link_index = 0
+        while False if tag is None else tag.nyeloig2 > dg_o.muvelet[k].nyeloig2:
+            link_index += 1
+            assert tag
+            tag = cast(Muveletcsucs, tag.suc)
+        if tag is None:
+            fej.append(dg_o.muvelet[k])                         # INTO
+        else: fej.insert(link_index, dg_o.muvelet[k])           # PRECEDE(tag)
+        dg_link_list(fej)
+    while len(fej) > 0:                                         # EMPTY (NOT EMPTY)
+        tag = fej[0]                                            # 662. origin sor: (3) comment jelű blokk kezdete; FIRST
+        seged = tag.forrastol1
+        tag1 =tag
+        tag = cast(Muveletcsucs, tag.suc)
+        while tag is not None:
+            if seged > tag.forrastol1:
+                seged = tag.forrastol1
+                tag1 = tag
+            tag = cast(Muveletcsucs, tag.suc)
+        tag1.out()                                              # OUT
+        kulcsszam = tag1.forrastol1 + tag1.idotartam
+        min_kieg = tag1.nyeloig2
+        seged = kulcsszam +tag1.nyeloig2
+        if max_ut < seged:
+            max_ut = becsles = seged
+        elif becsles < seged: becsles = seged
+        tag = fej[0] if fej else None                           # 686. origin sor; FIRST
+        while False if tag is None else tag.forrastol1 > kulcsszam:
+            tag = tag.suc
+        while tag is not None:
+            tag.out()                                           # OUT
+            kulcsszam += tag.idotartam
+            max_ut = max(max_ut, kulcsszam + tag.nyeloig2)
+            min_kieg = min(min_kieg, tag.nyeloig2)
+            becsles = max(becsles, kulcsszam + min_kieg)
+            tag = fej[0] if fej else None                       # 704. origin sor; FIRST
+            while False if tag is None else tag.forrastol1 > kulcsszam:
+                tag = tag.suc
+                                                                # 710. origin sor: (3) comment jelű blokk vége
+    also = becsles
+    felso = max_ut
+    if also < felso - 1.0e-10:
+        becsles = max_ut = 0.0                                  # 714. origin sor: (4) comment jelű blokk kezdete
+        for k in range(dg_o.gep_elso_muvelete[j], dg_o.gep_elso_muvelete[j] + dg_o.gep_muveletszama[j]): #  - 1 hozzáadása nem kell a range felső határához, mert az maga nyiott felső határú
+            tag = fej[0] if fej else None                       # 719. origin sor: (5) comment jelű blokk kezdete; FIRST
+            link_index = 0
+            while False if tag is None else tag.forrastol1 > dg_o.muvelet[k].forrastol1:
+                assert tag
+                link_index += 1; tag = cast(Muveletcsucs, tag.suc)
+            if tag is None:
+                fej.append(dg_o.muvelet[k])                     # INTO
+            else: fej.insert(link_index, dg_o.muvelet[k])       # PRECEDE(tag)
+            dg_link_list(fej)                                   # (5) comment jelű blokk vége
+        while len(fej) > 0:                                     # EMPTY (NOT EMPTY)
+            tag = fej[0]                                        # 731. origin sor: (6) comment jelű blokk kezdete; FIRST
+            seged = tag.nyeloig2
+            tag1 =tag
+            tag = cast(Muveletcsucs, tag.suc)
+            while tag is not None:
+                if seged > tag.nyeloig2:
+                    seged = tag.nyeloig2
+                    tag1 = tag
+                tag = cast(Muveletcsucs, tag.suc)
+            tag1.out()                                          # 746. origin sor: OUT
+            kulcsszam = tag1.nyeloig2 + tag1.idotartam
+            min_kieg = tag1.forrastol1
+            seged = kulcsszam +tag1.forrastol1
+            if max_ut < seged:
+                max_ut = becsles = seged
+            elif becsles < seged: becsles = seged
+            tag = fej[0] if fej else None                       # 755. origin sor; FIRST
+            while False if tag is None else tag.nyeloig2 > kulcsszam:
+                tag = tag.suc
+            while tag is not None:
+                tag.out()                                       # 764. origin sor: OUT
+                kulcsszam += tag.idotartam
+                max_ut = max(max_ut, kulcsszam + tag.forrastol1)
+                min_kieg = min(min_kieg, tag.forrastol1)
+                becsles = max(becsles, kulcsszam + min_kieg)
+                tag = fej[0] if fej else None                   # 774. origin sor; FIRST
+                while False if tag is None else tag.nyeloig2 > kulcsszam:
+                    tag = tag.suc
+                                                                # 780. origin sor: (6) comment jelű blokk vége
+        also = max(also, becsles)
+        felso = min(felso, max_ut)
+    in_out_attr[0] = also; in_out_attr[1] = felso           # 785. origin sor: (4), (2) és (1) comment jelű blokkok vége
+
+def osszevetes(dg_o: Vezerles) -> int:
+    """
+    It compares the bounds of both versions on all machines. It serves the number of comparisons.
+    """
+    osszevetesek: int = 0
+    for j in range(dg_o.gepszam):
+        if dg_o.gep_muveletszama[j] >= 2:
+            regi: List[float] = [0.0, 0.0]
+            uj: List[float] = [0.0, 0.0]
+            regi_gepen_korlatozas(dg_o, j, regi)
+            dg_o.gepen_korlatozas(j, uj)
+            assert regi == uj, f"gepen_korlatozas differs on the machine {j + 1}: {regi} != {uj}"
+            osszevetesek += 1
+    return osszevetesek
+
+def megoldasfan_osszevetes(fn: str, lepesszam: int = 40) -> int:
+    """
+    It goes down in the solution tree along the first free edges,
+    and compares the versions at each step (on the state left by the korlatozas passes).
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    osszevetesek: int = 0
+    for _ in range(lepesszam):
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele()
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_visszafele()
+        osszevetesek += osszevetes(dg_o)
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        dg_o.uj_megoldas_illesztese_megoldasfara()
+    return osszevetesek
+
+def veletlen_osszevetes(fn: str, ismetles: int = 200, seed: int = 20240301) -> int:
+    """
+    It compares the versions on random heads and tails drawn from a few values (so with many ties).
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    rnd: random.Random = random.Random(seed)
+    osszevetesek: int = 0
+    for _ in range(ismetles):
+        ertekek: List[float] = [round(rnd.uniform(0.0, 100.0), 2) for _ in range(4)]
+        for muv in dg_o.muvelet:
+            muv.forrastol1 = rnd.choice(ertekek)
+            muv.nyeloig2 = rnd.choice(ertekek)
+        osszevetesek += osszevetes(dg_o)
+    return osszevetesek
+
+def test_gepen_korlatozas() -> None:
+    """
+    The heap-based gepen_korlatozas must give the same bounds as the former one.
+    """
+    for fn in INPUT_FILES:
+        assert megoldasfan_osszevetes(path.join(INPUTS_DIR, fn)) > 0
+        assert veletlen_osszevetes(path.join(INPUTS_DIR, fn), 20) > 0
+
+if __name__ == '__main__':
+    if len(sys.argv) > 2:
+        print("Usage: python test_dg_gepen_korlatozas.py [<input file name and/or full path>]")
+        sys.exit(1)
+
+    for arg_str_fn in (sys.argv[1:] if len(sys.argv) == 2 else
+                       [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]):
+        print(f"{arg_str_fn}: {megoldasfan_osszevetes(arg_str_fn) + veletlen_osszevetes(arg_str_fn)} "
+              "bounds compared, no difference")
@@ -0,0 +1,75 @@
+"""
+    This module is unit test.
+    It checks the acyclicity test of the Disjunctive Graph (see Diszjunktiv_graf.rigid_check_acyclicity):
+    it must find a cycle as "a,b,c,a" along the predecessors, and it must cope with a long chain
+    of operations (no recursion).
+    It checks the technological reachability sets (see Diszjunktiv_graf.technologiailag_megelozi)
+    against a plain search along the technological arcs.
+
+Result:
+    It stops with AssertionError at the first failure.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List, Set
+
+from diszjunktiv_graf import Csatlakozas, Diszjunktiv_graf, Muveletcsucs
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES, beolvasas
+
+def lanc(db: int) -> Diszjunktiv_graf:
+    """
+    A chain of db operations on one machine: every operation is preceded by the former one
+    (their internal order is the reverse of their identifiers).
+    """
+    dg: Diszjunktiv_graf = Diszjunktiv_graf(db, 1)
+    forras: Muveletcsucs = Muveletcsucs()
+    forras.azonosito = -1
+    for k in range(db):
+        muv: Muveletcsucs = Muveletcsucs()
+        muv.azonosito = db - k
+        dg.muvelet[k] = muv
+        dg.muvkod[db - k - 1] = k
+    for k in range(db):
+        dg.muvelet[k].megelozok.append(Csatlakozas(dg.muvelet[k + 1] if k + 1 < db else forras))
+    return dg
+
+def test_hosszu_lanc() -> None:
+    dg: Diszjunktiv_graf = lanc(100000)
+    assert dg.rigid_check_acyclicity()
+
+def test_kor() -> None:
+    dg: Diszjunktiv_graf = lanc(6)
+    dg.muvelet[4].megelozok.append(Csatlakozas(dg.muvelet[1]))  # 2 <- 5 <- 4 <- 3 <- 2
+    kimenet: StringIO = StringIO()
+    with redirect_stdout(kimenet):
+        assert not dg.rigid_check_acyclicity()
+    kor: List[int] = [int(x) for x in kimenet.getvalue().split("circle: ")[1].split()[0].split(",")]
+    assert kor[0] == kor[-1] and sorted(kor[:-1]) == [2, 3, 4, 5]
+    for utodja, elodje in zip(kor, kor[1:]):               # along the predecessors
+        muv: Muveletcsucs = dg.muvelet[dg.muvkod[utodja - 1]]
+        assert elodje in [cs.szomszed.azonosito for cs in muv.megelozok]
+
+def elozok(muv: Muveletcsucs) -> Set[int]:
+    """
+    The identifiers of the operations preceding muv through technological arcs (a plain search).
+    """
+    latott: Set[int] = set()
+    verem: List[Muveletcsucs] = [muv]
+    while verem:
+        for cs in verem.pop().megelozok:
+            if cs.szomszed.azonosito > 0 and cs.szomszed.azonosito not in latott:
+                latott.add(cs.szomszed.azonosito)
+                verem.append(cs.szomszed)
+    return latott
+
+def test_technologiai_elerhetoseg() -> None:
+    for fn in INPUT_FILES:
+        dg_o = beolvasas(path.join(INPUTS_DIR, fn))
+        dg_o.megmaradt_fixalt_elek_eltavolitasa()
+        for masodik in dg_o.muvelet:
+            vart: Set[int] = elozok(masodik)
+            for elso in dg_o.muvelet:
+                assert dg_o.technologiailag_megelozi(elso, masodik) == (elso.azonosito in vart)
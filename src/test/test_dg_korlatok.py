@@ -0,0 +1,147 @@
+"""
+    This module is unit test.
+    It checks the lower-bound strategies of the korlatok module: no estimate may exceed
+    the critical path length of the recent order of the operations (it respects the fixed edges too).
+    It also checks the optional strategy list in the header of the input,
+    and the reuse of the estimates of the unchanged machines (see Korlat.gyorstar).
+
+Result:
+    It writes the number of the checked estimates to the TERMINAL/Command screen.
+    It stops with AssertionError at the first invalid estimate.
+"""
+
+import os
+import tempfile
+from os import path
+
+from typing import List, Tuple
+
+from dg_exceptions import InputValueError
+from korlatok import KORLATOK, Korlat, korlatok_letrehozasa
+from vezerles import Vezerles
+from test_dg_cpm_engines import beolvasas, INPUTS_DIR, INPUT_FILES
+
+def becslesek_ellenorzese(fn: str, lepesszam: int = 25) -> int:
+    """
+    It goes down in the solution tree along the first free edges, and compares the estimates
+    of all strategies with the critical path length at each step. It serves the number of the estimates.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    korlatok: List[Korlat] = korlatok_letrehozasa(",".join(KORLATOK))
+    becslesek: int = 0
+    for _ in range(lepesszam):
+        dg_o.kritikus_ut_odafele()
+        assert dg_o.nyelo
+        atfutasi_ido: float = dg_o.nyelo.forrastol1
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele()
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_visszafele()
+        for korlat in korlatok:
+            for _, also, _ in korlat.becslesek(dg_o):
+                assert also <= atfutasi_ido + 1.0e-9, f"{korlat}: {also} > {atfutasi_ido}"
+                becslesek += 1
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        dg_o.uj_megoldas_illesztese_megoldasfara()
+    return becslesek
+
+def test_korlatok_ervenyesek() -> None:
+    """
+    The strategies must give lower bounds.
+    """
+    for fn in INPUT_FILES:
+        assert becslesek_ellenorzese(path.join(INPUTS_DIR, fn)) > 0
+
+def gyorstar_ellenorzese(fn: str, lepesszam: int = 40) -> int:
+    """
+    It goes down (and sometimes back) in the solution tree, and compares the estimates served
+    partly from the gyorstar with the ones made again on every machine. It serves the number of the hits.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    tarolo: Korlat = KORLATOK["egy_gep"]()
+    for lepes in range(lepesszam):
+        dg_o.kritikus_ut_odafele()
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele()
+        dg_o.sorrendisegi_elek_nelkul_uthosszak_visszafele()
+        dg_o.valtozott_gepek_megjelolese()
+        assert list(tarolo.becslesek(dg_o)) == list(KORLATOK["egy_gep"]().becslesek(dg_o)), \
+            "The gyorstar serves a stale estimate."
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        if lepes % 5 == 4 and not dg_o.gyokerben_vagyok():
+            dg_o.visszalepes()
+        else:
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+    return tarolo.gyorstar_talalatok
+
+def test_gyorstar() -> None:
+    """
+    An estimate may be reused only while the heads and tails of its machine are unchanged.
+    """
+    assert sum(gyorstar_ellenorzese(path.join(INPUTS_DIR, fn)) for fn in INPUT_FILES) > 0
+
+def test_szuk_keresztmetszet_elore() -> None:
+    """
+    The machine with the least slack must come first, and the order must not change the decision.
+    """
+    dg_o: Vezerles = beolvasas(path.join(INPUTS_DIR, INPUT_FILES[1]))
+    dg_o.kritikus_ut_odafele()
+    dg_o.sorrendisegi_elek_nelkul_uthosszak_odafele()
+    dg_o.sorrendisegi_elek_nelkul_uthosszak_visszafele()
+    dg_o.valtozott_gepek_megjelolese()
+    tanulo: Korlat = KORLATOK["egy_gep"]()
+    becslesek: List[Tuple[int, float, float]] = list(tanulo.becslesek(dg_o))
+    assert [j for j, _, _ in becslesek] == [j for j in range(dg_o.gepszam) if dg_o.gep_muveletszama[j] >= 2]
+    alap: float = max(also for _, also, _ in becslesek)
+    for j, also, _ in becslesek:
+        tanulo.tanulas(j, also, alap, also > alap - 1.0e-10)
+    legszukebb: int = max(becslesek, key=lambda b: (b[1], -b[0]))[0]
+    assert tanulo.gepek_sorrendje(dg_o)[0] == legszukebb
+    assert next(iter(tanulo.becslesek(dg_o)))[0] == legszukebb
+    assert sum(tanulo.gepenkenti_vagasok) >= 1
+
+def test_csak_a_kivalasztott_korlatok() -> None:
+    """
+    kisk is made of the estimates of the selected strategies alone: the critical path length
+    without the sequential edges counts only if "utak" is selected.
+    """
+    dg_o: Vezerles = beolvasas(path.join(INPUTS_DIR, INPUT_FILES[1]))
+    dg_o.kritikus_ut_odafele()
+    dg_o.viszonyitasi_alap = 1.0e+300
+    dg_o.korlatok_beallitasa("utak")
+    dg_o.korlatozas(False)
+    assert dg_o.nyelo and dg_o.kisk == dg_o.nyelo.forrastol1
+    for nev in ("egy_gep", "jackson"):
+        dg_o.transzpozicios_tabla.uritese()
+        dg_o.korlatok_beallitasa(nev)
+        dg_o.korlatozas(False)
+        assert dg_o.kisk == max(also for _, also, _ in KORLATOK[nev]().becslesek(dg_o))
+        assert dg_o.korlatok[0].hivasok_szama == 1
+
+def test_korlatok_a_fejlecben() -> None:
+    """
+    The header of the input may list the strategies after the three usual values.
+    """
+    with open(path.join(INPUTS_DIR, INPUT_FILES[0]), "rt", encoding= 'utf-8') as f:
+        sorok: List[str] = f.readlines()
+    k: int = [i for i, sor in enumerate(sorok) if sor.startswith("[")][1]     # a műveletszám, gépszám után
+    sorok[k] = sorok[k].replace("]", ', "utak,jackson"]', 1)
+    with tempfile.TemporaryDirectory() as tmp:
+        fn: str = os.path.join(tmp, "dg_input_korlatok.txt")
+        with open(fn, "wt", encoding= 'utf-8') as f:
+            f.writelines(sorok)
+        dg_o: Vezerles = beolvasas(fn)
+    assert [korlat.nev for korlat in dg_o.korlatok] == ["utak", "jackson"]
+    assert dg_o.muveletszam == 17 and dg_o.nyelo and dg_o.nyelo.beerkezok > 0
+    try:
+        dg_o.korlatok_beallitasa("utak,nincs_ilyen")
+        assert False, "An unknown strategy must be refused."
+    except InputValueError:
+        pass
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {becslesek_ellenorzese(arg_str_fn)} estimates checked, all valid")
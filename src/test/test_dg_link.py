@@ -0,0 +1,149 @@
+"""
+    This module is unit test.
+    It compares the linked lists of dg_link (DgHead) with the former ones (ListDgHead):
+    the same random INTO, PRECEDE, FOLLOW, OUT, FIRST OUT and LAST OUT steps must give
+    the same order of elements and the same SUC and PRED chains.
+    The Solver must give the same results with either of them (see use_legacy_lists).
+    The engine classes must have no __dict__ when they declare __slots__ (see dg_link.SLOTS).
+
+Result:
+    It stops with AssertionError at the first difference.
+"""
+
+import random
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List, Tuple, cast
+
+import dg_link
+from dg_link import BaseDgHead, DgHead, DgLink, ListDgHead, dg_into, dg_out_last, use_legacy_lists
+from dg_standard_input import DgStandardInput
+from dg_main import InputTextFile
+from diszjunktiv_graf import Csatlakozas, Muveletcsucs
+from diszjunktiv_graf_manipulacioi import El
+from megoldasfa import Megoldascsucs
+from dg_high_level_pseudo_black_boxes import Solver
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+
+class Tag(DgLink):
+    def __init__(self, sorszam: int) -> None:
+        super().__init__()
+        self.sorszam: int = sorszam
+
+def lancok(fej: BaseDgHead) -> Tuple[List[int], List[int], List[int]]:
+    """
+    The elements of the head, and the ones found along SUC from the first, and along PRED from the last.
+    """
+    elemek: List[int] = [tag.sorszam for tag in fej]
+    elore: List[int] = []
+    tag = fej.first()
+    while tag is not None:
+        elore.append(cast(Tag, tag).sorszam)
+        tag = tag.suc
+    hatra: List[int] = []
+    tag = fej.last()
+    while tag is not None:
+        hatra.append(cast(Tag, tag).sorszam)
+        tag = tag.pred
+    return elemek, elore, hatra[::-1]
+
+def test_veletlen_lepesek() -> None:
+    veletlen: random.Random = random.Random(19)
+    uj: DgHead = DgHead()
+    regi: ListDgHead = ListDgHead([])
+    uj_tagok: List[Tag] = [Tag(k) for k in range(40)]
+    regi_tagok: List[Tag] = [Tag(k) for k in range(40)]
+    for _ in range(2000):
+        k: int = veletlen.randrange(40)
+        lepes: int = veletlen.randrange(6)
+        if uj_tagok[k].is_free():
+            if lepes < 2 or uj.empty():
+                uj_tagok[k].into(uj)
+                regi_tagok[k].into(regi)
+            else:
+                hely: int = veletlen.randrange(len(uj))
+                masik: int = uj[hely].sorszam
+                assert regi[hely].sorszam == masik
+                if lepes % 2 == 0:
+                    uj_tagok[k].precede(uj_tagok[masik])
+                    regi_tagok[k].precede(regi_tagok[masik])
+                else:
+                    uj_tagok[k].follow(uj_tagok[masik])
+                    regi_tagok[k].follow(regi_tagok[masik])
+        elif lepes < 3:
+            uj_tagok[k].out()
+            regi_tagok[k].out()
+        elif lepes < 5:
+            assert uj.out_first().sorszam == regi.out_first().sorszam     # type: ignore[union-attr]
+        else:
+            assert uj.out_last().sorszam == regi.out_last().sorszam       # type: ignore[union-attr]
+        elemek, elore, hatra = lancok(uj)
+        assert elemek == elore == hatra == lancok(regi)[0]
+        assert len(uj) == uj.cardinal() == len(regi)
+        assert all(tag.is_linked() == (tag.sorszam in elemek) for tag in uj_tagok)
+    uj.clear()
+    assert uj.empty() and uj.first() is None and all(tag.is_free() for tag in uj_tagok)
+
+def test_pythonlista() -> None:
+    """
+    dg_into and dg_out_last keep the SUC and PRED chain of a Python list.
+    """
+    for regi_modon in (False, True):
+        use_legacy_lists(regi_modon)
+        try:
+            l: List[Tag] = []
+            for k in range(5):
+                dg_into(l, Tag(k))
+            utolso = dg_out_last(l)
+            assert utolso is not None and utolso.is_free() and l[-1].suc is None
+            dg_into(l, Tag(5))
+            assert [tag.sorszam for tag in l] == [0, 1, 2, 3, 5]
+            assert all(a.suc is b and b.pred is a for a, b in zip(l, l[1:]))
+            assert l[0].pred is None and l[-1].suc is None
+        finally:
+            use_legacy_lists(False)
+
+def megoldas(fn: str) -> Tuple[Tuple, List[Tuple]]:
+    """
+    It solves the first Disjunctive Graph of the input file, and serves the critical path length,
+    the counters and the best order found.
+    """
+    itf: InputTextFile = InputTextFile(fn)
+    with open(fn, "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        solver: Solver = Solver(bemenet=DgStandardInput(itf))
+        assert solver.kovetkezo_graf() and solver.dg_o
+        atfutasi_ido: float = solver.megoldas()
+        itf.close_input()
+    dg_o = solver.dg_o
+    return ((atfutasi_ido, dg_o.kiertekelesek_szama, dg_o.megoldasok_szama, dg_o.visszalepesek_szama),
+            [(muv.azonosito, None if muv.opt_koveto is None else muv.opt_koveto.azonosito)
+             for muv in dg_o.muvelet])
+
+def test_regi_es_uj_listak() -> None:
+    """
+    The Solver must give the same results with the former lists as with the new ones.
+    """
+    fajlok: List[str] = [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES[:2]]
+    with redirect_stdout(StringIO()):
+        ujak: List[Tuple[Tuple, List[Tuple]]] = [megoldas(fn) for fn in fajlok]
+        use_legacy_lists(True)
+        try:
+            regiek: List[Tuple[Tuple, List[Tuple]]] = [megoldas(fn) for fn in fajlok]
+        finally:
+            use_legacy_lists(False)
+    assert not dg_link.LEGACY_LISTS
+    assert ujak == regiek
+
+def test_slots() -> None:
+    """
+    The engine classes keep their attributes in __slots__, unless DG_NO_SLOTS=1 switches them off.
+    A subclass without __slots__ (Tag) can still have attributes of its own.
+    """
+    muv: Muveletcsucs = Muveletcsucs()
+    for obj in (muv, Csatlakozas(muv), El(muv, muv), Megoldascsucs()):
+        assert hasattr(obj, "__dict__") != dg_link.SLOTS
+        assert obj.is_free()
+    assert Tag(7).sorszam == 7
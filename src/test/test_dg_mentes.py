@@ -0,0 +1,80 @@
+"""
+    This module is unit test.
+    It checks the checkpoints of dg_mentes: a search resumed from a checkpoint taken after
+    some iterations must end as the uninterrupted search does, with the same counters and incumbent.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first failure.
+"""
+
+import json
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List, Tuple
+
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_mentes import Aszinkron_mento, Mentes, folytatas, mentes_beolvasasa, mentes_osszeallitasa
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def eredmeny(solver: Solver) -> Tuple[float, int, int, int, List[int]]:
+    """
+    The critical path length, the counters and the incumbent order of the finished search.
+    """
+    dg_o = solver.dg_o
+    assert dg_o
+    return (round(dg_o.aktualis_opt_atfutasi_ido, 6), dg_o.kiertekelesek_szama, dg_o.megoldasok_szama,
+            dg_o.visszalepesek_szama,
+            [0 if muv.opt_koveto is None else muv.opt_koveto.azonosito for muv in dg_o.muvelet])
+
+def folytatott_kereses(fn: str, iteracio: int) -> Tuple[float, bool]:
+    """
+    It searches the first Disjunctive Graph of the input file with a checkpoint after its iteration-th iteration,
+    then resumes a new search from the checkpoint. It serves the critical path length,
+    and whether the resumed search ended as the uninterrupted one.
+    """
+    mentesek: List[Mentes] = []
+    def mento(solver: Solver, i: int, vegso: bool) -> None:
+        if i == iteracio and not vegso:
+            mentesek.append(json.loads(json.dumps(mentes_osszeallitasa(solver, fn, 0, i))))
+    solver: Solver = beolvasott_solver(fn)
+    solver.mentes = mento
+    with redirect_stdout(StringIO()):
+        solver.iteraciok()
+    teljes = eredmeny(solver)
+    assert len(mentesek) == 1
+    folytatott: Solver = beolvasott_solver(fn)
+    with redirect_stdout(StringIO()):
+        folytatott.iteraciok_folytatasa(folytatas(folytatott, mentesek[0]))
+    return teljes[0], eredmeny(folytatott) == teljes
+
+def test_folytatas() -> None:
+    """
+    The resumed search ends as the uninterrupted one.
+    """
+    for fn in INPUT_FILES[:2]:
+        _, egyezik = folytatott_kereses(path.join(INPUTS_DIR, fn), 5)
+        assert egyezik
+
+def test_aszinkron_mento(tmp_path) -> None:
+    """
+    The background writer leaves the final checkpoint in the file.
+    """
+    fn: str = path.join(INPUTS_DIR, INPUT_FILES[0])
+    fajlnev: str = str(tmp_path / "mentes.json")
+    solver: Solver = beolvasott_solver(fn)
+    mento: Aszinkron_mento = Aszinkron_mento(fajlnev, fn, 0, 3600.0)
+    solver.mentes = mento
+    with redirect_stdout(StringIO()):
+        solver.iteraciok()
+    assert mento.irasok_szama == 1 and not mento.iro.is_alive()
+    mentes: Mentes = mentes_beolvasasa(fajlnev)
+    assert solver.dg_o and mentes["legjobb"] == solver.dg_o.aktualis_opt_atfutasi_ido
+    assert mentes["szamlalok"]["kiertekelesek_szama"] == solver.dg_o.kiertekelesek_szama
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES[:2]]:
+        print(f"{arg_str_fn}: {folytatott_kereses(arg_str_fn, 5)}")
@@ -0,0 +1,121 @@
+"""
+    This module is unit test.
+    It compares the parallel search of dg_parallel_search with the sequential one (see Solver.iteraciok):
+    sharing a better incumbent can only prune more, so the parallel result must not be worse,
+    neither in the static pool nor with work stealing.
+    It also checks that handing over the oldest unexplored siblings (see legregebbi_testverek_atadasa)
+    loses no node of the subtree.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first worse result.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from multiprocessing import Value
+from typing import List, Tuple
+
+from dg_standard_input import DgStandardInput
+from dg_main import InputTextFile
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_parallel_search import (Reszfeladat, graf_beolvasasa_fajlbol, kezdeti_sorrend_mentese,
+                                 kezdeti_sorrend_visszaallitasa, legregebbi_testverek_atadasa, munkas_solver,
+                                 parhuzamos_iteraciok, reszfa_bejarasa, reszfeladat_elokeszitese,
+                                 reszfeladatok_felsorolasa)
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+
+def beolvasott_solver(fn: str) -> Solver:
+    """
+    It reads the first Disjunctive Graph of the input file by an own Solver.
+    """
+    itf: InputTextFile = InputTextFile(fn)
+    with open(fn, "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        solver: Solver = Solver(bemenet=DgStandardInput(itf))
+        assert graf_beolvasasa_fajlbol(solver, 0)
+        itf.close_input()
+    return solver
+
+def kereses(fn: str, folyamatok: int, munkalopas: bool = True) -> float:
+    """
+    It searches the first Disjunctive Graph of the input file sequentially (folyamatok == 1)
+    or in parallel, and serves the best critical path length found.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    assert solver.dg_o
+    with redirect_stdout(StringIO()):
+        if folyamatok == 1:
+            solver.iteraciok()
+        else:
+            parhuzamos_iteraciok(solver, fn, 0, folyamatok, 2, munkalopas)
+    return solver.dg_o.aktualis_opt_atfutasi_ido
+
+def osszevetes(fn: str) -> Tuple[float, float, float]:
+    """
+    It serves the sequential, the static parallel and the work stealing results.
+    """
+    return kereses(fn, 1), kereses(fn, 2, False), kereses(fn, 2)
+
+def bejaras(fn: str, atadasi_gyakorisag: int, legjobb: float) -> Tuple[int, int, int]:
+    """
+    It searches the first subtree of the level 3 in one worker against a fixed incumbent (legjobb).
+    In every atadasi_gyakorisag-th iteration (0: never) it hands over the oldest unexplored siblings,
+    and searches them later itself. It serves the number of the evaluations, the solutions and the handovers.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    assert solver.dg_o
+    with redirect_stdout(StringIO()):
+        elek: List[Tuple[int, int, bool]] = reszfeladatok_felsorolasa(solver, 3)[0]
+        munkas: Solver = munkas_solver({"fajlnev": fn, "graf_sorszam": 0,     # type: ignore[typeddict-item]
+                                        "korlatok": "utak,egy_gep", "kezdeti_sorrend": "farok",
+                                        "kezdesi_ido": solver.dg_o.kezdesi_ido, "keret": (0, 0, 0, 0.0)})
+        assert munkas.dg_o
+        kezdeti_sorrend = kezdeti_sorrend_mentese(munkas.dg_o)
+        sor: List[Reszfeladat] = [{"fajlnev": fn, "graf_sorszam": 0, "korlatok": "utak,egy_gep",
+                                   "kezdeti_sorrend": "farok", "kezdesi_ido": solver.dg_o.kezdesi_ido,
+                                   "keret": (0, 0, 0, 0.0),
+                                   "maximalis_melysegszint": solver.dg_o.maximalis_melysegszint,
+                                   "melyseg": 3, "elek": elek, "szabad_elek": []}]
+        atadasok: int = 0
+        lepes: int = 0
+        while sor:
+            feladat: Reszfeladat = sor.pop(0)
+            def atadas() -> None:                   # pylint: disable=cell-var-from-loop
+                nonlocal lepes, atadasok
+                lepes += 1
+                if atadasi_gyakorisag and lepes % atadasi_gyakorisag == 0:
+                    testverek: Reszfeladat | None = legregebbi_testverek_atadasa(munkas, feladat)
+                    if testverek is not None:
+                        sor.append(testverek)
+                        atadasok += 1
+            reszfeladat_elokeszitese(munkas, feladat)
+            reszfa_bejarasa(munkas, feladat, Value('d', legjobb), atadas)
+            kezdeti_sorrend_visszaallitasa(munkas.dg_o, kezdeti_sorrend)
+    return munkas.dg_o.kiertekelesek_szama, munkas.dg_o.megoldasok_szama, atadasok
+
+def test_parhuzamos_kereses() -> None:
+    """
+    The parallel search must find at least as good an order as the sequential one.
+    """
+    for fn in INPUT_FILES[:2]:
+        egymas_utan, statikusan, munkalopassal = osszevetes(path.join(INPUTS_DIR, fn))
+        assert statikusan <= egymas_utan + 1.0e-9
+        assert munkalopassal <= egymas_utan + 1.0e-9
+
+def test_testverek_atadasa() -> None:
+    """
+    The siblings handed over must be searched as if they had stayed in the subtree:
+    against the same incumbent the same number of solutions must be evaluated.
+    """
+    fn: str = path.join(INPUTS_DIR, INPUT_FILES[2])
+    kiertekelesek, megoldasok, _ = bejaras(fn, 0, 880.47)
+    kiertekelesek_atadassal, megoldasok_atadassal, atadasok = bejaras(fn, 7, 880.47)
+    assert atadasok > 0
+    assert (kiertekelesek_atadassal, megoldasok_atadassal) == (kiertekelesek, megoldasok)
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: sequential, static, work stealing: {osszevetes(arg_str_fn)}")
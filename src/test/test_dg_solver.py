@@ -0,0 +1,53 @@
+"""
+    This module is unit test.
+    It checks the reentrant Solver of dg_high_level_pseudo_black_boxes: solvers with their own
+    input streams must give the same results side by side (in threads) as one after the other.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first difference.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List
+
+from dg_standard_input import DgStandardInput
+from dg_main import InputTextFile
+from dg_high_level_pseudo_black_boxes import Solver
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+
+def megoldasok(fn: str) -> List[float]:
+    """
+    It solves all Disjunctive Graphs of the input file by an own Solver,
+    and serves their best critical path lengths.
+    """
+    itf: InputTextFile = InputTextFile(fn)
+    eredmenyek: List[float] = []
+    with open(fn, "rt", encoding= 'utf-8') as f:
+        itf.f = f
+        solver: Solver = Solver(bemenet=DgStandardInput(itf))
+        while solver.kovetkezo_graf():
+            assert solver.dg_o
+            eredmenyek.append(solver.megoldas())
+        itf.close_input()
+    return eredmenyek
+
+def test_solverek_egymas_mellett() -> None:
+    """
+    Solvers must not share state: neither through my_control_dict nor through the global input.
+    """
+    fajlok: List[str] = [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES[:2]]
+    with redirect_stdout(StringIO()):
+        egymas_utan: List[List[float]] = [megoldasok(fn) for fn in fajlok]
+        with ThreadPoolExecutor(max_workers= len(fajlok)) as vegrehajto:
+            egymas_mellett: List[List[float]] = list(vegrehajto.map(megoldasok, fajlok))
+    assert egymas_utan == egymas_mellett
+    assert all(eredmenyek and min(eredmenyek) > 0.0 for eredmenyek in egymas_utan)
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {megoldasok(arg_str_fn)}")
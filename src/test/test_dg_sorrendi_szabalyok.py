@@ -0,0 +1,68 @@
+"""
+    This module is unit test.
+    It checks the dispatch rules of sorrendi_szabalyok: every rule must build a complete,
+    acyclic beginning order, the rule of the origin program must give its former result,
+    and the portfolio (see dg_portfolio) must take the best rule, in processes as well.
+
+Result:
+    It writes the critical path lengths of the rules to the TERMINAL/Command screen.
+    It stops with AssertionError at the first failure.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import Dict, List
+
+from dg_high_level_pseudo_black_boxes import Solver
+from dg_portfolio import Szabaly_eredmenye, portfolio_kezdeti_sorrend, szabaly_kiertekelese
+from sorrendi_szabalyok import PORTFOLIO, szabalyok_felsorolasa
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def szabalyok_kiertekelese(fn: str) -> Dict[str, float]:
+    """
+    It serves the critical path lengths of the beginning orders of the rules of PORTFOLIO
+    on the first Disjunctive Graph of the input file.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    dg_o = solver.dg_o
+    assert dg_o
+    eredmenyek: Dict[str, float] = {}
+    for szabaly in szabalyok_felsorolasa(PORTFOLIO):
+        eredmenyek[szabaly] = szabaly_kiertekelese(dg_o, szabaly)["atfutasi_ido"]
+        gepenkent: int = 0
+        for muv in dg_o.muvelet:
+            assert muv.gepen_koveto is None or muv.gepen_koveto.gepen_elozo is muv
+            if muv.gepen_elozo is None:
+                gepenkent += 1
+        assert gepenkent == dg_o.gepszam    # gépenként egy lánc
+        assert dg_o.cpm_veget_ert()         # körmentes: a nyelőig minden művelet sorra került
+    return eredmenyek
+
+def test_szabalyok() -> None:
+    """
+    The beginning order of the origin program on the 100-operation sample is 902.32 long.
+    """
+    for fn in INPUT_FILES:
+        eredmenyek: Dict[str, float] = szabalyok_kiertekelese(path.join(INPUTS_DIR, fn))
+        assert all(ertek > 0.0 for ertek in eredmenyek.values())
+        if fn == INPUT_FILES[2]:
+            assert abs(eredmenyek["farok"] - 902.32) < 0.005
+
+def test_portfolio() -> None:
+    fn: str = path.join(INPUTS_DIR, INPUT_FILES[1])
+    szabalyok: List[str] = szabalyok_felsorolasa(PORTFOLIO)
+    for folyamatok in (1, 2):
+        solver: Solver = beolvasott_solver(fn)
+        assert solver.dg_o and solver.dg_o.nyelo
+        with redirect_stdout(StringIO()):
+            eredmenyek: List[Szabaly_eredmenye] = portfolio_kezdeti_sorrend(solver.dg_o, fn, 0, szabalyok, folyamatok)
+        assert [eredmeny["szabaly"] for eredmeny in eredmenyek] == szabalyok
+        solver.dg_o.kritikus_ut_odafele()
+        assert abs(solver.dg_o.nyelo.forrastol1 - min(eredmeny["atfutasi_ido"] for eredmeny in eredmenyek)) < 1.0e-10
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {szabalyok_kiertekelese(arg_str_fn)}")
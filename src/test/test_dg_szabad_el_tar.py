@@ -0,0 +1,60 @@
+"""
+    This module is unit test.
+    It checks the compact store of the free edges (see szabad_el_tar): the order of the edges
+    must be the one of the origin LIST of El objects, and the first edge must be made only once.
+
+Result:
+    It stops with AssertionError at the first failure.
+"""
+
+import random
+from typing import List, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+from szabad_el_tar import Szabad_el_tar
+
+def muveletek(db: int) -> List[Muveletcsucs]:
+    muvelet: List[Muveletcsucs] = [Muveletcsucs() for _ in range(db)]
+    for k, muv in enumerate(muvelet):
+        muv.belso_index = k
+        muv.azonosito = k + 1
+    return muvelet
+
+def test_sorrend() -> None:
+    """
+    An edge goes before the first one whose delta is not smaller; the taken ones are left out.
+    """
+    muvelet: List[Muveletcsucs] = muveletek(8)
+    tar: Szabad_el_tar = Szabad_el_tar()
+    for k, delta in enumerate([3.0, 1.0, 3.0, 2.0, 1.0]):
+        tar.berakas(muvelet[k], muvelet[k + 1], delta)
+    assert tar.leirasa(muvelet) == [(5, 6, 1.0), (2, 3, 1.0), (4, 5, 2.0), (3, 4, 3.0), (1, 2, 3.0)]
+    elso = tar.elso(muvelet)
+    assert tar.elso(muvelet) is elso and elso.kezdet is muvelet[4] and elso.delta == 1.0
+    assert tar.elso_kivetele(muvelet) is elso and len(tar) == 4
+    tar.berakas(muvelet[6], muvelet[7], 0.5)
+    assert tar.elso(muvelet).kezdet is muvelet[6]
+    assert [el.delta for el in tar.elek(muvelet)] == [0.5, 1.0, 2.0, 3.0, 3.0]
+    while tar:
+        tar.elso_kivetele(muvelet)
+    assert len(tar.deltak) == 0 and tar.elso_helye == 0
+
+def test_egyenlo_deltak() -> None:
+    """
+    The bisection must give the order of the linear search of the origin program, even with many equal deltas.
+    """
+    veletlen: random.Random = random.Random(20)
+    muvelet: List[Muveletcsucs] = muveletek(60)
+    tar: Szabad_el_tar = Szabad_el_tar()
+    lista: List[Tuple[int, int, float]] = []
+    for k in range(59):
+        delta: float = float(veletlen.randrange(6))
+        hely: int = 0
+        while hely < len(lista) and lista[hely][2] < delta:
+            hely += 1
+        lista.insert(hely, (k + 1, k + 2, delta))
+        tar.berakas(muvelet[k], muvelet[k + 1], delta)
+        if k % 7 == 6:
+            tar.elso_kivetele(muvelet)
+            del lista[0]
+    assert tar.leirasa(muvelet) == lista
@@ -0,0 +1,59 @@
+"""
+    This module is unit test.
+    It checks the tabu search of tabu_kereses run before the search of the solution tree:
+    its best order must not be worse than the beginning order, its critical path must be the one
+    reported, and the graph must be left on the beginning order.
+
+Result:
+    It writes the critical path lengths found to the TERMINAL/Command screen.
+    It stops with AssertionError at the first failure.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+
+from typing import List, Tuple
+
+from diszjunktiv_graf import Muveletcsucs
+from dg_high_level_pseudo_black_boxes import Solver
+from tabu_kereses import Tabu_kereses
+from test_dg_cpm_engines import INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def tabu_kereses(fn: str) -> Tuple[float, float]:
+    """
+    It runs the tabu search on the beginning order of the first Disjunctive Graph of the input file,
+    and serves the critical path lengths of the beginning and of the best order.
+    """
+    solver: Solver = beolvasott_solver(fn)
+    dg_o = solver.dg_o
+    assert dg_o and dg_o.nyelo
+    with redirect_stdout(StringIO()):
+        dg_o.gyokeret_megoldasfaba()
+        dg_o.kiertekeles()
+    kezdeti: float = dg_o.aktualis_opt_atfutasi_ido
+    sorrend: List[Tuple[Muveletcsucs | None, Muveletcsucs | None]] = [
+        (muv.gepen_elozo, muv.gepen_koveto) for muv in dg_o.muvelet]
+    kulcs: int = dg_o.hasitas.sorrend
+    kereses: Tabu_kereses = Tabu_kereses(dg_o, 5.0)
+    kereses.kereses()
+    assert [(muv.gepen_elozo, muv.gepen_koveto) for muv in dg_o.muvelet] == sorrend
+    assert dg_o.hasitas.sorrend == kulcs
+    assert abs(dg_o.aktualis_opt_atfutasi_ido - min(kezdeti, kereses.legjobb)) < 1.0e-10
+    dg_o.aktualis_optimalis_sorrend_visszaallitas()
+    dg_o.kritikus_ut_odafele()
+    assert abs(dg_o.nyelo.forrastol1 - dg_o.aktualis_opt_atfutasi_ido) < 1.0e-10
+    return kezdeti, kereses.legjobb
+
+def test_tabu_kereses() -> None:
+    """
+    The best order of the tabu search is not worse than the beginning one, nor than the optimum.
+    """
+    for fn, optimum in zip(INPUT_FILES, [16.0, 213.32, 880.46]):
+        kezdeti, legjobb = tabu_kereses(path.join(INPUTS_DIR, fn))
+        assert optimum - 0.005 < legjobb <= kezdeti
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {tabu_kereses(arg_str_fn)}")
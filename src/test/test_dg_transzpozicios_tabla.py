@@ -0,0 +1,138 @@
+"""
+    This module is unit test.
+    It checks the transposition table of the solution tree (see transzpozicios_tabla):
+    the Zobrist hash and the fixed edges updated step by step must equal the ones computed from scratch,
+    a state reached again must be pruned by the lower bound recorded for it,
+    a bound must serve only the states whose fixed edges include the ones it was proven with,
+    and the table must keep its size limit.
+
+Result:
+    It writes the number of the checked steps to the TERMINAL/Command screen.
+    It stops with AssertionError at the first difference.
+"""
+
+from contextlib import redirect_stdout
+from io import StringIO
+from os import path
+from typing import List
+
+from dg_high_level_pseudo_black_boxes import Solver
+from diszjunktiv_graf import Muveletcsucs
+from transzpozicios_tabla import Transzpozicios_tabla, Zobrist_hasitas
+from vezerles import Vezerles
+from test_dg_cpm_engines import beolvasas, INPUTS_DIR, INPUT_FILES
+from test_dg_parallel_search import beolvasott_solver
+
+def hasitas_ellenorzese(fn: str, lepesszam: int = 40) -> int:
+    """
+    It goes down (and sometimes back) in the solution tree, and compares the incremental hash
+    and fixed edges with the ones computed from scratch at each step. It serves the number of the steps.
+    """
+    dg_o: Vezerles = beolvasas(fn)
+    dg_o.gyokeret_megoldasfaba()
+    ujra: Zobrist_hasitas = Zobrist_hasitas(dg_o.muveletszam)
+    kulcsok: set = set()
+    lepes: int = 0
+    for lepes in range(lepesszam):
+        ujra.ujraszamolas(dg_o.muvelet, dg_o.fixalt_elek)
+        assert dg_o.hasitas.sorrend == ujra.sorrend, "The incremental hash differs."
+        assert (dg_o.hasitas.fixalt_elek, dg_o.hasitas.fixalt_lanc, dg_o.hasitas.fixalt_szam) == \
+               (ujra.fixalt_elek, ujra.fixalt_lanc, ujra.fixalt_szam), "The incremental fixed edges differ."
+        kulcsok.add((dg_o.hasitas.sorrend, frozenset(dg_o.hasitas.fixalt_elek)))
+        dg_o.kritikus_ut_odafele()
+        if not dg_o.van_szabad_el():
+            dg_o.szabad_elek_valasztasi_sorrendjukben_valo_felsorolasa()
+        if not dg_o.van_szabad_el():
+            break
+        if lepes % 5 == 4 and not dg_o.gyokerben_vagyok():
+            dg_o.visszalepes()
+        else:
+            dg_o.uj_megoldas_illesztese_megoldasfara()
+    assert len(kulcsok) == lepes + 1, "Different states must have different keys."
+    return lepes
+
+def test_hasitas() -> None:
+    """
+    The incremental hash must follow the swaps, and the fixed edges must be followed as well.
+    """
+    for fn in INPUT_FILES:
+        assert hasitas_ellenorzese(path.join(INPUTS_DIR, fn)) > 0
+
+def test_ismetelt_allapot() -> None:
+    """
+    A state bounded once must be pruned from the table when its bound reaches viszonyitasi_alap.
+    """
+    dg_o: Vezerles = beolvasas(path.join(INPUTS_DIR, INPUT_FILES[1]))
+    dg_o.gyokeret_megoldasfaba()
+    dg_o.viszonyitasi_alap = 1.0e+300
+    assert not dg_o.korlatozas(False)
+    also: float = dg_o.kisk
+    dg_o.viszonyitasi_alap = also
+    hivasok: int = dg_o.korlatok[0].hivasok_szama
+    assert dg_o.korlatozas(False) and dg_o.kisk == also
+    assert dg_o.korlatok[0].hivasok_szama == hivasok, "The repeated state must not be estimated again."
+    assert dg_o.transzpozicios_tabla.talalatok == 1
+
+def test_meretkorlat() -> None:
+    """
+    The least recently used order must be dropped from a full table.
+    """
+    tabla: Transzpozicios_tabla = Transzpozicios_tabla(2)
+    nincs: Zobrist_hasitas = Zobrist_hasitas(0)
+    tabla.rogzites(1, nincs, 10.0)
+    tabla.rogzites(2, nincs, 20.0)
+    assert tabla.kereses(1, nincs) == 10.0
+    tabla.rogzites(3, nincs, 30.0)
+    assert tabla.kereses(2, nincs) is None and tabla.kereses(3, nincs) == 30.0 and tabla.kereses(1, nincs) == 10.0
+    assert len(tabla) == 2 and tabla.kiszoritasok == 1
+    assert (tabla.talalatok, tabla.hianyok) == (3, 1)
+    tabla.rogzites(1, nincs, 5.0)
+    assert tabla.kereses(1, nincs) == 10.0, "The greater proven bound must be kept."
+
+def test_fixalt_elek_tartalmazasa() -> None:
+    """
+    A bound proven with some fixed edges must serve the same order with more fixed edges only.
+    """
+    muv: List[Muveletcsucs] = beolvasas(path.join(INPUTS_DIR, INPUT_FILES[0])).muvelet
+    allapot: Zobrist_hasitas = Zobrist_hasitas(len(muv))
+    tabla: Transzpozicios_tabla = Transzpozicios_tabla()
+    allapot.el_fixalasa(muv[0], muv[1])
+    tabla.rogzites(1, allapot, 10.0)
+    allapot.el_fixalasa(muv[2], muv[3])
+    tabla.rogzites(1, allapot, 15.0)
+    assert tabla.kereses(1, allapot) == 15.0
+    allapot.el_eltavolitasa(muv[2], muv[3])
+    allapot.el_eltavolitasa(muv[0], muv[1])
+    assert tabla.kereses(1, allapot) is None
+    allapot.el_fixalasa(muv[2], muv[3])
+    assert tabla.kereses(1, allapot) is None
+    allapot.el_fixalasa(muv[0], muv[1])
+    allapot.el_fixalasa(muv[4], muv[5])
+    assert tabla.kereses(1, allapot) == 15.0, "The fixed edges must count in any order."
+    allapot.el_eltavolitasa(muv[4], muv[5])
+    allapot.el_eltavolitasa(muv[0], muv[1])
+    allapot.el_eltavolitasa(muv[2], muv[3])
+    allapot.el_fixalasa(muv[0], muv[1])
+    allapot.el_fixalasa(muv[4], muv[5])
+    assert tabla.kereses(1, allapot) == 10.0
+    allapot.el_eltavolitasa(muv[4], muv[5])
+    allapot.el_eltavolitasa(muv[0], muv[1])
+    tabla.rogzites(1, allapot, 20.0)
+    assert [(lanc, szam, also) for lanc, szam, also in tabla.tarolt[1]] == [(None, 0, 20.0)], \
+        "The dominated entries must be dropped."
+
+def test_melysegi_kereses_talalatai() -> None:
+    """
+    The depth-first search must find the orders again after the backtracks (their flipped edge
+    is fixed as "normal" then), although the fixed edges differ.
+    """
+    solver: Solver = beolvasott_solver(path.join(INPUTS_DIR, INPUT_FILES[2]))
+    assert solver.dg_o
+    solver.dg_o.futasi_keret.hatarok_beallitasa((300, 0, 0, 0.0))
+    with redirect_stdout(StringIO()):
+        solver.iteraciok()
+    assert solver.dg_o.transzpozicios_tabla.talalatok > 0
+
+if __name__ == '__main__':
+    for arg_str_fn in [path.join(INPUTS_DIR, fn) for fn in INPUT_FILES]:
+        print(f"{arg_str_fn}: {hasitas_ellenorzese(arg_str_fn)} steps checked, the keys agree")